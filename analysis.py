@@ -0,0 +1,151 @@
+import queue
+import threading
+import traceback
+
+from parser import IncrementalParser, ParserError, ParseCancelled, parse_with_recovery
+from tracing import LatencyTracer
+from cache import content_key, ast_weight
+
+# Önbellekten yanıtlanan bir analizden sonra sembol dizinini yetiştirmek için beklenen boşta kalma süresi (s)
+SYMBOLS_IDLE_SECONDS = 0.3
+
+class AnalysisResult:
+    def __init__(self, generation, ast=None, errors=()):
+        self.generation = generation
+        self.ast = ast # Hata varsa kurtarma kipinde elde edilen kısmi AST
+        self.errors = list(errors) # Belgedeki tüm ParserError'lar, konum sırasıyla
+        self.error = self.errors[0] if self.errors else None # Sözdizimi geçerliyse None, değilse ilk hata
+
+class AnalysisWorker:
+    """
+    Belge anlık görüntülerini arka plandaki tek bir iş parçacığında ayrıştırır.
+    Her zaman yalnızca en son gönderilen iş tutulur; yeni bir iş gelince çalışan
+    ayrıştırma iptal edilir ve eski sonuçlar kuyruğa hiç yazılmaz.
+    """
+    def __init__(self, tracer=None, cache=None, symbols=None):
+        self.results = queue.Queue()
+        self.tracer = tracer or LatencyTracer() # Ayrıştırma süresi 'parse' aşaması olarak ölçülür
+        # Verilirse (AnalysisCache) daha önce ayrıştırılmış içerik (ör. geri alma sonrası) yeniden ayrıştırılmaz
+        self.cache = cache
+        # Verilirse (SymbolIndex) her ayrıştırmadan sonra güncellenir: sözdizimi geçerliyse yalnızca değişen
+        # ifadeler için, hatalıysa belgenin token'larından
+        self.symbols = symbols
+        self.generation = 0
+        self._condition = threading.Condition()
+        self._pending = None
+        self._catch_up = None # Önbellekten yanıtlanmış, sembol dizini henüz güncellenmemiş (kuşak, lex durumu)
+        self._cancel_event = threading.Event()
+        self._stopped = False
+        # Yalnızca arka plan iş parçacığında kullanılır; değişmeyen ifadeleri önceki ayrıştırmadan alır
+        self._parser = IncrementalParser()
+        self._thread = threading.Thread(target=self._run, name="analysis-worker", daemon=True)
+        self._thread.start()
+
+    def submit(self, lex_state):
+        # lex_state, Tk iş parçacığının sonradan değiştirmeyeceği bir LexerState kopyası olmalıdır
+        with self._condition:
+            self.generation += 1
+            self._pending = (self.generation, lex_state)
+            self._cancel_event.set() # Çalışmakta olan eski ayrıştırmayı durdur
+            self._condition.notify()
+            return self.generation
+
+    def stop(self):
+        with self._condition:
+            self._stopped = True
+            self._cancel_event.set()
+            self._condition.notify()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                # Yazım sürerken yetiştirme ayrıştırması yapılmaz; yeni bir iş onu gereksiz kılar
+                if self._pending is None and self._catch_up is not None and not self._stopped:
+                    self._condition.wait(SYMBOLS_IDLE_SECONDS)
+                while self._pending is None and self._catch_up is None and not self._stopped:
+                    self._condition.wait()
+                if self._stopped:
+                    return
+                catch_up = self._pending is None
+                generation, lex_state = self._catch_up if catch_up else self._pending
+                self._pending = None
+                self._catch_up = None
+                self._cancel_event = cancel_event = threading.Event()
+
+            # Tek bir işteki beklenmeyen hata iş parçacığını sonlandırmaz; hata yazılır ve sonraki işlere geçilir
+            try:
+                if catch_up:
+                    self._parse_for_symbols(generation, lex_state, cancel_event)
+                    continue
+                result = self._analyze(generation, lex_state, cancel_event)
+            except Exception:
+                traceback.print_exc()
+                # Yarıda kalmış ayrıştırmanın durumu kullanılmaz; sonraki iş baştan ayrıştırılır
+                self._parser = IncrementalParser()
+                continue
+            if result is not None and generation == self.generation:
+                self.results.put(result)
+
+    def _analyze(self, generation, lex_state, cancel_event):
+        # Satır tablosundaki token'lar tembel olarak oluşturulur; yalnızca düzenlenen ifadeler yeniden ayrıştırılır
+        if cancel_event.is_set():
+            return None
+        key = None
+        cached = None
+        if self.cache is not None:
+            key = content_key('ast', lex_state.code, lex_state.grammar)
+            cached = self.cache.get(key)
+            if cached is not None:
+                result = AnalysisResult(generation, ast=cached[0], errors=cached[1])
+                if self.symbols is not None and result.error is not None:
+                    # Hatalı belgenin dizini ayrıştırma gerektirmez
+                    with self.tracer.span('symbols'):
+                        self.symbols.update_unparsed(lex_state, generation)
+                elif self.symbols is not None:
+                    # Sembol dizini ifade aralıklarına ihtiyaç duyar; ayrıştırma boşta kalınca yapılır
+                    with self._condition:
+                        if self._pending is None:
+                            self._catch_up = (generation, lex_state)
+                return result
+        try:
+            with self.tracer.span('parse'):
+                ast = self._parser.parse_state(lex_state, cancel_event)
+                if self._parser.current_token is not None:
+                    # Üst düzeyde eşi olmayan '}': artımlı ayrıştırma orada durdu, belgenin kalanı denetlenmedi
+                    raise ParserError("Eşi olmayan '}' bulundu.", self._parser.current_token)
+            result = AnalysisResult(generation, ast=ast)
+        except ParseCancelled:
+            return None
+        except ParserError:
+            # Artımlı ayrıştırıcı ilk hatada durur; tüm hatalar için belge bir kez kurtarma kipinde ayrıştırılır
+            try:
+                with self.tracer.span('parse'):
+                    ast, errors = parse_with_recovery(lex_state.tokens(), cancel_event)
+            except ParseCancelled:
+                return None
+            result = AnalysisResult(generation, ast=ast, errors=errors)
+        if self.symbols is not None:
+            with self.tracer.span('symbols'):
+                if result.error is None:
+                    self.symbols.update(self._parser, generation)
+                else:
+                    self.symbols.update_unparsed(lex_state, generation)
+        if key is not None:
+            self.cache.put(key, (result.ast, result.errors), ast_weight((result.ast, result.errors)))
+        return result
+
+    def _parse_for_symbols(self, generation, lex_state, cancel_event):
+        # Yalnızca sembol dizini için; sonuç zaten önbellekten bildirildi
+        try:
+            with self.tracer.span('parse'):
+                self._parser.parse_state(lex_state, cancel_event)
+            parsed = self._parser.current_token is None # Eşi olmayan '}' belgenin kalanını bırakır
+        except ParseCancelled:
+            return
+        except ParserError:
+            parsed = False
+        with self.tracer.span('symbols'):
+            if parsed:
+                self.symbols.update(self._parser, generation)
+            else:
+                self.symbols.update_unparsed(lex_state, generation)
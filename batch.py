@@ -0,0 +1,220 @@
+import argparse
+import html
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from lexer import Lexer, DEFAULT_GRAMMAR
+from grammar import GrammarError, load_grammar, token_colors
+from parser import parse_with_recovery
+from cache import AnalysisCache
+
+# Dizinler taranırken lexlenecek dosya uzantıları (düzenleyici kaynakları düz metin olarak kaydeder)
+DEFAULT_EXTENSIONS = ('.txt',)
+# Dizin taramasında atlanan klasörler
+SKIPPED_DIRECTORIES = {'__pycache__'}
+# Her işçiye tek seferde gönderilen dosya sayısı; küçük dosyalarda süreçler arası iletişimi azaltır
+DEFAULT_CHUNK_SIZE = 16
+
+OUTPUT_FORMATS = ('json', 'ansi', 'html')
+
+# grammar.TOKEN_COLORS renklerinin terminal karşılıkları (IDENTIFIER varsayılan renkte bırakılır)
+ANSI_CODES = {
+    'IDENTIFIER': None,
+    'KEYWORD': '34',
+    'OPERATOR': '31',
+    'NUMBER': '35',
+    'COMMENT': '3;32',
+    'MULTI_LINE_COMMENT': '3;32',
+    'UNKNOWN': '90;43',
+    'FLOAT': '33',
+    'STRING': '33;2',
+}
+# Başka gramerlerin tanımladığı tipler için grammar.EXTRA_COLORS'a karşılık gelen palet
+EXTRA_ANSI_CODES = ('36', '33;1', '35;1', '34;1', '36;1', '32;1', '94', '96')
+ANSI_RESET = '\x1b[0m'
+
+# Her işçi süreci birleşik deseni yalnızca bir kez derler
+_lexer = None
+# --cache-dir verildiyse işçinin disk destekli önbelleği (süreçler aynı dizini paylaşır)
+_cache = None
+
+def _init_worker(cache_dir=None, grammar_path=None):
+    global _lexer, _cache
+    # Tanım her süreçte yüklenir; derlenmiş tablolar tanım dosyasının yanından okunur
+    _lexer = Lexer(engine='regex', grammar=load_grammar(grammar_path) if grammar_path else None)
+    _cache = AnalysisCache(_lexer, directory=cache_dir) if cache_dir else None
+
+def collect_files(paths, extensions=DEFAULT_EXTENSIONS):
+    # Verilen dosyaları olduğu gibi, dizinleri ise uzantıya göre süzerek sıralı biçimde listeler
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, directories, names in os.walk(path):
+                directories[:] = sorted(d for d in directories if not d.startswith('.') and d not in SKIPPED_DIRECTORIES)
+                files.extend(os.path.join(root, name) for name in sorted(names) if name.endswith(tuple(extensions)))
+        else:
+            files.append(path)
+    return files
+
+def diagnostic(path, severity, message, line=None, column=None):
+    return {'path': path, 'line': line, 'column': column, 'severity': severity, 'message': message}
+
+def analyze_file(path, output_format='json'):
+    """
+    Bir dosyayı lexleyip ayrıştırır; işçi süreçlerinde çalışır.
+    Dönen sözlük: yol, satır ve token sayıları, tanılar ve istenirse vurgulanmış çıktı.
+    """
+    lexer = _lexer or Lexer(engine='regex')
+    result = {'path': path, 'lines': 0, 'tokens': 0, 'diagnostics': [], 'output': None}
+    try:
+        with open(path, encoding='utf-8', newline='') as file:
+            code = file.read()
+    except (OSError, UnicodeDecodeError) as e:
+        result['diagnostics'].append(diagnostic(path, 'error', f"Dosya okunamadı: {e}"))
+        return result
+
+    if _cache is not None:
+        misses = _cache.misses
+        tokens = _cache.tokenize(code)
+    else:
+        tokens = lexer.tokenize(code)
+    result['lines'] = code.count('\n') + 1 if code else 0
+    result['tokens'] = len(tokens)
+    diagnostics = result['diagnostics']
+    for token in tokens:
+        if token.type == 'UNKNOWN':
+            diagnostics.append(diagnostic(path, 'warning', f"Tanınmayan karakter: '{token.value}'",
+                                          token.line, token.column))
+    errors = []
+    if lexer.grammar.digest != DEFAULT_GRAMMAR.digest:
+        pass # Ayrıştırıcı projenin dilini bilir; başka dillerde yalnızca lexleme yapılır
+    elif _cache is not None:
+        errors = _cache.parse(code, tokens)[1]
+        result['cached'] = _cache.misses == misses # Token'lar ve AST tamamen önbellekten geldi
+    else:
+        errors = parse_with_recovery(tokens)[1]
+    for error in errors:
+        if error.token is not None:
+            diagnostics.append(diagnostic(path, 'error', str(error), error.token.line, error.token.column))
+        else:
+            diagnostics.append(diagnostic(path, 'error', str(error)))
+
+    if output_format == 'ansi':
+        result['output'] = render_ansi(code, tokens, lexer.grammar)
+    elif output_format == 'html':
+        result['output'] = render_html(code, tokens)
+    return result
+
+def _render(code, tokens, wrap, escape):
+    # Token'ları wrap ile sarar; aradaki boşluklar olduğu gibi kopyalanır
+    parts = []
+    position = 0
+    for token in tokens:
+        if token.start > position:
+            parts.append(escape(code[position:token.start]))
+        parts.append(wrap(token.type, escape(token.value)))
+        position = token.end
+    parts.append(escape(code[position:]))
+    return ''.join(parts)
+
+def render_ansi(code, tokens, grammar=DEFAULT_GRAMMAR):
+    codes = token_colors(grammar, ANSI_CODES, EXTRA_ANSI_CODES)
+    def wrap(token_type, text):
+        ansi_code = codes.get(token_type)
+        return f'\x1b[{ansi_code}m{text}{ANSI_RESET}' if ansi_code else text
+    return _render(code, tokens, wrap, str)
+
+def render_html(code, tokens):
+    def wrap(token_type, text):
+        return f'<span class="{token_type.lower()}">{text}</span>'
+    return _render(code, tokens, wrap, html.escape)
+
+def html_document(sections, grammar=DEFAULT_GRAMMAR):
+    # Her dosya için bir bölüm içeren tek, bağımsız bir HTML belgesi; renkler gramerin token tiplerinden
+    styles = '\n'.join(f'.{token_type.lower()} {{ color: {color}; }}' for token_type, color in token_colors(grammar).items())
+    body = '\n'.join(sections)
+    return (f'<!DOCTYPE html>\n<html>\n<head>\n<meta charset="utf-8">\n<style>\n'
+            f'pre {{ font-family: Consolas, monospace; }}\n.unknown {{ background: yellow; }}\n{styles}\n'
+            f'</style>\n</head>\n<body>\n{body}\n</body>\n</html>\n')
+
+def html_section(result):
+    items = ''.join(f'<li>{html.escape(d["severity"])}: {html.escape(d["message"])}</li>' for d in result['diagnostics'])
+    diagnostics = f'<ul>{items}</ul>\n' if items else ''
+    return f'<section>\n<h2>{html.escape(result["path"])}</h2>\n{diagnostics}<pre>{result["output"]}</pre>\n</section>'
+
+def run(files, output_format='json', jobs=None, chunk_size=DEFAULT_CHUNK_SIZE, cache_dir=None, grammar_path=None):
+    # Dosyaları süreç havuzunda analiz eder; sonuçlar girdi sırasıyla üretilir
+    if jobs == 1:
+        _init_worker(cache_dir, grammar_path)
+        for path in files:
+            yield analyze_file(path, output_format)
+        return
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(cache_dir, grammar_path)) as executor:
+        yield from executor.map(analyze_file, files, [output_format] * len(files), chunksize=chunk_size)
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Kaynak dosyalarını arayüz olmadan, paralel olarak lexler ve ayrıştırır.")
+    arg_parser.add_argument('paths', nargs='+', help="Dosyalar veya dizinler")
+    arg_parser.add_argument('--ext', nargs='+', default=list(DEFAULT_EXTENSIONS),
+                            help="Dizinlerde aranacak dosya uzantıları")
+    arg_parser.add_argument('--format', choices=OUTPUT_FORMATS, default='json',
+                            help="json: tanılar JSON satırları olarak; ansi/html: vurgulanmış kaynak")
+    arg_parser.add_argument('--diagnostics', help="ansi/html biçiminde tanıların JSON satırları olarak yazılacağı dosya")
+    arg_parser.add_argument('--jobs', type=int, default=None, help="İşçi süreç sayısı (varsayılan: çekirdek sayısı)")
+    arg_parser.add_argument('--cache-dir', help="Token ve AST'lerin içerik özetiyle saklandığı dizin; değişmeyen dosyalar yeniden analiz edilmez")
+    arg_parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                            help="İşçiye tek seferde gönderilen dosya sayısı")
+    arg_parser.add_argument('--grammar', help="Kullanılacak dilin gramer tanımı (varsayılan: grammars/dil.grammar); "
+                                              "başka dillerde sözdizimi denetimi yapılmaz")
+    args = arg_parser.parse_args(argv)
+    try:
+        grammar = load_grammar(args.grammar) if args.grammar else DEFAULT_GRAMMAR
+    except (OSError, GrammarError) as e:
+        arg_parser.error(str(e))
+
+    files = collect_files(args.paths, args.ext)
+    out = sys.stdout
+    diagnostics_file = None
+    if args.format == 'json':
+        diagnostics_file = out
+    elif args.diagnostics:
+        diagnostics_file = open(args.diagnostics, 'w', encoding='utf-8')
+
+    started = time.perf_counter()
+    file_count = token_count = line_count = error_count = cached_count = 0
+    sections = []
+    try:
+        for result in run(files, args.format, args.jobs, args.chunk_size, args.cache_dir, args.grammar):
+            file_count += 1
+            cached_count += result.get('cached', False)
+            token_count += result['tokens']
+            line_count += result['lines']
+            error_count += sum(1 for d in result['diagnostics'] if d['severity'] == 'error')
+            if diagnostics_file is not None:
+                for d in result['diagnostics']:
+                    diagnostics_file.write(json.dumps(d, ensure_ascii=False) + '\n')
+            if args.format == 'ansi':
+                out.write(f'==> {result["path"]} <==\n{result["output"]}')
+                if result['output'] and not result['output'].endswith('\n'):
+                    out.write('\n')
+            elif args.format == 'html':
+                sections.append(html_section(result))
+    finally:
+        if diagnostics_file is not None and diagnostics_file is not out:
+            diagnostics_file.close()
+    if args.format == 'html':
+        out.write(html_document(sections, grammar))
+    elapsed = time.perf_counter() - started
+
+    # Özet stderr'e yazılır; stdout makinece okunabilir kalır
+    rate = 1 / elapsed if elapsed > 0 else 0
+    cached = f" ({cached_count} önbellekten)" if args.cache_dir else ''
+    print(f"{file_count} dosya{cached}, {line_count} satır, {token_count} token, {error_count} hata; "
+          f"{elapsed:.3f} s ({file_count * rate:.1f} dosya/s, {token_count * rate:.0f} token/s)", file=sys.stderr)
+    return 1 if error_count else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,2 @@
+# Performans ölçümleri için yardımcı betikler.
+# Depo kök dizininden çalıştırılır: python -m benchmarks.bench_lexer
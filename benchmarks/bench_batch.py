@@ -0,0 +1,34 @@
+import argparse
+import os
+import tempfile
+import time
+
+import batch
+from benchmarks.corpus import generate_program
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Toplu analizin işçi sayısına göre ölçeklenmesini ölçer.")
+    arg_parser.add_argument('--files', type=int, default=200, help="Üretilen dosya sayısı")
+    arg_parser.add_argument('--lines', type=int, default=2000, help="Dosya başına satır sayısı")
+    arg_parser.add_argument('--jobs', type=int, nargs='+', default=None, help="Denenecek işçi sayıları")
+    args = arg_parser.parse_args(argv)
+
+    cpu_count = os.cpu_count() or 1
+    jobs_list = args.jobs or sorted({n for n in (1, 2, 4, 8, cpu_count) if n <= cpu_count})
+    with tempfile.TemporaryDirectory() as directory:
+        for index in range(args.files):
+            with open(os.path.join(directory, f'kaynak{index}.txt'), 'w', encoding='utf-8') as file:
+                file.write(generate_program(args.lines, seed=index))
+        files = batch.collect_files([directory])
+
+        print(f"{'işçi':>6} {'süre (s)':>10} {'dosya/s':>10} {'token/s':>12} {'hızlanma':>10}")
+        baseline = None
+        for jobs in jobs_list:
+            started = time.perf_counter()
+            tokens = sum(result['tokens'] for result in batch.run(files, jobs=jobs))
+            elapsed = time.perf_counter() - started
+            baseline = baseline or elapsed
+            print(f"{jobs:>6} {elapsed:>10.3f} {len(files) / elapsed:>10.1f} {tokens / elapsed:>12.0f} {baseline / elapsed:>10.2f}")
+
+if __name__ == '__main__':
+    main()
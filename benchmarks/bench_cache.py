@@ -0,0 +1,34 @@
+import argparse
+import tempfile
+import time
+
+from cache import AnalysisCache
+from benchmarks.corpus import generate_mixed_program
+from benchmarks.bench_parser import one_character_edit
+
+def timed(run):
+    started = time.perf_counter()
+    run()
+    return time.perf_counter() - started
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="İçerik özetli token/AST önbelleğinin soğuk, sıcak ve blok düzeyi süreleri.")
+    arg_parser.add_argument('--lines', type=int, nargs='+', default=[1000, 10000, 100000], help="Satır sayıları")
+    args = arg_parser.parse_args(argv)
+
+    print(f"{'satır':>8} {'soğuk (s)':>10} {'sıcak (ms)':>11} {'tek blok değişti (s)':>21} {'diskten (s)':>12}")
+    for line_count in args.lines:
+        code = generate_mixed_program(line_count)
+        edited = one_character_edit(code)
+        with tempfile.TemporaryDirectory() as directory:
+            cache = AnalysisCache(directory=directory)
+            cold = timed(lambda: cache.parse(code))
+            warm = timed(lambda: cache.parse(code))
+            block = timed(lambda: cache.parse(edited))
+            # Yeniden başlatma: boş bellek, aynı disk deposu
+            restarted = AnalysisCache(directory=directory)
+            disk = timed(lambda: restarted.parse(code))
+        print(f"{line_count:>8} {cold:>10.4f} {warm * 1000:>11.3f} {block:>21.4f} {disk:>12.4f}")
+
+if __name__ == '__main__':
+    main()
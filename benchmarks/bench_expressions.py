@@ -0,0 +1,45 @@
+import argparse
+import sys
+import time
+
+from lexer import Lexer
+from parser import Parser
+from benchmarks.corpus import generate_expressions
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+DEFAULT_DEPTH = 100000
+
+def time_parse(tokens, repeat):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        Parser(tokens).parse()
+        elapsed = time.perf_counter() - started
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+def nested_parentheses(depth):
+    # Python'un özyineleme sınırını çok aşan derinlikte parantez ve çağrı iç içeliği
+    return 'x = ' + '(' * depth + '1' + ')' * depth + ' + ' + 'f(' * depth + '2' + ')' * depth + '\n'
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="İfade ağırlıklı kaynakta ayrıştırıcının saniyedeki token sayısını ölçer.")
+    arg_parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help="Satır sayıları")
+    arg_parser.add_argument('--depth', type=int, default=DEFAULT_DEPTH, help="İç içe parantez derinliği")
+    arg_parser.add_argument('--repeat', type=int, default=3, help="Her ölçüm için tekrar sayısı (en iyisi alınır)")
+    args = arg_parser.parse_args(argv)
+
+    lexer = Lexer(engine='regex')
+    print(f"{'satır':>8} {'token':>10} {'süre (s)':>10} {'token/s':>12}")
+    for size in args.sizes:
+        tokens = lexer.tokenize(generate_expressions(size))
+        elapsed = time_parse(tokens, args.repeat)
+        print(f"{size:>8} {len(tokens):>10} {elapsed:>10.4f} {len(tokens) / elapsed:>12.0f}")
+
+    tokens = lexer.tokenize(nested_parentheses(args.depth))
+    elapsed = time_parse(tokens, 1)
+    print(f"\nderinlik {args.depth} (özyineleme sınırı {sys.getrecursionlimit()}): {elapsed:.4f} s")
+
+if __name__ == '__main__':
+    main()
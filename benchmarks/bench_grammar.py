@@ -0,0 +1,73 @@
+import argparse
+import os
+import re
+import shutil
+import tempfile
+import time
+
+import grammar
+from grammar import DEFAULT_GRAMMAR_FILE, load_grammar
+
+def synthetic_grammar(keyword_count):
+    # Çok sayıda anahtar kelimesi olan bir DSL tanımı; derleme süresi desen boyutuyla büyür
+    keywords = '|'.join(f'kw{index}_{index * 7919 % 1000}' for index in range(keyword_count))
+    with open(DEFAULT_GRAMMAR_FILE, encoding='utf-8') as file:
+        definition = file.read()
+    return definition.replace(r'\b(if|else|while|for|def|return|in|range)\b', rf'\b({keywords})\b')
+
+def time_load(path, use_cache, repeat):
+    # Süreç içi bellek atlanarak yalnızca tanım okuma + derleme veya tablo yükleme ölçülür
+    best = float('inf')
+    for _ in range(repeat):
+        grammar._loaded.clear()
+        started = time.perf_counter()
+        load_grammar(path, use_cache=use_cache)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+def time_re_compile(path, repeat):
+    # Karşılaştırma: re modülünün kendi önbelleği boşaltılarak aynı desenlerin re.compile ile derlenmesi
+    with open(path, encoding='utf-8') as file:
+        parsed = grammar.parse_grammar(file.read(), path)
+    best = float('inf')
+    for _ in range(repeat):
+        re.purge()
+        started = time.perf_counter()
+        re.compile(parsed.master_source)
+        for _, pattern in parsed.token_types:
+            re.compile(pattern)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(
+        description="Gramer tanımının derlenerek ve diskteki derlenmiş tablolardan yüklenme süreleri.")
+    arg_parser.add_argument('--keywords', type=int, nargs='+', default=[0, 500, 5000],
+                            help="Sentetik gramerdeki anahtar kelime sayıları (0: projenin dili)")
+    arg_parser.add_argument('--repeat', type=int, default=5)
+    args = arg_parser.parse_args(argv)
+
+    print(f"{'anahtar kelime':>15} {'re.compile (ms)':>16} {'derleme (ms)':>13} {'önbellekten (ms)':>17}")
+    directory = tempfile.mkdtemp()
+    try:
+        for keyword_count in args.keywords:
+            path = os.path.join(directory, f'dsl{keyword_count}.grammar')
+            if keyword_count:
+                with open(path, 'w', encoding='utf-8') as file:
+                    file.write(synthetic_grammar(keyword_count))
+            else:
+                shutil.copyfile(DEFAULT_GRAMMAR_FILE, path)
+            baseline = time_re_compile(path, args.repeat)
+            cold = time_load(path, False, args.repeat)
+            # Tablo dosyasını yaz: süreç içi bellek boşaltılmazsa derlemeden kalan gramer döner ve dosya yazılmaz
+            grammar._loaded.clear()
+            load_grammar(path)
+            if not os.path.exists(path + grammar.COMPILED_SUFFIX):
+                raise SystemExit(f"{path}: tablo dosyası yazılamadı")
+            cached = time_load(path, True, args.repeat)
+            print(f"{keyword_count:>15} {baseline * 1000:>16.2f} {cold * 1000:>13.2f} {cached * 1000:>17.2f}")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+if __name__ == '__main__':
+    main()
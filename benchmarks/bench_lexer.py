@@ -0,0 +1,69 @@
+import argparse
+import time
+
+from lexer import Lexer, LEXER_ENGINES
+from benchmarks.corpus import generate_program
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+
+def time_engine(engine, code, repeat):
+    lexer = Lexer(engine=engine)
+    best = None
+    tokens = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        tokens = lexer.tokenize(code)
+        elapsed = time.perf_counter() - started
+        if best is None or elapsed < best:
+            best = elapsed
+    return tokens, best
+
+def same_tokens(left, right):
+    if len(left) != len(right):
+        return False
+    for a, b in zip(left, right):
+        if (a.type, a.value, a.start, a.end, a.line, a.column) != (b.type, b.value, b.start, b.end, b.line, b.column):
+            return False
+    return True
+
+def time_incremental_edit(code, repeat):
+    # Belgenin ortasındaki bir satıra tek karakter eklenip silinmesinin yeniden lexleme süresi
+    lexer = Lexer(engine='regex')
+    state, _ = lexer.tokenize_incremental(code)
+    middle = code.index('\n', len(code) // 2) + 1
+    edited = code[:middle] + 'z' + code[middle:]
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        state, _ = lexer.tokenize_incremental(edited, state)
+        state, _ = lexer.tokenize_incremental(code, state)
+        elapsed = (time.perf_counter() - started) / 2
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Lexer motorlarının saniyedeki token sayısını ölçer.")
+    arg_parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help="Satır sayıları")
+    arg_parser.add_argument('--repeat', type=int, default=3, help="Her ölçüm için tekrar sayısı (en iyisi alınır)")
+    args = arg_parser.parse_args(argv)
+
+    print(f"{'satır':>8} {'motor':>6} {'token':>9} {'süre (s)':>10} {'token/s':>12}")
+    for size in args.sizes:
+        code = generate_program(size)
+        results = {}
+        for engine in LEXER_ENGINES:
+            tokens, elapsed = time_engine(engine, code, args.repeat)
+            results[engine] = tokens
+            print(f"{size:>8} {engine:>6} {len(tokens):>9} {elapsed:>10.4f} {len(tokens) / elapsed:>12.0f}")
+        if not same_tokens(results['loop'], results['regex']):
+            raise SystemExit(f"Motorlar {size} satırlık girdide farklı token üretti!")
+
+    print()
+    print(f"{'satır':>8} {'artımlı düzenleme (ms)':>24}")
+    for size in args.sizes:
+        elapsed = time_incremental_edit(generate_program(size), args.repeat)
+        print(f"{size:>8} {elapsed * 1000:>24.3f}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+from lsp_server import read_message, write_message
+from benchmarks.corpus import generate_mixed_program
+
+SERVER = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'lsp_server.py')
+URI = 'file:///bench.txt'
+
+class ScriptedClient:
+    """
+    lsp_server.py'yi alt süreç olarak başlatıp stdio üzerinden konuşan betikli istemci.
+    İstek yanıtlarını beklerken gelen bildirimler (publishDiagnostics) ayrıca saklanır.
+    """
+    def __init__(self):
+        self.process = subprocess.Popen([sys.executable, SERVER], stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+        self.notifications = []
+        self._next_id = 0
+
+    def notify(self, method, params):
+        write_message(self.process.stdin, {'jsonrpc': '2.0', 'method': method, 'params': params})
+
+    def request(self, method, params):
+        self._next_id += 1
+        write_message(self.process.stdin, {'jsonrpc': '2.0', 'id': self._next_id, 'method': method, 'params': params})
+        while True:
+            message = read_message(self.process.stdout)
+            if message is None:
+                raise RuntimeError("Sunucu beklenmedik şekilde kapandı")
+            if message.get('id') == self._next_id:
+                return message['result']
+            self.notifications.append(message)
+
+    def wait_diagnostics(self, version, timeout=30.0):
+        # Verilen sürüm için yayınlanan tanıları bekle
+        deadline = time.perf_counter() + timeout
+        while time.perf_counter() < deadline:
+            for message in self.notifications:
+                params = message.get('params', {})
+                if message.get('method') == 'textDocument/publishDiagnostics' and params.get('version') == version:
+                    return params['diagnostics']
+            message = read_message(self.process.stdout)
+            if message is None:
+                break
+            self.notifications.append(message)
+        raise TimeoutError(f"{version}. sürüm için tanı gelmedi")
+
+    def close(self):
+        self.request('shutdown', None)
+        self.notify('exit', None)
+        self.process.stdin.close()
+        self.process.wait(timeout=10)
+        self.process.stdout.close()
+
+def apply_edits(data, edits):
+    for edit in sorted(edits, key=lambda edit: -edit['start']):
+        data[edit['start']:edit['start'] + edit['deleteCount']] = edit['data']
+    return data
+
+def wire_size(result):
+    return len(json.dumps(result, separators=(',', ':')))
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="LSP sunucusunda artımlı eşitleme ve anlamsal token deltası ölçümü.")
+    arg_parser.add_argument('--lines', type=int, nargs='+', default=[1000, 10000, 100000], help="Satır sayıları")
+    arg_parser.add_argument('--edits', type=int, default=50, help="Belge ortasında yazılan karakter sayısı")
+    args = arg_parser.parse_args(argv)
+
+    print(f"{'satır':>8} {'açılış (s)':>11} {'tam (bayt)':>11} {'delta (bayt)':>13} "
+          f"{'tuş p50 (ms)':>13} {'tuş p95 (ms)':>13} {'tanı (s)':>9}")
+    for line_count in args.lines:
+        code = generate_mixed_program(line_count)
+        client = ScriptedClient()
+        try:
+            client.request('initialize', {'capabilities': {'general': {'positionEncodings': ['utf-32', 'utf-16']}}})
+            client.notify('initialized', {})
+            started = time.perf_counter()
+            client.notify('textDocument/didOpen',
+                          {'textDocument': {'uri': URI, 'languageId': 'text', 'version': 1, 'text': code}})
+            full = client.request('textDocument/semanticTokens/full', {'textDocument': {'uri': URI}})
+            opened = time.perf_counter() - started
+            data = full['data']
+            result_id = full['resultId']
+
+            # Belgenin ortasındaki bir satırın başına karakter karakter bir atama yazılır
+            line = line_count // 2
+            typed = ('x = 1 + 2;' * (args.edits // 10 + 1))[:args.edits]
+            latencies = []
+            delta_bytes = 0
+            for column, char in enumerate(typed):
+                started = time.perf_counter()
+                client.notify('textDocument/didChange', {
+                    'textDocument': {'uri': URI, 'version': column + 2},
+                    'contentChanges': [{'range': {'start': {'line': line, 'character': column},
+                                                  'end': {'line': line, 'character': column}}, 'text': char}],
+                })
+                delta = client.request('textDocument/semanticTokens/full/delta',
+                                       {'textDocument': {'uri': URI}, 'previousResultId': result_id})
+                latencies.append(time.perf_counter() - started)
+                delta_bytes += wire_size(delta)
+                if 'edits' in delta:
+                    data = apply_edits(data, delta['edits'])
+                else:
+                    data = delta['data']
+                result_id = delta['resultId']
+
+            # Uygulanan deltalar, sıfırdan istenen tam sonuçla aynı olmalı
+            check = client.request('textDocument/semanticTokens/full', {'textDocument': {'uri': URI}})
+            if check['data'] != data:
+                raise AssertionError("Delta uygulanmış anlamsal token'lar tam sonuçla eşleşmiyor")
+            started = time.perf_counter()
+            client.wait_diagnostics(len(typed) + 1)
+            diagnosed = time.perf_counter() - started
+        finally:
+            client.close()
+        latencies.sort()
+        p50 = latencies[len(latencies) // 2]
+        p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+        print(f"{line_count:>8} {opened:>11.4f} {wire_size(full):>11} {delta_bytes // len(typed):>13} "
+              f"{p50 * 1000:>13.3f} {p95 * 1000:>13.3f} {diagnosed:>9.4f}")
+
+if __name__ == '__main__':
+    main()
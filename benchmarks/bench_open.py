@@ -0,0 +1,51 @@
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.corpus import generate_mixed_program
+from benchmarks.headless import create_app
+
+# Karşılaştırılan yöntemler: aşamalı lexleme eşiği (None: tek seferde)
+METHODS = (('aşamalı', 1 << 16), ('tek seferde', None))
+
+def screen_highlighted(app):
+    # Açılışta görünen satırların etiketleri uygulandı mı
+    end = min(app.text_area.visible_lines, app.text_area.line_count()) + 1
+    return not app.highlighted_lines.missing(1, end)
+
+def open_and_measure(path, threshold):
+    # Dosya açılışından ekranın vurgulanmasına, lexleme bitişine ve ayrıştırma sonucuna kadar geçen süreler
+    app = create_app(progressive_threshold=threshold)
+    try:
+        master = app.master
+        started = time.perf_counter()
+        app.open_file(path=path)
+        master.run_until_idle(timeout=600, until=lambda: screen_highlighted(app))
+        screen = time.perf_counter() - started
+        master.run_until_idle(timeout=600, until=app.analysis_current)
+        lexed = time.perf_counter() - started
+        master.run_until_idle(timeout=600)
+        total = time.perf_counter() - started
+        return screen, lexed, total, master.longest_callback
+    finally:
+        app.analysis_worker.stop()
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(
+        description="Büyük dosya açılışında aşamalı vurgulama ile tek seferde lexlemenin arayüz tepkisi karşılaştırması.")
+    arg_parser.add_argument('--lines', type=int, nargs='+', default=[10000, 100000], help="Satır sayıları")
+    args = arg_parser.parse_args(argv)
+
+    print(f"{'satır':>8} {'yöntem':>12} {'ilk ekran (ms)':>15} {'lexleme (ms)':>13} {'toplam (s)':>11} {'en uzun iş (ms)':>16}")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'kaynak.txt')
+        for line_count in args.lines:
+            with open(path, 'w', encoding='utf-8', newline='') as file:
+                file.write(generate_mixed_program(line_count))
+            for name, threshold in METHODS:
+                screen, lexed, total, longest = open_and_measure(path, threshold)
+                print(f"{line_count:>8} {name:>12} {screen * 1000:>15.1f} {lexed * 1000:>13.1f} {total:>11.2f} {longest * 1000:>16.1f}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+import argparse
+import time
+
+from lexer import Lexer
+from parser import Parser, IncrementalParser
+from benchmarks.corpus import generate_program
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+SKIPPED_TOKEN_TYPES = ('WHITESPACE', 'COMMENT', 'MULTI_LINE_COMMENT')
+
+def one_character_edit(code):
+    # Belgenin ortasındaki ilk rakamı başka bir rakamla değiştir
+    position = len(code) // 2
+    while not code[position].isdigit():
+        position += 1
+    replacement = '7' if code[position] != '7' else '8'
+    return code[:position] + replacement + code[position + 1:]
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Tam ayrıştırma ile artımlı yeniden ayrıştırmayı karşılaştırır.")
+    arg_parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help="Satır sayıları")
+    arg_parser.add_argument('--repeat', type=int, default=5, help="Artımlı ölçüm için düzenleme sayısı (en iyisi alınır)")
+    args = arg_parser.parse_args(argv)
+
+    lexer = Lexer(engine='regex')
+    print(f"{'satır':>8} {'tam ayrıştırma (s)':>20} {'artımlı (ms)':>14}")
+    for size in args.sizes:
+        code = generate_program(size)
+        tokens = [t for t in lexer.tokenize(code) if t.type not in SKIPPED_TOKEN_TYPES]
+        started = time.perf_counter()
+        Parser(tokens).parse()
+        full_elapsed = time.perf_counter() - started
+
+        incremental = IncrementalParser()
+        state, _ = lexer.tokenize_incremental(code)
+        incremental.parse_state(state)
+        edited = one_character_edit(code)
+        best = None
+        for index in range(args.repeat):
+            state, _ = lexer.tokenize_incremental(edited if index % 2 == 0 else code, state)
+            started = time.perf_counter()
+            incremental.parse_state(state)
+            elapsed = time.perf_counter() - started
+            if best is None or elapsed < best:
+                best = elapsed
+        print(f"{size:>8} {full_elapsed:>20.4f} {best * 1000:>14.3f}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+import argparse
+import time
+
+from lexer import Lexer
+from parser import Parser, ParserError, SKIPPED_TOKEN_TYPES, parse_with_recovery
+from benchmarks.corpus import generate_program
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+
+def inject_errors(code, every):
+    # Her 'every' satırdan birindeki atamayı bozar ('x = 1' -> 'x = = 1'); bozulan satır sayısını da döndürür
+    lines = code.split('\n')
+    broken = 0
+    for index in range(0, len(lines), every):
+        for offset in range(index, min(index + every, len(lines))):
+            if ' = ' in lines[offset]:
+                lines[offset] = lines[offset].replace(' = ', ' = = ', 1)
+                broken += 1
+                break
+    return '\n'.join(lines), broken
+
+def best_time(function, repeat):
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+def strict_parse(tokens):
+    try:
+        Parser(tokens).parse()
+    except ParserError:
+        pass
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(
+        description="Hata kurtarmalı ayrıştırmanın hatasız ve çok hatalı kaynakta ilk hatada duran ayrıştırmayla karşılaştırması.")
+    arg_parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help="Satır sayıları")
+    arg_parser.add_argument('--every', type=int, default=10, help="Kaç satırda bir hata eklendiği")
+    arg_parser.add_argument('--repeat', type=int, default=3)
+    args = arg_parser.parse_args(argv)
+
+    lexer = Lexer(engine='regex')
+    print(f"{'satır':>8} {'hata':>6} {'hatasız (ms)':>13} {'kurtarmalı (ms)':>16} {'hatalı (ms)':>12} {'oran':>6}")
+    for size in args.sizes:
+        code = generate_program(size)
+        tokens = [token for token in lexer.tokenize(code) if token.type not in SKIPPED_TOKEN_TYPES]
+        broken_code, _ = inject_errors(code, args.every)
+        broken_tokens = [token for token in lexer.tokenize(broken_code) if token.type not in SKIPPED_TOKEN_TYPES]
+
+        clean_time, _ = best_time(lambda: strict_parse(tokens), args.repeat)
+        recover_time, (_, clean_errors) = best_time(lambda: parse_with_recovery(tokens), args.repeat)
+        if clean_errors:
+            raise SystemExit(f"{size}: hatasız kaynakta hata bildirildi: {clean_errors[0]}")
+        broken_time, (_, errors) = best_time(lambda: parse_with_recovery(broken_tokens), args.repeat)
+        # Oran: tüm hataları bulan tek ayrıştırmanın hatasız kaynağın ilk hatada duran ayrıştırmasına göre maliyeti
+        print(f"{size:>8} {len(errors):>6} {clean_time * 1000:>13.2f} {recover_time * 1000:>16.2f} "
+              f"{broken_time * 1000:>12.2f} {broken_time / clean_time:>5.2f}x")
+
+if __name__ == '__main__':
+    main()
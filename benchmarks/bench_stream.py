@@ -0,0 +1,59 @@
+import argparse
+import mmap
+import os
+import tempfile
+import time
+import tracemalloc
+
+from lexer import Lexer
+from benchmarks.corpus import generate_program
+
+BLOCK_LINES = 10000
+
+def write_source(path, line_count):
+    # Kaynak, bellekte tamamı tutulmadan blok blok yazılır
+    with open(path, 'w', encoding='utf-8', newline='') as file:
+        written = 0
+        seed = 0
+        while written < line_count:
+            block = min(BLOCK_LINES, line_count - written)
+            file.write(generate_program(block, seed=seed))
+            written += block
+            seed += 1
+
+def scan(build):
+    # Token'ları saymak için tüketir; süre izlemesiz, tepe bellek ayrı bir geçişte tracemalloc ile ölçülür
+    started = time.perf_counter()
+    count = sum(1 for _ in build())
+    elapsed = time.perf_counter() - started
+    tracemalloc.start()
+    for _ in build():
+        pass
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return count, elapsed, peak
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Akış halinde lexleme ile tüm dosyayı okuyup lexlemenin bellek karşılaştırması.")
+    arg_parser.add_argument('--lines', type=int, nargs='+', default=[10000, 100000], help="Satır sayıları")
+    args = arg_parser.parse_args(argv)
+
+    lexer = Lexer(engine='regex')
+    print(f"{'satır':>8} {'yöntem':>12} {'token':>9} {'süre (s)':>10} {'tepe (MB)':>10}")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'kaynak.txt')
+        for line_count in args.lines:
+            write_source(path, line_count)
+            with open(path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                def read_all():
+                    with open(path, encoding='utf-8', newline='') as source:
+                        return lexer.tokenize(source.read())
+                def stream_all():
+                    mapped.seek(0)
+                    return lexer.iter_tokens(mapped)
+                for name, build in (('tokenize', read_all), ('iter_tokens', stream_all)):
+                    count, elapsed, peak = scan(build)
+                    print(f"{line_count:>8} {name:>12} {count:>9} {elapsed:>10.4f} {peak / 2**20:>10.2f}")
+
+if __name__ == '__main__':
+    main()
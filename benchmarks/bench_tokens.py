@@ -0,0 +1,48 @@
+import argparse
+import time
+import tracemalloc
+
+from lexer import Lexer
+from parser import Parser
+from benchmarks.corpus import generate_program
+
+SKIPPED_TOKEN_TYPES = ('WHITESPACE', 'COMMENT', 'MULTI_LINE_COMMENT')
+
+def measure(build):
+    # Oluşturulan yapının süresini, kalıcı bellek kullanımını ve bellek ayırma sayısını ölç
+    tracemalloc.start()
+    before_blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics('filename'))
+    started = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - started
+    current, peak = tracemalloc.get_traced_memory()
+    after_blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics('filename'))
+    tracemalloc.stop()
+    return result, elapsed, current, peak, after_blocks - before_blocks
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Token listesi ile TokenStream'in bellek ve süre karşılaştırması.")
+    arg_parser.add_argument('--lines', type=int, default=100000, help="Sentetik kaynağın satır sayısı")
+    args = arg_parser.parse_args(argv)
+
+    code = generate_program(args.lines)
+    lexer = Lexer(engine='regex')
+
+    print(f"{'yapı':>12} {'token':>9} {'süre (s)':>10} {'bellek (MB)':>12} {'tepe (MB)':>10} {'blok':>10}")
+    for name, build in (('Token list', lambda: lexer.tokenize(code)),
+                        ('TokenStream', lambda: lexer.tokenize_stream(code))):
+        tokens, elapsed, current, peak, blocks = measure(build)
+        print(f"{name:>12} {len(tokens):>9} {elapsed:>10.4f} {current / 2**20:>12.2f} {peak / 2**20:>10.2f} {blocks:>10}")
+
+    print()
+    for name, tokens in (('Token list', [t for t in lexer.tokenize(code) if t.type not in SKIPPED_TOKEN_TYPES]),
+                         ('TokenStream', lexer.tokenize_stream(code).without(SKIPPED_TOKEN_TYPES))):
+        started = time.perf_counter()
+        try:
+            Parser(tokens).parse()
+        except Exception:
+            pass # Sentetik kaynak rastgele olduğundan sözdizimi hatası olabilir; süre yine ölçülür
+        print(f"{name:>12} ayrıştırma: {time.perf_counter() - started:.4f} s")
+
+if __name__ == '__main__':
+    main()
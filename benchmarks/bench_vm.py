@@ -0,0 +1,188 @@
+import argparse
+import builtins
+import operator
+import time
+
+from lexer import Lexer
+from parser import Parser
+from vm import BUILTIN_NAMES, compile_program, VirtualMachine
+
+# Döngü ağırlıklı örnek programlar; {n} ölçek parametresiyle değiştirilir
+PROGRAMS = {
+    'toplam': '''
+        toplam = 0
+        for (i in range({n})) {{ toplam += i * i - 60 * 60 * 24 }}
+    ''',
+    'iç içe': '''
+        sayac = 0
+        for (i in range({k})) {{
+            for (j in range({k})) {{
+                if (i < j) {{ sayac += 1 }} else {{ sayac -= 1 }}
+            }}
+        }}
+    ''',
+    'while': '''
+        a = 0
+        b = 1
+        k = 0
+        while (k < {n}) {{
+            c = a + b
+            a = b
+            b = c
+            if (b > 1000000) {{ a = 0 b = 1 }}
+            k += 1
+        }}
+    ''',
+    'özyineleme': '''
+        def fib(x) {{
+            if (x < 2) {{ return x }}
+            return fib(x - 1) + fib(x - 2)
+        }}
+        sonuc = fib({f})
+    ''',
+    'çağrı': '''
+        def adim(x, y) {{
+            z = x * 2 + y
+            return z / 2
+        }}
+        acc = 0
+        for (i in range({n})) {{ acc = adim(acc, i) - acc }}
+    ''',
+}
+
+BINARY_FUNCTIONS = {
+    '+': operator.add, '-': operator.sub, '*': operator.mul, '/': operator.truediv,
+    '<': operator.lt, '>': operator.gt, '<=': operator.le, '>=': operator.ge, '==': operator.eq, '!=': operator.ne,
+}
+
+class _Return(Exception):
+    def __init__(self, value):
+        self.value = value
+
+class TreeWalker:
+    """
+    Karşılaştırma için AST'yi doğrudan yorumlayan özyinelemeli değerlendirici: her düğümde tipine göre
+    bir metot seçilir, değişkenler sözlüklerde (yereller, sonra globaller, sonra yerleşikler) aranır.
+    """
+    def __init__(self):
+        self.output = []
+        self.globals = {}
+        self.builtins = {name: getattr(builtins, name) for name in BUILTIN_NAMES}
+        self.builtins['print'] = lambda *values: self.output.append(' '.join(map(str, values)))
+
+    def run(self, ast):
+        self.block(ast['statements'], self.globals)
+        return self.globals
+
+    def block(self, statements, scope):
+        for statement in statements:
+            getattr(self, statement['type'])(statement, scope)
+
+    def evaluate(self, node, scope):
+        return getattr(self, node['type'])(node, scope)
+
+    def lookup(self, name, scope):
+        if name in scope:
+            return scope[name]
+        if name in self.globals:
+            return self.globals[name]
+        return self.builtins[name]
+
+    def Assignment(self, node, scope):
+        scope[node['name']] = self.evaluate(node['value'], scope)
+
+    def AugmentedAssignment(self, node, scope):
+        value = self.evaluate(node['value'], scope)
+        scope[node['name']] = BINARY_FUNCTIONS[node['op'][0]](self.lookup(node['name'], scope), value)
+
+    def IfStatement(self, node, scope):
+        if self.evaluate(node['condition'], scope):
+            self.block(node['body']['statements'], scope)
+        elif node['else_body'] is not None:
+            self.block(node['else_body']['statements'], scope)
+
+    def WhileStatement(self, node, scope):
+        while self.evaluate(node['condition'], scope):
+            self.block(node['body']['statements'], scope)
+
+    def ForStatement(self, node, scope):
+        for value in range(self.evaluate(node['range']['argument'], scope)):
+            scope[node['iterator']] = value
+            self.block(node['body']['statements'], scope)
+
+    def FunctionDefinition(self, node, scope):
+        scope[node['name']] = node
+
+    def ReturnStatement(self, node, scope):
+        raise _Return(None if node['expression'] is None else self.evaluate(node['expression'], scope))
+
+    def FunctionCall(self, node, scope):
+        function = self.lookup(node['name'], scope)
+        arguments = [self.evaluate(argument, scope) for argument in node['arguments']]
+        if callable(function):
+            return function(*arguments)
+        local_scope = dict(zip(function['parameters'], arguments))
+        try:
+            self.block(function['body']['statements'], local_scope)
+        except _Return as returned:
+            return returned.value
+        return None
+
+    def BinaryOp(self, node, scope):
+        return BINARY_FUNCTIONS[node['op']](self.evaluate(node['left'], scope), self.evaluate(node['right'], scope))
+
+    def ParenthesizedExpression(self, node, scope):
+        return self.evaluate(node['expression'], scope)
+
+    def Identifier(self, node, scope):
+        return self.lookup(node['value'], scope)
+
+    def Number(self, node, scope):
+        return node['value']
+
+    Float = String = Number
+
+def parse(code, lexer):
+    tokens = lexer.tokenize(code)
+    return Parser(tokens).parse()
+
+def best_time(function, repeat):
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(
+        description="Bayt kodu derleyici + yığın makinesi ile özyinelemeli AST yorumlayıcısının karşılaştırması.")
+    arg_parser.add_argument('--scale', type=int, default=100000, help="Döngü tur sayısı (iç içe döngüde karekökü)")
+    arg_parser.add_argument('--fib', type=int, default=20, help="Özyineleme programındaki fib argümanı")
+    arg_parser.add_argument('--repeat', type=int, default=3)
+    args = arg_parser.parse_args(argv)
+
+    lexer = Lexer(engine='regex')
+    print(f"{'program':>12} {'derleme (ms)':>13} {'ağaç (ms)':>10} {'VM (ms)':>9} {'hızlanma':>9}")
+    for name, template in PROGRAMS.items():
+        code = template.format(n=args.scale, k=int(args.scale ** 0.5), f=args.fib)
+        ast = parse(code, lexer)
+        compile_time, program = best_time(lambda: compile_program(ast), args.repeat)
+        tree_time, tree_globals = best_time(lambda: TreeWalker().run(ast), args.repeat)
+
+        def run_vm():
+            machine = VirtualMachine()
+            machine.run(program)
+            return machine.global_values(program)
+        vm_time, vm_globals = best_time(run_vm, args.repeat)
+        # İki yorumlayıcı aynı sonucu vermeli
+        expected = {key: value for key, value in tree_globals.items() if not isinstance(value, dict)}
+        actual = {key: value for key, value in vm_globals.items() if key in expected}
+        if actual != expected:
+            raise SystemExit(f"{name}: sonuçlar farklı: {actual} != {expected}")
+        print(f"{name:>12} {compile_time * 1000:>13.3f} {tree_time * 1000:>10.1f} {vm_time * 1000:>9.1f} "
+              f"{tree_time / vm_time:>8.2f}x")
+
+if __name__ == '__main__':
+    main()
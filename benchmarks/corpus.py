@@ -0,0 +1,98 @@
+import random
+
+# Sentetik kaynak üretiminde kullanılan basit ifade şablonları
+STATEMENT_TEMPLATES = [
+    'x{n} = {n} + y * ({n} - 3) / 2',
+    'total += price{n} * 1.{n}',
+    'return a + b * c',
+    'message = "satir {n} icin metin"',
+    '# satir {n} icin aciklama',
+    '/* blok yorum {n} */',
+    'print(x{n}, y, "deger")',
+]
+
+# Blok açan şablonlar; kapanış '}' üretici tarafından eklenir
+BLOCK_TEMPLATES = [
+    'if (x{n} >= 10) {{',
+    'while (count{n} != 0) {{',
+    'for (i in range({n})) {{',
+    'def func{n}(a, b, c) {{',
+]
+
+MAX_DEPTH = 6
+
+def generate_program(line_count, seed=0):
+    """Verilen satır sayısında, sabit tohumla tekrarlanabilir ve sözdizimi geçerli bir kaynak metni üretir."""
+    rng = random.Random(seed)
+    lines = []
+    depth = 0
+    n = 0
+    while len(lines) + depth < line_count:
+        indent = '    ' * depth
+        roll = rng.random()
+        if depth and roll < 0.15:
+            depth -= 1
+            lines.append('    ' * depth + '}')
+        elif depth < MAX_DEPTH and roll < 0.35 and len(lines) + depth + 2 <= line_count:
+            lines.append(indent + rng.choice(BLOCK_TEMPLATES).format(n=n))
+            depth += 1
+        else:
+            lines.append(indent + rng.choice(STATEMENT_TEMPLATES).format(n=n))
+        n += 1
+    while depth:
+        depth -= 1
+        lines.append('    ' * depth + '}')
+    return '\n'.join(lines) + '\n'
+
+# İfade ağırlıklı kaynak için işlenenler ve ikili operatörler
+EXPRESSION_OPERANDS = ['x', 'y{n}', '{n}', '{n}.5', '"s{n}"']
+EXPRESSION_OPERATORS = ['+', '-', '*', '/', '==', '!=', '<', '>', '<=', '>=']
+
+def generate_expression(rng, n, depth=0):
+    roll = rng.random()
+    if depth >= 4 or roll < 0.3:
+        return rng.choice(EXPRESSION_OPERANDS).format(n=n)
+    if roll < 0.45:
+        return '(' + generate_expression(rng, n, depth + 1) + ')'
+    if roll < 0.55:
+        arguments = [generate_expression(rng, n, depth + 1) for _ in range(rng.randint(0, 3))]
+        return f'f{n % 7}(' + ', '.join(arguments) + ')'
+    return generate_expression(rng, n, depth + 1) + ' ' + rng.choice(EXPRESSION_OPERATORS) + ' ' + generate_expression(rng, n, depth + 1)
+
+def generate_expressions(line_count, seed=0):
+    """Her satırı uzun bir ikili işlem, parantez ve çağrı zinciri olan atamalardan oluşan kaynak metni üretir."""
+    rng = random.Random(seed)
+    return ''.join(f'v{n} = {generate_expression(rng, n)}\n' for n in range(line_count))
+
+# Karışık kaynaktaki bölümlerin satır sayısı aralıkları
+SECTION_LINES = (20, 200)
+
+def generate_large_comment(rng, n, line_count):
+    # line_count satıra yayılan tek bir çok satırlı blok yorum
+    if line_count == 1:
+        return f'/* yorum {n} */\n'
+    body = ''.join(f' * {n}. yorumun {index}. satiri: ' + 'lorem ipsum ' * rng.randint(1, 8) + '\n'
+                   for index in range(line_count - 2))
+    return f'/* yorum {n}\n{body} */\n'
+
+def generate_mixed_program(line_count, seed=0):
+    """
+    İç içe bloklar, uzun ifadeler ve büyük blok yorumlardan oluşan bölümleri sırayla birleştirir.
+    Her bölüm kendi içinde sözdizimi geçerlidir; toplam satır sayısı tam olarak line_count'tur.
+    """
+    rng = random.Random(seed)
+    sections = []
+    remaining = line_count
+    n = 0
+    while remaining > 0:
+        size = min(remaining, rng.randint(*SECTION_LINES))
+        roll = rng.random()
+        if roll < 0.6:
+            sections.append(generate_program(size, seed=rng.randrange(1 << 30)))
+        elif roll < 0.85:
+            sections.append(generate_expressions(size, seed=rng.randrange(1 << 30)))
+        else:
+            sections.append(generate_large_comment(rng, n, size))
+        remaining -= size
+        n += 1
+    return ''.join(sections)
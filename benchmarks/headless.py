@@ -0,0 +1,177 @@
+import time
+
+from main_app import SyntaxHighlighterApp, highlight_tags
+from tagsync import TagSynchronizer
+
+# Sahte metin alanında aynı anda görünen satır sayısı ve bir satırın piksel yüksekliği
+DEFAULT_VISIBLE_LINES = 40
+LINE_HEIGHT = 20
+
+class FakeTkInterpreter:
+    # TagSynchronizer'ın toplu 'tag remove' çağrısını sahte metin alanına iletir
+    def __init__(self, text_widget):
+        self.text_widget = text_widget
+
+    def call(self, widget_name, command, subcommand, tag, *indices):
+        self.text_widget.tag_call_count += 1
+
+class FakeText:
+    """
+    Ekran gerektirmeyen, bellekte tutulan Text yerine geçen nesne.
+    Yalnızca uygulamanın analiz yolunun kullandığı yöntemleri sağlar; etiketler uygulanmaz, sayılır.
+    """
+    def __init__(self, code='', visible_lines=DEFAULT_VISIBLE_LINES):
+        self.code = code
+        self.top_line = 1
+        self.cursor = '1.0' # Tk 'insert' imi
+        self.visible_lines = visible_lines
+        self.tag_call_count = 0
+        self._counted_code = None
+        self._line_count = 0
+        self.tk = FakeTkInterpreter(self)
+        self._w = '.text'
+
+    def get(self, start, end):
+        # 'end' için Tk gibi metnin sonuna bir satır sonu ekler
+        if end == 'end-1c':
+            return self.code
+        return self.code + '\n'
+
+    def insert(self, index, chars):
+        # Yalnızca dosya yüklemenin kullandığı 'end-1c' (metnin sonu)
+        self.code += chars
+
+    def delete(self, start, end):
+        # Yalnızca tüm metni silme ('1.0', 'end')
+        self.code = ''
+
+    def config(self, **options):
+        pass
+
+    def insert_at(self, offset, chars):
+        self.code = self.code[:offset] + chars + self.code[offset:]
+
+    def delete_at(self, offset, count=1):
+        self.code = self.code[:offset] + self.code[offset + count:]
+
+    def line_count(self):
+        # Tk satır sayısını tutar; ölçüme metni her sorguda saymanın maliyeti karışmasın
+        if self._counted_code is not self.code:
+            self._line_count = self.code.count('\n') + 1
+            self._counted_code = self.code
+        return self._line_count
+
+    def index(self, index):
+        if index == 'end-1c':
+            return f'{self.line_count()}.0'
+        if index == 'insert':
+            return self.cursor
+        if index.startswith('@'):
+            y = int(index.split(',')[1])
+            return f'{min(self.top_line + y // LINE_HEIGHT, self.line_count())}.0'
+        return index
+
+    def winfo_height(self):
+        return self.visible_lines * LINE_HEIGHT - 1
+
+    def tag_add(self, tag, *indices):
+        self.tag_call_count += 1
+
+    def tag_remove(self, tag, *indices):
+        self.tag_call_count += 1
+
+    def tag_configure(self, tag, **options):
+        pass
+
+    def tag_raise(self, tag):
+        pass
+
+    def see(self, index):
+        pass
+
+    def tag_names(self, index):
+        return ()
+
+    def mark_set(self, mark, index):
+        # Yalnızca 'satır.sütun' ve 'satır.end' biçimleri
+        line, column = index.split('.')
+        if column == 'end':
+            column = len(self.code.split('\n')[int(line) - 1])
+        self.cursor = f'{line}.{column}'
+
+class FakeGutter:
+    def redraw(self, force=False):
+        return False
+
+class FakeLabel:
+    def __init__(self):
+        self.text = ''
+
+    def config(self, text='', **options):
+        self.text = text
+
+    def cget(self, option):
+        return self.text
+
+class FakeMaster:
+    """
+    after() ile zamanlanan işleri bekleme süresini atlayarak sırayla çalıştırır.
+    Böylece ölçülen süre bekleme değil, yalnızca yapılan iştir.
+    """
+    def __init__(self):
+        self._callbacks = {}
+        self._next_id = 0
+        self.longest_callback = 0.0 # En uzun tek after() işi (s); arayüzün en uzun donma süresi
+
+    def after(self, delay_ms, callback, *args):
+        self._next_id += 1
+        self._callbacks[self._next_id] = (callback, args)
+        return self._next_id
+
+    def title(self, text):
+        pass
+
+    def after_cancel(self, after_id):
+        self._callbacks.pop(after_id, None)
+
+    def run_until_idle(self, timeout=60.0, until=None):
+        # Arka plan ayrıştırması biterken yoklama işinin iş parçacığını meşgul etmemesi için kısa bekler.
+        # until verilirse her işten sonra denetlenir; doğru olduğunda kalan işler sırada bırakılır.
+        deadline = time.perf_counter() + timeout
+        while self._callbacks:
+            if time.perf_counter() > deadline:
+                raise TimeoutError("Zamanlanan işler bitmedi")
+            for after_id in sorted(self._callbacks):
+                entry = self._callbacks.pop(after_id, None)
+                if entry is None:
+                    continue # Aynı turda önceki bir iş tarafından iptal edildi
+                callback, args = entry
+                started = time.perf_counter()
+                callback(*args)
+                self.longest_callback = max(self.longest_callback, time.perf_counter() - started)
+                if until is not None and until():
+                    return
+            if self._callbacks:
+                time.sleep(0.0002)
+
+def create_app(code='', visible_lines=DEFAULT_VISIBLE_LINES, **options):
+    """Pencere açmadan, sahte öğelerle çalışan bir SyntaxHighlighterApp oluşturur."""
+    app = SyntaxHighlighterApp.__new__(SyntaxHighlighterApp)
+    app.master = FakeMaster()
+    app.init_analysis(**options)
+    app.text_area = FakeText(code, visible_lines)
+    app.line_numbers = FakeGutter()
+    app.status_label = FakeLabel()
+    app.tag_sync = TagSynchronizer(app.text_area, highlight_tags(app.lexer.grammar))
+    return app
+
+def type_and_wait(app, offset, chars):
+    # offset'e karakter ekleyip tuş bırakma olayını ve tüm analiz zincirini bitene kadar çalıştırır
+    app.text_area.insert_at(offset, chars)
+    app.on_key_release()
+    app.master.run_until_idle()
+
+def delete_and_wait(app, offset, count=1):
+    app.text_area.delete_at(offset, count)
+    app.on_key_release()
+    app.master.run_until_idle()
@@ -0,0 +1,133 @@
+import argparse
+import json
+import platform
+import sys
+import time
+
+from lexer import Lexer
+from parser import Parser
+from benchmarks.corpus import generate_mixed_program
+from benchmarks.headless import create_app, type_and_wait, delete_and_wait
+
+DEFAULT_SIZES = [100, 1000, 10000, 100000]
+PHASES = ('lex', 'parse', 'keystroke')
+# Temel ölçüme göre izin verilen göreli yavaşlama (0.25 = %25)
+DEFAULT_THRESHOLDS = {'lex': 0.25, 'parse': 0.25, 'keystroke': 0.5}
+# Bundan küçük mutlak farklar ölçüm gürültüsü sayılır (saniye)
+MIN_REGRESSION_SECONDS = 0.001
+
+def best_of(repeat, run):
+    best = None
+    for _ in range(repeat):
+        elapsed = run()
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+def time_lex(code, repeat):
+    lexer = Lexer(engine='regex')
+    def run():
+        started = time.perf_counter()
+        lexer.tokenize(code)
+        return time.perf_counter() - started
+    return best_of(repeat, run)
+
+def time_parse(code, repeat):
+    tokens = Lexer(engine='regex').tokenize(code)
+    def run():
+        started = time.perf_counter()
+        Parser(tokens).parse()
+        return time.perf_counter() - started
+    return best_of(repeat, run)
+
+def time_keystroke(code, repeat):
+    # Belgenin ortasında bir karakter yazılıp silinmesi: on_key_release'ten durum çubuğu güncellenene kadar
+    app = create_app(code)
+    try:
+        app.on_key_release()
+        app.master.run_until_idle()
+        offset = code.rfind('\n', 0, len(code) // 2) + 1
+        app.text_area.top_line = max(1, code.count('\n', 0, offset) + 1 - app.text_area.visible_lines // 2)
+        def run():
+            started = time.perf_counter()
+            type_and_wait(app, offset, 'z')
+            delete_and_wait(app, offset)
+            return (time.perf_counter() - started) / 2
+        return best_of(repeat, run)
+    finally:
+        app.analysis_worker.stop()
+
+PHASE_TIMERS = {'lex': time_lex, 'parse': time_parse, 'keystroke': time_keystroke}
+
+def run_suite(sizes, repeat, seed=0, phases=PHASES):
+    results = {phase: {} for phase in phases}
+    for size in sizes:
+        code = generate_mixed_program(size, seed=seed)
+        for phase in phases:
+            results[phase][str(size)] = PHASE_TIMERS[phase](code, repeat)
+    return {
+        'python': platform.python_version(),
+        'seed': seed,
+        'repeat': repeat,
+        'results': results,
+    }
+
+def compare(report, baseline, thresholds):
+    # (aşama, boyut, temel, güncel, oran, gerileme mi) satırları; temelde olmayan ölçümler atlanır
+    rows = []
+    for phase, timings in report['results'].items():
+        base_timings = baseline.get('results', {}).get(phase, {})
+        for size, elapsed in timings.items():
+            base = base_timings.get(size)
+            if base is None:
+                continue
+            ratio = elapsed / base if base else float('inf')
+            regressed = ratio > 1 + thresholds[phase] and elapsed - base > MIN_REGRESSION_SECONDS
+            rows.append((phase, size, base, elapsed, ratio, regressed))
+    return rows
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Lexleme, ayrıştırma ve tuş başına analiz hattı için performans kümesi.")
+    arg_parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                            help="Satır sayıları (1000000'a kadar)")
+    arg_parser.add_argument('--phases', nargs='+', choices=PHASES, default=list(PHASES), help="Ölçülecek aşamalar")
+    arg_parser.add_argument('--repeat', type=int, default=3, help="Her ölçüm için tekrar sayısı (en iyisi alınır)")
+    arg_parser.add_argument('--seed', type=int, default=0, help="Sentetik kaynak tohumu")
+    arg_parser.add_argument('--save', help="Sonuçların JSON temel ölçüm olarak yazılacağı dosya")
+    arg_parser.add_argument('--baseline', help="Karşılaştırılacak JSON temel ölçüm dosyası")
+    arg_parser.add_argument('--threshold', type=float, default=None,
+                            help="Tüm aşamalar için izin verilen göreli yavaşlama (ör. 0.2)")
+    args = arg_parser.parse_args(argv)
+
+    report = run_suite(args.sizes, args.repeat, args.seed, args.phases)
+    print(f"{'aşama':>10} {'satır':>8} {'süre (ms)':>12}")
+    for phase, timings in report['results'].items():
+        for size, elapsed in timings.items():
+            print(f"{phase:>10} {size:>8} {elapsed * 1000:>12.3f}")
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=2)
+            file.write('\n')
+
+    if not args.baseline:
+        return 0
+    with open(args.baseline, encoding='utf-8') as file:
+        baseline = json.load(file)
+    thresholds = dict(DEFAULT_THRESHOLDS)
+    if args.threshold is not None:
+        thresholds = {phase: args.threshold for phase in PHASES}
+
+    print(f"\n{'aşama':>10} {'satır':>8} {'temel (ms)':>12} {'güncel (ms)':>12} {'oran':>7}")
+    regressions = 0
+    for phase, size, base, elapsed, ratio, regressed in compare(report, baseline, thresholds):
+        regressions += regressed
+        mark = '  GERİLEME' if regressed else ''
+        print(f"{phase:>10} {size:>8} {base * 1000:>12.3f} {elapsed * 1000:>12.3f} {ratio:>7.2f}{mark}")
+    if regressions:
+        print(f"\n{regressions} ölçüm eşiği aştı.", file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
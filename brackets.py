@@ -0,0 +1,385 @@
+from bisect import bisect_right
+from itertools import accumulate
+
+# Eşleştirilen parantezler ve kapanış karşılıkları
+OPENING_BRACKETS = {'(': ')', '{': '}'}
+CLOSING_BRACKETS = {')': '(', '}': '{'}
+# Gövdesi katlanabilen ifadelerin anahtar kelimeleri
+FOLD_KEYWORDS = {'def', 'if', 'else', 'while', 'for'}
+# Bir parçadaki hedef satır sayısı; parça özetleri üzerindeki ağaç bu kadar satırı tek yaprakta tutar
+CHUNK_SIZE = 64
+# Anahtar kelimeden gövdenin '{' karakterine kadar bakılan en fazla satır
+FOLD_HEADER_LINES = 20
+# Olay içermeyen satır/parçaların en düşük derinliği; aramalarda hiçbir zaman seçilmez
+NO_EVENTS = 1 << 40
+# Her parantezi kabul eden arama sınırı (derinlikler bunun yanında her zaman küçüktür)
+ANY_DEPTH = NO_EVENTS // 2
+
+def line_record(tokens):
+    """
+    Bir satırın token'larından (parantezler, anahtar kelimeler, derinlik farkı, en düşük derinlik).
+    Parantezler (sütun, karakter), anahtar kelimeler (sütun, değer) çiftleridir; en düşük derinlik
+    satır başına göre her parantezden sonraki derinliklerin en küçüğüdür.
+    """
+    brackets = []
+    keywords = []
+    depth = 0
+    lowest = NO_EVENTS
+    for token_type, value, column in tokens:
+        if token_type == 'OPERATOR':
+            if value in OPENING_BRACKETS:
+                depth += 1
+            elif value in CLOSING_BRACKETS:
+                depth -= 1
+                lowest = min(lowest, depth)
+            else:
+                continue
+            brackets.append((column, value))
+            lowest = min(lowest, depth)
+        elif token_type == 'KEYWORD' and value in FOLD_KEYWORDS:
+            keywords.append((column, value))
+    if not brackets and not keywords:
+        return EMPTY_LINE
+    return tuple(brackets), tuple(keywords), depth, lowest
+
+EMPTY_LINE = ((), (), 0, NO_EVENTS)
+
+def _combine(left, right):
+    # İki ardışık bölgenin (derinlik farkı, en düşük derinlik) özetini birleştir
+    return left[0] + right[0], min(left[1], left[0] + right[1])
+
+class _Chunk:
+    # Ardışık satırların kayıtları ve özetleri
+    __slots__ = ('lines', 'summary')
+
+    def __init__(self, lines):
+        self.lines = lines
+        total = 0
+        lowest = NO_EVENTS
+        for record in lines:
+            if record[3] != NO_EVENTS:
+                lowest = min(lowest, total + record[3])
+            total += record[2]
+        self.summary = (total, lowest)
+
+class BracketIndex:
+    """
+    Token akışından çıkarılan parantez eşleşmeleri ve katlama bölgeleri dizini.
+    Parantezler '(' için +1, ')' için -1 olan tek bir derinlik dizisi olarak tutulur; bir açılışın eşi,
+    ondan sonra derinliği açılıştan önceki değere inen ilk parantezdir. Satırlar CHUNK_SIZE civarı
+    parçalara bölünür, parça özetleri (derinlik farkı, en düşük derinlik) bir parça ağacında tutulur;
+    böylece eş arama O(log n + CHUNK_SIZE), bir düzenleme de yalnızca yeniden lexlenen satırların
+    kayıtlarını ve değişen parçaların ağaç yapraklarını günceller.
+    Satırlar 0 tabanlı tutulur; genel yöntemler Tk gibi 1 tabanlı satır, 0 tabanlı sütun kullanır.
+    """
+    def __init__(self):
+        self.chunks = []
+        self.chunk_starts = [] # Her parçanın ilk satırı
+        self.line_count = 0
+        self._size = 1
+        self._tree = [(0, NO_EVENTS)] * 2
+
+    def update(self, lex_state, changed_lines):
+        # tokenize_incremental sonucuyla güncelle: metni değişen ve yeniden lexlenen satırlar yeniden okunur
+        if changed_lines is None:
+            return
+        start, old_end, new_end = lex_state.last_edit
+        first_line, last_line = changed_lines
+        first = min(start, first_line) - 1
+        new_stop = max(new_end - 1, last_line)
+        old_stop = new_stop - (new_end - old_end)
+        records = [line_record(lex_state.line_tokens[index]) for index in range(first, new_stop)]
+        if not self.chunks:
+            self.chunks = [_Chunk([])]
+            self.chunk_starts = [0]
+
+        first_chunk, first_offset = self._locate(first)
+        last_chunk, last_offset = self._locate(old_stop)
+        lines = self.chunks[first_chunk].lines[:first_offset] + records + self.chunks[last_chunk].lines[last_offset:]
+        # Küçülen parça bir sonrakiyle birleştirilir; büyüyen parça eşit boyutlu parçalara bölünür
+        if len(lines) < CHUNK_SIZE // 2 and last_chunk + 1 < len(self.chunks):
+            last_chunk += 1
+            lines += self.chunks[last_chunk].lines
+        pieces = max(1, round(len(lines) / CHUNK_SIZE))
+        step = -(-len(lines) // pieces)
+        new_chunks = [_Chunk(lines[offset:offset + step]) for offset in range(0, len(lines), step)]
+        self.chunks[first_chunk:last_chunk + 1] = new_chunks
+        self._rebuild(first_chunk, last_chunk + 1, len(new_chunks))
+
+    def extend(self, line_tokens, stop):
+        """
+        Aşamalı lexleme için: kesinleşen [line_count, stop) satırlarını dizinin sonuna ekler.
+        Satırlar baştan sona sırayla geldiğinden yalnızca son parça dolar ve yeni parçalar eklenir;
+        ağaçta da yalnızca bu parçaların yaprakları güncellenir.
+        """
+        records = [line_record(line_tokens[index]) for index in range(self.line_count, stop)]
+        if not records:
+            return
+        if not self.chunks:
+            self.chunks = [_Chunk([])]
+        start = len(self.chunks) - 1
+        lines = self.chunks[start].lines + records
+        new_chunks = [_Chunk(lines[offset:offset + CHUNK_SIZE]) for offset in range(0, len(lines), CHUNK_SIZE)]
+        self.chunks[start:] = new_chunks
+        self._rebuild(start, start + 1, len(new_chunks))
+
+    def _rebuild(self, start, old_stop, new_count):
+        # Parça başlangıçlarını yeniden hesapla; sonraki parçalar kaymadıysa (parça sayısı değişmedi
+        # veya sona parça eklendi) yalnızca değişen yapraklar güncellenir
+        self.chunk_starts = list(accumulate((len(chunk.lines) for chunk in self.chunks[:-1]), initial=0))
+        self.line_count = self.chunk_starts[-1] + len(self.chunks[-1].lines)
+        tree = self._tree
+        size = self._size
+        unshifted = new_count == old_stop - start or (start + new_count == len(self.chunks) and new_count > old_stop - start)
+        if unshifted and len(self.chunks) <= size:
+            for index in range(start, start + new_count):
+                position = size + index
+                tree[position] = self.chunks[index].summary
+                position //= 2
+                while position:
+                    tree[position] = _combine(tree[2 * position], tree[2 * position + 1])
+                    position //= 2
+            return
+        size = 1
+        while size < len(self.chunks):
+            size *= 2
+        tree = [(0, NO_EVENTS)] * (2 * size)
+        for index, chunk in enumerate(self.chunks):
+            tree[size + index] = chunk.summary
+        for position in range(size - 1, 0, -1):
+            tree[position] = _combine(tree[2 * position], tree[2 * position + 1])
+        self._size = size
+        self._tree = tree
+
+    def _locate(self, line):
+        # 0 tabanlı satırın (parça, parça içi konum) karşılığı; belge sonu son parçanın sonudur
+        chunk_index = bisect_right(self.chunk_starts, line) - 1
+        return chunk_index, line - self.chunk_starts[chunk_index]
+
+    def _depth_before_chunk(self, chunk_index):
+        tree = self._tree
+        depth = 0
+        position = self._size + chunk_index
+        while position > 1:
+            if position % 2:
+                depth += tree[position - 1][0]
+            position //= 2
+        return depth
+
+    def _line_depth(self, line):
+        # 0 tabanlı satırın başındaki derinlik
+        chunk_index, offset = self._locate(line)
+        lines = self.chunks[chunk_index].lines
+        return self._depth_before_chunk(chunk_index) + sum(record[2] for record in lines[:offset])
+
+    def _find_chunk(self, node, low, high, start, depth, target):
+        # start veya sonrasındaki, en düşük derinliği target'a inen ilk parça: (parça, öncesindeki derinlik)
+        if high <= start:
+            return None
+        total, lowest = self._tree[node]
+        if low >= start and depth + lowest > target:
+            return None
+        if high - low == 1:
+            return low, depth
+        middle = (low + high) // 2
+        found = self._find_chunk(2 * node, low, middle, start, depth, target)
+        if found is not None:
+            return found
+        return self._find_chunk(2 * node + 1, middle, high, start, depth + self._tree[2 * node][0], target)
+
+    def _find_chunk_before(self, node, low, high, end, depth, target):
+        # end'den önceki, en düşük derinliği target'a inen son parça
+        if low >= end:
+            return None
+        total, lowest = self._tree[node]
+        if high <= end and depth + lowest > target:
+            return None
+        if high - low == 1:
+            return low, depth
+        middle = (low + high) // 2
+        found = self._find_chunk_before(2 * node + 1, middle, high, end, depth + self._tree[2 * node][0], target)
+        if found is not None:
+            return found
+        return self._find_chunk_before(2 * node, low, middle, end, depth, target)
+
+    def _first_at_or_below(self, line, index, depth, target):
+        """
+        (line, index) parantezinden sonra, kendisinden sonraki derinlik target veya altında olan ilk
+        parantez: (satır, parantez indeksi). depth, (line, index) parantezinden sonraki derinliktir;
+        index -1 ise satırın başındaki derinlik verilir.
+        """
+        chunk_index, offset = self._locate(line)
+        lines = self.chunks[chunk_index].lines
+        brackets = lines[offset][0]
+        for position in range(index + 1, len(brackets)):
+            depth += 1 if brackets[position][1] in OPENING_BRACKETS else -1
+            if depth <= target:
+                return line, position
+        offset += 1
+        while True:
+            if offset >= len(lines):
+                found = self._find_chunk(1, 0, self._size, chunk_index + 1, 0, target)
+                if found is None:
+                    return None
+                chunk_index, depth = found
+                lines = self.chunks[chunk_index].lines
+                offset = 0
+            record = lines[offset]
+            if record[3] != NO_EVENTS and depth + record[3] <= target:
+                for position, (_, char) in enumerate(record[0]):
+                    depth += 1 if char in OPENING_BRACKETS else -1
+                    if depth <= target:
+                        return self.chunk_starts[chunk_index] + offset, position
+            depth += record[2]
+            offset += 1
+
+    def _last_at_or_below(self, line, index, target):
+        # (line, index) parantezinden önce, kendisinden sonraki derinlik target veya altında olan son parantez
+        chunk_index, offset = self._locate(line)
+        line_depth = self._line_depth(line)
+        found = self._last_in_line(self.chunks[chunk_index].lines[offset], index, line_depth, target)
+        if found is not None:
+            return line, found
+        while True:
+            lines = self.chunks[chunk_index].lines
+            depths = list(accumulate((record[2] for record in lines[:offset]),
+                                     initial=self._depth_before_chunk(chunk_index)))
+            for position in range(offset - 1, -1, -1):
+                record = lines[position]
+                if record[3] != NO_EVENTS and depths[position] + record[3] <= target:
+                    return (self.chunk_starts[chunk_index] + position,
+                            self._last_in_line(record, len(record[0]), depths[position], target))
+            found = self._find_chunk_before(1, 0, self._size, chunk_index, 0, target)
+            if found is None:
+                return None
+            chunk_index = found[0]
+            offset = len(self.chunks[chunk_index].lines)
+
+    def _last_in_line(self, record, index, depth, target):
+        # Satırın ilk index parantezi içinde, sonrasındaki derinlik target veya altında olan son parantez
+        last = None
+        for position, (_, char) in enumerate(record[0][:index]):
+            depth += 1 if char in OPENING_BRACKETS else -1
+            if depth <= target:
+                last = position
+        return last
+
+    def _next_bracket(self, line, index):
+        # (line, index) parantezinden sonraki ilk parantez; index -1 satırın başıdır
+        return self._first_at_or_below(line, index, 0, ANY_DEPTH)
+
+    def _opener_before(self, line, index, target):
+        # (line, index) parantezinden önce derinliği target'tan target + 1'e çıkaran son açılış
+        found = self._last_at_or_below(line, index, target)
+        if found is not None:
+            return self._next_bracket(*found)
+        # Belge başındaki derinlik 0'dır
+        return self._next_bracket(0, -1) if target >= 0 else None
+
+    def _bracket(self, line, index):
+        chunk_index, offset = self._locate(line)
+        return self.chunks[chunk_index].lines[offset][0][index]
+
+    def _partner(self, line, index):
+        # 0 tabanlı satırdaki index. parantezin eşi (satır, indeks); eşleşmiyorsa None
+        chunk_index, offset = self._locate(line)
+        record = self.chunks[chunk_index].lines[offset]
+        char = record[0][index][1]
+        depth = self._line_depth(line)
+        for _, previous in record[0][:index]:
+            depth += 1 if previous in OPENING_BRACKETS else -1
+        if char in OPENING_BRACKETS:
+            found = self._first_at_or_below(line, index, depth + 1, depth)
+            if found is None or self._bracket(*found)[1] != OPENING_BRACKETS[char]:
+                return None
+            return found
+        # Kapanışın eşi: derinliğin kapanıştan sonraki değere indiği son yerden sonraki parantez
+        found = self._opener_before(line, index, depth - 1)
+        if found is None or self._bracket(*found)[1] != CLOSING_BRACKETS[char]:
+            return None
+        return found
+
+    def match(self, line, column):
+        """
+        İmlecin (1 tabanlı satır, sütun) hemen sağındaki, yoksa solundaki parantezin eşi.
+        Dönüş: ((satır, sütun), (satır, sütun)) — önce imleçteki parantez; eşleşme yoksa None.
+        """
+        line -= 1
+        if not 0 <= line < self.line_count:
+            return None
+        chunk_index, offset = self._locate(line)
+        brackets = self.chunks[chunk_index].lines[offset][0]
+        for wanted in (column, column - 1):
+            for index, (bracket_column, _) in enumerate(brackets):
+                if bracket_column == wanted:
+                    partner = self._partner(line, index)
+                    if partner is None:
+                        return None
+                    return (line + 1, bracket_column), (partner[0] + 1, self._bracket(*partner)[0])
+        return None
+
+    def fold_region(self, line):
+        """
+        1 tabanlı satırda başlayan def/if/else/while/for gövdesinin (başlık satırı, '}' satırı) aralığı.
+        Gövde tek satırdaysa veya kapanmamışsa None.
+        """
+        line -= 1
+        if not 0 <= line < self.line_count:
+            return None
+        chunk_index, offset = self._locate(line)
+        record = self.chunks[chunk_index].lines[offset]
+        for keyword_column, _ in record[1]:
+            opener = self._body_opener(line, record, keyword_column)
+            if opener is None:
+                continue
+            partner = self._partner(*opener)
+            if partner is not None and partner[0] > line:
+                return line + 1, partner[0] + 1
+        return None
+
+    def _body_opener(self, line, record, keyword_column):
+        # Anahtar kelimeyle aynı derinlikteki ilk '{'; önce derinlik anahtar kelimenin altına inerse None
+        index = 0
+        while index < len(record[0]) and record[0][index][0] < keyword_column:
+            index += 1
+        position = (line, index - 1)
+        depth = 0
+        while True:
+            position = self._next_bracket(*position)
+            if position is None or position[0] - line > FOLD_HEADER_LINES:
+                return None
+            char = self._bracket(*position)[1]
+            if char == '{' and depth == 0:
+                return position
+            depth += 1 if char in OPENING_BRACKETS else -1
+            if depth < 0:
+                return None
+
+    def enclosing_fold(self, line):
+        # 1 tabanlı satırı içeren en içteki çok satırlı '{ }' bloğunun ('{' satırı, '}' satırı) aralığı
+        line -= 1
+        if not 0 <= line < self.line_count:
+            return None
+        position = (line, 0)
+        depth = self._line_depth(line)
+        while True:
+            opener = self._opener_before(*position, depth - 1)
+            if opener is None:
+                return None
+            if self._bracket(*opener)[1] == '{':
+                partner = self._partner(*opener)
+                if partner is not None and partner[0] > opener[0]:
+                    return opener[0] + 1, partner[0] + 1
+            position = opener
+            depth -= 1
+
+    def fold_regions(self):
+        # Tüm katlama bölgeleri, başlık satırına göre sıralı (belge boyunca bir geçiş)
+        regions = []
+        for chunk_index, chunk in enumerate(self.chunks):
+            for offset, record in enumerate(chunk.lines):
+                if record[1]:
+                    region = self.fold_region(self.chunk_starts[chunk_index] + offset + 1)
+                    if region is not None:
+                        regions.append(region)
+        return regions
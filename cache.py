@@ -0,0 +1,221 @@
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+
+from lexer import Lexer
+from parser import Parser, ParserError, SKIPPED_TOKEN_TYPES, parse_with_recovery
+
+# Lexer veya AST biçimi değiştiğinde artırılır; eski disk kayıtları böylece hiç eşleşmez
+CACHE_VERSION = 2
+# Bellekteki LRU'nun boyut sınırı, kayıtların ağırlıkları toplamı olarak (yaklaşık token sayısı).
+# Ağırlık token listeleri ve bloklar için token, AST'ler için üst düzey ifade sayısıdır; böylece
+# büyük bir belgenin binlerce bloğu, kayıt sayısı sınırında olacağı gibi birbirini dışarı atmaz.
+DEFAULT_MAX_SIZE = 4000000
+# Kendi bloğunu oluşturan üst düzey ifadelerin anahtar kelimeleri
+BLOCK_KEYWORDS = {'if', 'while', 'for', 'def'}
+
+def content_key(namespace, content, grammar=None):
+    # İçeriğin (metin veya bayt) özetinden, ad alanı ve önbellek sürümüyle birlikte anahtar üret.
+    # Metinden üretilen kayıtlarda (token'lar, AST) gramer de verilir; tanımı değişince eski kayıtlar eşleşmez
+    if isinstance(content, str):
+        content = content.encode('utf-8', 'surrogatepass')
+    salt = bytes.fromhex(grammar.digest) if grammar is not None else b''
+    digest = hashlib.blake2b(content, digest_size=16, person=f'v{CACHE_VERSION}'.encode(), salt=salt).hexdigest()
+    return f'{namespace}:{digest}'
+
+def block_key(tokens):
+    # Blok anahtarı yalnızca token tip/değerlerine bağlıdır; boşluk ve konum değişiklikleri anahtarı bozmaz
+    return content_key('block', '\x1f'.join(f'{token.type}\x1e{token.value}' for token in tokens))
+
+def top_level_blocks(tokens):
+    """
+    Anlamlı token'ları üst düzeydeki if/while/for/def ifadelerinin başından bloklara böler.
+    Bölme noktasında parantez derinliği sıfırdır ve önceki ifade bakış token'ı olarak bir anahtar
+    kelimeyi gördüğünde farklı davranmaz ('return' hariç); bu yüzden blokların ayrı ayrı
+    ayrıştırılmasıyla elde edilen ifadeler tüm belgenin ayrıştırılmasıyla aynıdır.
+    Eşleşmeyen bir kapanış varsa (belge '}' ile erken biter) None döner.
+    """
+    blocks = []
+    start = 0
+    depth = 0
+    previous = None
+    for index, token in enumerate(tokens):
+        if token.type == 'OPERATOR':
+            if token.value in ('(', '{'):
+                depth += 1
+            elif token.value in (')', '}'):
+                depth -= 1
+                if depth < 0:
+                    return None
+        elif token.type == 'KEYWORD' and token.value in BLOCK_KEYWORDS and depth == 0 and index > start:
+            if not (previous.type == 'KEYWORD' and previous.value == 'return'):
+                blocks.append(tokens[start:index])
+                start = index
+        previous = token
+    if start < len(tokens):
+        blocks.append(tokens[start:])
+    return blocks
+
+def ast_weight(result):
+    # (AST, hatalar) çiftinin ağırlığı: üst düzey ifade sayısı (ifadelerin kendileri bloklarla paylaşılır)
+    ast = result[0]
+    return len(ast['statements']) + 1 if ast is not None else 1
+
+class AnalysisCache:
+    """
+    Lexer.tokenize ve Parser.parse önünde, içerik özetiyle anahtarlanan önbellek.
+    Belge düzeyinde token listeleri ve (AST, hatalar) çiftleri, üst düzey bloklar için de ifade listeleri
+    tutulur; böylece geri alma, yapıştırıp geri alma veya aynı dosyayı yeniden açma analiz gerektirmez,
+    kısmen değişmiş bir belgede de yalnızca değişen bloklar ayrıştırılır.
+    Bellekte boyutu sınırlı bir LRU, isteğe bağlı olarak da yeniden başlatmalardan sonra kalan bir disk
+    deposu kullanılır. Önbellekten dönen token ve AST nesneleri paylaşılır, değiştirilmemelidir.
+    """
+    def __init__(self, lexer=None, max_size=DEFAULT_MAX_SIZE, directory=None):
+        self.lexer = lexer or Lexer(engine='regex')
+        self.max_size = max_size
+        self.directory = directory # None ise yalnızca bellekte tutulur
+        self._entries = OrderedDict() # anahtar -> (değer, ağırlık)
+        self.size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.disk_hits = 0
+        self.disk_writes = 0
+
+    def stats(self):
+        return {
+            'entries': len(self._entries),
+            'size': self.size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'disk_hits': self.disk_hits,
+            'disk_writes': self.disk_writes,
+        }
+
+    def get(self, key):
+        # Önce bellek, sonra disk; bulunamazsa None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+        loaded = self._load(key)
+        with self._lock:
+            if loaded is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.disk_hits += 1
+            self._remember(key, *loaded)
+        return loaded[0]
+
+    def put(self, key, value, weight=1):
+        with self._lock:
+            self._remember(key, value, weight)
+        self._store(key, (value, weight))
+
+    def clear(self):
+        # Yalnızca bellekteki kayıtları siler; disk deposu korunur
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def _remember(self, key, value, weight):
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self.size -= previous[1]
+        self._entries[key] = (value, weight)
+        self.size += weight
+        # Sınırı tek başına aşan kayıt da tutulur; yerine gelen ilk kayıtla birlikte dışarı atılır
+        while self.size > self.max_size and len(self._entries) > 1:
+            _, (_, evicted_weight) = self._entries.popitem(last=False)
+            self.size -= evicted_weight
+            self.evictions += 1
+
+    def _path(self, key):
+        namespace, digest = key.split(':', 1)
+        return os.path.join(self.directory, namespace, digest[:2], digest + '.pickle')
+
+    def _load(self, key):
+        if self.directory is None:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as file:
+                return pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # Bozuk, eski veya okunamayan (ör. özyineleme sınırını aşan) kayıt: yok say, sonraki yazmada üzerine yazılsın
+            return None
+
+    def _store(self, key, value):
+        if self.directory is None:
+            return
+        path = self._path(key)
+        temporary = None
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Aynı dizini paylaşan süreçler yarım yazılmış bir dosya görmesin diye geçici dosya + yeniden adlandırma
+            descriptor, temporary = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+            with os.fdopen(descriptor, 'wb') as file:
+                pickle.dump(value, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary, path)
+            temporary = None
+        except Exception:
+            # Yazılamayan kayıt (disk, izin veya pickle'ın özyineleme sınırını aşan derin bir AST) yalnızca bellekte kalır
+            return
+        finally:
+            if temporary is not None:
+                try:
+                    os.remove(temporary)
+                except OSError:
+                    pass
+        with self._lock:
+            self.disk_writes += 1
+
+    def tokenize(self, code):
+        key = content_key('tokens', code, self.lexer.grammar)
+        tokens = self.get(key)
+        if tokens is None:
+            tokens = self.lexer.tokenize(code)
+            self.put(key, tokens, len(tokens))
+        return tokens
+
+    def parse(self, code, tokens=None):
+        # (AST, ParserError listesi); hata varsa AST kısmidir. Token'lar verilmezse tokenize ile (önbellekten) alınır
+        key = content_key('ast', code, self.lexer.grammar)
+        result = self.get(key)
+        if result is None:
+            if tokens is None:
+                tokens = self.tokenize(code)
+            result = self._parse_blocks([token for token in tokens if token.type not in SKIPPED_TOKEN_TYPES])
+            self.put(key, result, ast_weight(result))
+        return result
+
+    def _parse_blocks(self, tokens):
+        blocks = top_level_blocks(tokens)
+        if blocks is None:
+            return self._parse_whole(tokens)
+        statements = []
+        for block in blocks:
+            key = block_key(block)
+            block_statements = self.get(key)
+            if block_statements is None:
+                try:
+                    block_statements = Parser(block).parse()['statements']
+                except ParserError:
+                    # Hataların konumları ve mesajları tüm belgenin kurtarma kipinde ayrıştırılmasından alınır
+                    return self._parse_whole(tokens)
+                self.put(key, block_statements, len(block))
+            statements.extend(block_statements)
+        return {'type': 'Program', 'statements': statements}, []
+
+    def _parse_whole(self, tokens):
+        return parse_with_recovery(tokens)
@@ -0,0 +1,67 @@
+import codecs
+import io
+import mmap
+import os
+import shutil
+import tempfile
+
+# Büyük dosya açılırken bir seferde çözülüp metin alanına eklenen bayt sayısı
+LOAD_CHUNK_SIZE = 1 << 16
+
+class MappedTextReader:
+    """
+    Dosyayı mmap ile eşleyip çözülmüş metin parçaları halinde veren okuyucu. Dosyanın tamamı hiçbir zaman
+    tek bir bayt veya metin nesnesine okunmaz; parçalar sırayla çözülür, '\\r\\n' ve '\\r' satır sonları
+    (parça sınırında bölünse bile) '\\n'e çevrilir. Görülen satır sonu biçimi kaydederken geri yazılmak üzere
+    newline'da tutulur. Okunan bayt sayısı (offset) ve dosya boyutu (size) ilerleme göstermek içindir.
+    """
+    def __init__(self, path, encoding='utf-8', chunk_size=LOAD_CHUNK_SIZE):
+        self.path = path
+        self.encoding = encoding
+        self.chunk_size = chunk_size
+        self.size = os.path.getsize(path)
+        self.offset = 0
+        self.newline = '\n'
+        self._chunks = self._read()
+
+    def __iter__(self):
+        return self._chunks
+
+    def close(self):
+        # Okuma yarıda bırakılırsa eşleme ve dosya hemen kapatılır
+        self._chunks.close()
+
+    def _read(self):
+        decoder = io.IncrementalNewlineDecoder(codecs.getincrementaldecoder(self.encoding)(), translate=True)
+        with open(self.path, 'rb') as file:
+            if self.size == 0:
+                return # Boş bir dosya eşlenemez
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                for offset in range(0, len(mapped), self.chunk_size):
+                    text = decoder.decode(mapped[offset:offset + self.chunk_size])
+                    self.offset = min(offset + self.chunk_size, len(mapped))
+                    if text:
+                        yield text
+        text = decoder.decode(b'', final=True)
+        if text:
+            yield text
+        newlines = decoder.newlines
+        if newlines == '\r\n' or (isinstance(newlines, tuple) and '\r\n' in newlines):
+            self.newline = '\r\n'
+
+def write_text(path, text, encoding='utf-8', newline='\n'):
+    # Geçici dosyaya yazıp yeniden adlandırarak kaydeder; yazma yarıda kalırsa eski dosya bozulmaz
+    directory = os.path.dirname(os.path.abspath(path))
+    descriptor, temporary = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(descriptor, 'w', encoding=encoding, newline=newline) as file:
+            file.write(text)
+        if os.path.exists(path):
+            shutil.copymode(path, temporary) # mkstemp'in 0600 izinleri dosyanın izinlerinin yerine geçmesin
+        os.replace(temporary, path)
+    except BaseException:
+        try:
+            os.remove(temporary)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,271 @@
+import hashlib
+import json
+import os
+import re
+import sys
+import tempfile
+import zlib
+
+# Derlenmiş tablolar re modülünün iç arayüzleriyle üretilip yüklenir. _sre.compile, re._compiler ve re._parser
+# CPython'un özel arayüzleridir; sürümler arasında haber verilmeden değişebilir veya başka yorumlayıcılarda
+# bulunmayabilir. Bu yüzden re.compile'a geri dönüş zorunludur: arayüzler yoksa veya beklenen biçimde değilse
+# desenler re.compile ile derlenir (tablo dosyası kullanılmaz).
+try:
+    import _sre
+    try:
+        from re import _compiler as sre_compiler, _parser as sre_parser
+    except ImportError: # Python 3.11 öncesi
+        import sre_compile as sre_compiler
+        import sre_parse as sre_parser
+except ImportError:
+    _sre = sre_compiler = sre_parser = None
+
+# Derlenmiş tablo dosyasının biçimi değiştiğinde artırılır
+GRAMMAR_CACHE_VERSION = 2
+# Derlenmiş tabloların tanım dosyasının yanına yazıldığı dosyanın uzantısı (dil.grammar -> dil.grammarc)
+COMPILED_SUFFIX = 'c'
+# Projenin kendi dilinin tanımı
+DEFAULT_GRAMMAR_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'grammars', 'dil.grammar')
+
+# Vurgulama renkleri: projenin dilindeki tipler sabit renklerle, başka gramerlerin tanımladığı tipler ise
+# adlarından (süreçten bağımsız bir özetle) seçilen bir palet rengiyle gösterilir
+TOKEN_COLORS = {
+    'KEYWORD': 'blue',
+    'OPERATOR': 'red',
+    'NUMBER': 'purple',
+    'IDENTIFIER': 'black',
+    'COMMENT': 'green',
+    'MULTI_LINE_COMMENT': 'green',
+    'UNKNOWN': 'gray',
+    'FLOAT': 'orange',
+    'STRING': 'brown',
+}
+EXTRA_COLORS = ('darkcyan', 'darkgoldenrod', 'darkmagenta', 'sienna', 'teal', 'navy', 'olive', 'crimson')
+# Vurgulanmayan token tipleri
+UNSTYLED_TOKEN_TYPES = frozenset(('WHITESPACE',))
+
+class GrammarError(ValueError):
+    pass
+
+class Grammar:
+    """
+    Bir dilin token tanımları ve derlenmiş tarayıcı desenleri.
+    token_types (tip, desen) çiftlerini öncelik sırasıyla tutar; master_pattern bunların isimli grup
+    alternasyonudur (regex motoru), token_patterns tek tek derlenmiş desenlerdir (döngü motoru).
+    delimiters, açılış/kapanış verilen çok satırlı tipler için (tip, açılış, kapanış) üçlüleridir.
+    kinds TokenStream'deki tip kodlarının sırasıdır (UNKNOWN her zaman bulunur).
+    """
+    def __init__(self, name, token_types, multi_line_types, delimiters, digest):
+        self.name = name
+        self.token_types = token_types
+        self.multi_line_types = frozenset(multi_line_types)
+        self.delimiters = delimiters
+        self.digest = digest
+        kinds = [token_type for token_type, _ in token_types]
+        if 'UNKNOWN' not in kinds:
+            kinds.append('UNKNOWN')
+        self.kinds = tuple(kinds)
+        self.master_source = '|'.join(f'(?P<{token_type}>{pattern})' for token_type, pattern in token_types)
+        self.master_pattern = None
+        self.token_patterns = None
+
+    def __repr__(self):
+        return f"Grammar(name='{self.name}', token_types={len(self.token_types)})"
+
+    def compile(self):
+        # Desenleri derler ve _sre'ye verilen tabloları döndürür (bkz. _compile_tables). İç arayüz kullanılamazsa
+        # desenler re.compile ile derlenir ve None döner; bu durumda saklanacak tablo yoktur.
+        try:
+            token_tables = []
+            for token_type, pattern in self.token_types:
+                try:
+                    token_tables.append(_compile_tables(pattern))
+                except re.error as e:
+                    raise GrammarError(f"{self.name}: '{token_type}' deseni geçersiz: {e}") from None
+            master_tables = _compile_tables(self.master_source)
+            self._load_tables(master_tables, token_tables)
+            return master_tables, token_tables
+        except GrammarError:
+            raise
+        except Exception:
+            self._compile_patterns()
+            return None
+
+    def _compile_patterns(self):
+        # Yalnızca genel re arayüzüyle derleme; iç arayüz değiştiğinde veya tablolar yüklenemediğinde kullanılır
+        token_patterns = []
+        for token_type, pattern in self.token_types:
+            try:
+                token_patterns.append((token_type, re.compile(pattern)))
+            except re.error as e:
+                raise GrammarError(f"{self.name}: '{token_type}' deseni geçersiz: {e}") from None
+        self.master_pattern = re.compile(self.master_source)
+        self.token_patterns = token_patterns
+
+    def _load_tables(self, master_tables, token_tables):
+        self.master_pattern = _sre.compile(self.master_source, *master_tables)
+        self.token_patterns = [
+            (token_type, _sre.compile(pattern, *tables))
+            for (token_type, pattern), tables in zip(self.token_types, token_tables)
+        ]
+
+def _compile_tables(pattern):
+    """
+    Deseni re.compile'ın yaptığı gibi ayrıştırıp derler ve _sre.compile argümanlarını döndürür:
+    (bayraklar, kod, grup sayısı, grup adı -> indeks, indeks -> grup adı). Yavaş olan kısım saf Python
+    ayrıştırıcı ve derleyicidir; tablolar diskte saklanınca sonraki açılışlarda yalnızca _sre.compile çağrılır.
+    """
+    if sre_parser is None:
+        raise RuntimeError("re modülünün iç arayüzleri bulunamadı")
+    parsed = sre_parser.parse(pattern, 0)
+    code = sre_compiler._code(parsed, 0)
+    groupindex = dict(parsed.state.groupdict)
+    indexgroup = [None] * parsed.state.groups
+    for group_name, index in groupindex.items():
+        indexgroup[index] = group_name
+    # İşlem kodları int alt sınıfı sabitlerdir; tablolar düz tamsayılarla saklanır
+    return int(parsed.state.flags), list(map(int, code)), parsed.state.groups - 1, groupindex, tuple(indexgroup)
+
+def token_colors(grammar, known=TOKEN_COLORS, palette=EXTRA_COLORS):
+    # Gramerin vurgulanan token tipleri -> renk, tanım sırasıyla (UNKNOWN dahil). known'da None olan tip
+    # varsayılan renkte bırakılır; known'da olmayan tiplere paletten bir renk verilir.
+    return {
+        token_type: known[token_type] if token_type in known else palette[zlib.crc32(token_type.encode()) % len(palette)]
+        for token_type in grammar.kinds if token_type not in UNSTYLED_TOKEN_TYPES
+    }
+
+def parse_grammar(text, source='<grammar>'):
+    """
+    Tanım metnini Grammar'a çevirir (desenler henüz derlenmez). Biçim için grammars/dil.grammar'a bakınız:
+    '#' ile başlayan satırlar yorum, '@name' ve '@multiline' yönergedir, diğer satırlar 'TİP desen'dir.
+    """
+    digest = grammar_digest(text.encode('utf-8'))
+    name = os.path.splitext(os.path.basename(source))[0]
+    token_types = []
+    multi_line = {}
+    for line_number, line in enumerate(text.splitlines(), 1):
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        fields = line.split(None, 1)
+        if len(fields) < 2 and fields[0] != '@multiline':
+            raise GrammarError(f"{source}:{line_number}: '{fields[0]}' için desen veya değer eksik")
+        if fields[0] == '@name':
+            name = fields[1].strip()
+        elif fields[0] == '@multiline':
+            arguments = line.split()[1:]
+            if len(arguments) not in (1, 3):
+                raise GrammarError(f"{source}:{line_number}: @multiline bir tip ve isteğe bağlı açılış/kapanış bekler")
+            multi_line[arguments[0]] = tuple(arguments[1:])
+        elif fields[0].startswith('@'):
+            raise GrammarError(f"{source}:{line_number}: bilinmeyen yönerge '{fields[0]}'")
+        else:
+            token_type, pattern = fields[0], fields[1].strip()
+            if not token_type.isidentifier():
+                raise GrammarError(f"{source}:{line_number}: geçersiz token tipi '{token_type}'")
+            if any(token_type == existing for existing, _ in token_types):
+                raise GrammarError(f"{source}:{line_number}: '{token_type}' tipi birden fazla tanımlanmış")
+            token_types.append((token_type, pattern))
+    if not token_types:
+        raise GrammarError(f"{source}: hiç token tipi tanımlanmamış")
+    defined = {token_type for token_type, _ in token_types}
+    for token_type in multi_line:
+        if token_type not in defined:
+            raise GrammarError(f"{source}: @multiline tipi '{token_type}' tanımlanmamış")
+    delimiters = tuple((token_type, *pair) for token_type, pair in multi_line.items() if pair)
+    return Grammar(name, token_types, multi_line, delimiters, digest)
+
+def grammar_digest(definition):
+    # Tanım dosyasının özeti; tablo dosyası ve analiz önbelleği anahtarları tanım değişince geçersiz olur
+    return hashlib.blake2b(definition, digest_size=16, person=b'grammar').hexdigest()
+
+def _runtime():
+    # Tabloları üreten Python ve _sre sürümü; sürüm değişince tablolar yeniden derlenir
+    return f'{GRAMMAR_CACHE_VERSION}:{sys.version}:{getattr(_sre, "MAGIC", None)}'
+
+# Bu süreçte yüklenmiş gramerler: (yol, özet) -> Grammar; dil değiştirirken tekrar derlenmez
+_loaded = {}
+
+def load_grammar(path, use_cache=True):
+    """
+    Tanım dosyasını okuyup derlenmiş Grammar döndürür. Derlenmiş tablolar dosyanın yanına (dil.grammarc)
+    yazılır; tanımın özeti aynı kaldıkça sonraki açılışlarda desenler ayrıştırılıp derlenmez.
+    Tablo dosyası okunamıyor, yüklenemiyor veya yazılamıyorsa (salt okunur dizin, bozuk dosya, farklı
+    yorumlayıcı) desenler yeniden derlenir ve gramer yine de kullanılır.
+    """
+    path = os.path.abspath(path)
+    with open(path, 'rb') as file:
+        definition = file.read()
+    digest = grammar_digest(definition)
+    grammar = _loaded.get((path, digest))
+    if grammar is not None:
+        return grammar
+    try:
+        text = definition.decode('utf-8')
+    except UnicodeDecodeError as e:
+        raise GrammarError(f"{path}: UTF-8 değil: {e}") from None
+    compiled_path = path + COMPILED_SUFFIX
+    cached = _read_compiled(compiled_path, digest) if use_cache else None
+    if cached is not None:
+        try:
+            name, token_types, multi_line_types, delimiters, master_tables, token_tables = cached
+            grammar = Grammar(name, token_types, multi_line_types, delimiters, digest)
+            grammar._load_tables(master_tables, token_tables)
+        except Exception:
+            grammar = None # Uyumsuz tablolar: tanımdan yeniden derlenip üzerine yazılır
+    if grammar is None:
+        grammar = parse_grammar(text, path)
+        tables = grammar.compile()
+        if use_cache and tables is not None:
+            _write_compiled(compiled_path, digest, (
+                grammar.name, grammar.token_types, sorted(grammar.multi_line_types), grammar.delimiters, *tables,
+            ))
+    _loaded[(path, digest)] = grammar
+    return grammar
+
+def default_grammar():
+    return load_grammar(DEFAULT_GRAMMAR_FILE)
+
+def _read_compiled(path, digest):
+    # Tablo dosyası JSON'dur: ilk satır [özet, çalışma ortamı], kalanı tablolar. Başka biri tarafından
+    # bırakılmış olabileceğinden tablolar yalnızca ilk satır bu tanım ve bu yorumlayıcıyla eşleşirse okunur.
+    try:
+        with open(path, 'r', encoding='utf-8') as file:
+            if json.loads(file.readline()) != [digest, _runtime()]:
+                return None
+            name, token_types, multi_line_types, delimiters, master_tables, token_tables = json.loads(file.read())
+        return (
+            name, [tuple(token_type) for token_type in token_types], multi_line_types,
+            tuple(tuple(delimiter) for delimiter in delimiters),
+            _tables_from_json(master_tables), [_tables_from_json(tables) for tables in token_tables],
+        )
+    except FileNotFoundError:
+        return None
+    except Exception:
+        return None # Bozuk, eski biçimde veya okunamayan tablo dosyası: yeniden derlenip üzerine yazılır
+
+def _tables_from_json(tables):
+    # JSON demetleri listeye, sözlük anahtarlarını dizgeye çevirir; _sre.compile indexgroup için demet bekler
+    flags, code, groups, groupindex, indexgroup = tables
+    return flags, code, groups, groupindex, tuple(indexgroup)
+
+def _write_compiled(path, digest, value):
+    # Aynı dosyayı açan süreçler yarım yazılmış tablo görmesin diye geçici dosya + yeniden adlandırma
+    try:
+        descriptor, temporary = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    except OSError:
+        return # Salt okunur dizin: tablolar yalnızca bu süreçte kullanılır
+    try:
+        with os.fdopen(descriptor, 'w', encoding='utf-8') as file:
+            file.write(json.dumps([digest, _runtime()]) + '\n')
+            json.dump(value, file, separators=(',', ':'))
+        os.replace(temporary, path)
+        temporary = None
+    except (OSError, TypeError, ValueError):
+        pass # Tablolar yalnızca bu süreçte kullanılır
+    finally:
+        if temporary is not None:
+            try:
+                os.remove(temporary)
+            except OSError:
+                pass
@@ -0,0 +1,66 @@
+import tkinter as tk
+from tkinter import font as tkfont
+
+class LineNumberGutter(tk.Canvas):
+    """
+    Yalnızca görünür satırların numaralarını çizen satır numarası şeridi.
+    Metin öğeleri bir havuzda tutulur ve yeniden çizimde silinip oluşturulmak yerine
+    yeniden etiketlenip taşınır. Satır sayısı ve görünür alan değişmediyse hiçbir şey yapılmaz.
+    """
+    def __init__(self, master, text_widget, font=("Consolas", 12), padx=3, foreground="gray", **kwargs):
+        kwargs.setdefault("highlightthickness", 0)
+        kwargs.setdefault("borderwidth", 0)
+        super().__init__(master, **kwargs)
+        self.text_widget = text_widget
+        self.font = tkfont.Font(font=font)
+        self.padx = padx
+        self.foreground = foreground
+        self._items = [] # Yeniden kullanılan canvas metin öğeleri
+        self._last_view = None
+        self._digits = 0
+        self.bind("<Configure>", lambda event: self.redraw(force=True))
+
+    def redraw(self, force=False):
+        # Görünür alanın anahtarı: ilk ve son görünür karakter, satır sayısı ve yükseklik
+        height = self.text_widget.winfo_height()
+        first_index = self.text_widget.index("@0,0")
+        last_index = self.text_widget.index(f"@0,{height}")
+        line_count = int(self.text_widget.index("end-1c").split('.')[0])
+        view = (first_index, last_index, line_count, height)
+        if view == self._last_view and not force:
+            return False
+        self._last_view = view
+
+        self._update_width(line_count)
+        x = self.winfo_width() - self.padx
+        # dlineinfo koordinatları Text penceresine göredir, şeridin koordinatlarına çevir
+        y_offset = self.text_widget.winfo_rooty() - self.winfo_rooty()
+
+        used = 0
+        first_line = int(first_index.split('.')[0])
+        last_line = int(last_index.split('.')[0])
+        for line_number in range(first_line, last_line + 1):
+            line_info = self.text_widget.dlineinfo(f"{line_number}.0")
+            if line_info is None:
+                continue # Satır başı görünür alanın dışında (kaydırılmış uzun satır)
+            y = line_info[1] + y_offset
+            if used < len(self._items):
+                item = self._items[used]
+                self.coords(item, x, y)
+                self.itemconfigure(item, text=str(line_number), state="normal")
+            else:
+                item = self.create_text(x, y, anchor="ne", text=str(line_number),
+                                        font=self.font, fill=self.foreground)
+                self._items.append(item)
+            used += 1
+
+        # Kullanılmayan öğeleri sil yerine gizle
+        for item in self._items[used:]:
+            self.itemconfigure(item, state="hidden")
+        return True
+
+    def _update_width(self, line_count):
+        digits = max(len(str(line_count)), 3)
+        if digits != self._digits:
+            self._digits = digits
+            self.config(width=self.font.measure("9" * digits) + 2 * self.padx)
@@ -1,4 +1,9 @@
-import re
+import codecs
+from array import array
+from bisect import bisect_right
+from itertools import accumulate, islice
+
+from grammar import default_grammar
 
 class Token:
     def __init__(self, type, value, start, end, line=None, column=None):
@@ -12,33 +17,267 @@ class Token:
     def __repr__(self):
         return f"Token(type='{self.type}', value='{self.value}', start={self.start}, end={self.end}, line={self.line}, column={self.column})"
 
+# Dilimizin token tanımları grammars/dil.grammar'dadır; derlenmiş desenler dosyanın yanında saklanır
+DEFAULT_GRAMMAR = default_grammar()
+
 # Dilimize ait tüm token tipleri
-TOKEN_TYPES = {
-    'KEYWORD': r'\b(if|else|while|for|def|return|in|range)\b',
-    'OPERATOR': r'(\=\=|\!\=|\<\=|\>\=|\+\=|\-\=|\*\=|\/\=|\+|\-|\*|\/|\=|\>|\<|\(|\)|\{|\}|,)',
-    'FLOAT': r'\b\d+\.\d+\b',
-    'NUMBER': r'\b\d+\b',
-    'STRING': r'"[^"]*"',
-    'IDENTIFIER': r'\b[a-zA-Z_][a-zA-Z0-9_]*\b',
-    'MULTI_LINE_COMMENT': r'/\*[\s\S]*?\*/',
-    'COMMENT': r'#.*',
-    'WHITESPACE': r'\s+',
-    'UNKNOWN': r'.' 
-}
+TOKEN_TYPES = dict(DEFAULT_GRAMMAR.token_types)
+
+# Token tiplerinin işlenme sırası önemlidir
+ORDERED_TOKEN_TYPES = [token_type for token_type, _ in DEFAULT_GRAMMAR.token_types]
+
+# Birden fazla satıra yayılabilen token tipleri (satır/sütun takibi için)
+MULTI_LINE_TOKEN_TYPES = tuple(token_type for token_type in ORDERED_TOKEN_TYPES if token_type in DEFAULT_GRAMMAR.multi_line_types)
+
+# Metin veya listeleri karşılaştırırken kullanılan blok boyutu (eleman)
+COMPARE_BLOCK_SIZE = 4096
+
+def common_prefix_length(left, right):
+    # Önce blok blok, sonra farklı bloğun içinde ikili arama ile ortak önek uzunluğunu bul
+    limit = min(len(left), len(right))
+    low = 0
+    while low + COMPARE_BLOCK_SIZE <= limit and left[low:low + COMPARE_BLOCK_SIZE] == right[low:low + COMPARE_BLOCK_SIZE]:
+        low += COMPARE_BLOCK_SIZE
+    high = min(low + COMPARE_BLOCK_SIZE, limit)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if left[low:middle] == right[low:middle]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+def common_suffix_length(left, right, limit):
+    # common_prefix_length'in sondan başa çalışan karşılığı; sonuç limit'i aşmaz
+    left_end = len(left)
+    right_end = len(right)
+    low = 0
+    while low + COMPARE_BLOCK_SIZE <= limit and \
+          left[left_end - low - COMPARE_BLOCK_SIZE:left_end - low] == right[right_end - low - COMPARE_BLOCK_SIZE:right_end - low]:
+        low += COMPARE_BLOCK_SIZE
+    high = min(low + COMPARE_BLOCK_SIZE, limit)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if left[left_end - middle:left_end - low] == right[right_end - middle:right_end - low]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+# iter_tokens'ın dosya veya mmap kaynağından bir seferde okuduğu karakter/bayt sayısı
+STREAM_CHUNK_SIZE = 1 << 16
+
+# Bir eşleşmenin kesinleşmesi için arkasında tamponda bulunması gereken karakter sayısı.
+# '\b' sınırı bir, '12.' gibi FLOAT denemesinden NUMBER'a düşüş iki karakter ileriye bakar.
+STREAM_LOOKAHEAD = 2
+# Aşamalı lexlemede bir adımda işlenen token sayısı (yaklaşık bir-iki milisaniyelik iş)
+PROGRESSIVE_STEP_TOKENS = 1000
+
+# Kullanılabilir tarayıcı motorları
+LEXER_ENGINES = ('loop', 'regex')
+
+# TokenStream içinde token tipleri küçük tamsayılar olarak, gramerin kinds sırasıyla saklanır
+TOKEN_KINDS = DEFAULT_GRAMMAR.kinds
+TOKEN_KIND_CODES = {token_type: code for code, token_type in enumerate(TOKEN_KINDS)}
+
+class TokenView:
+    """TokenStream içindeki bir token'a Token ile aynı özniteliklerle erişen hafif görünüm."""
+    __slots__ = ('stream', 'index')
+
+    def __init__(self, stream, index):
+        self.stream = stream
+        self.index = index
+
+    @property
+    def type(self):
+        return self.stream.kind_names[self.stream.kinds[self.index]]
+
+    @property
+    def value(self):
+        return self.stream.code[self.stream.starts[self.index]:self.stream.ends[self.index]]
+
+    @property
+    def start(self):
+        return self.stream.starts[self.index]
+
+    @property
+    def end(self):
+        return self.stream.ends[self.index]
+
+    @property
+    def line(self):
+        return self.stream.lines[self.index]
+
+    @property
+    def column(self):
+        return self.stream.columns[self.index]
+
+    def __repr__(self):
+        return f"Token(type='{self.type}', value='{self.value}', start={self.start}, end={self.end}, line={self.line}, column={self.column})"
+
+class TokenStream:
+    """
+    Token'ları nesne başına değil sütun başına saklayan kap: tipler bytearray'de,
+    konumlar array sütunlarında tutulur, değerler gerektiğinde kaynak metinden kesilir.
+    """
+    def __init__(self, code, kind_names=TOKEN_KINDS):
+        self.code = code
+        self.kind_names = kind_names
+        self.kind_codes = {token_type: code for code, token_type in enumerate(kind_names)}
+        self.kinds = bytearray()
+        self.starts = array('q')
+        self.ends = array('q')
+        self.lines = array('q')
+        self.columns = array('q')
+
+    def append(self, token_type, start, end, line, column):
+        self.kinds.append(self.kind_codes[token_type])
+        self.starts.append(start)
+        self.ends.append(end)
+        self.lines.append(line)
+        self.columns.append(column)
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self.kinds)
+        if not 0 <= index < len(self.kinds):
+            raise IndexError("token indeksi aralık dışında")
+        return TokenView(self, index)
+
+    def __iter__(self):
+        for index in range(len(self.kinds)):
+            yield TokenView(self, index)
+
+    def without(self, skipped_types):
+        # Verilen tipleri (ör. yorumlar) içermeyen yeni bir akış
+        skipped_codes = {self.kind_codes[token_type] for token_type in skipped_types if token_type in self.kind_codes}
+        stream = TokenStream(self.code, self.kind_names)
+        for index, kind in enumerate(self.kinds):
+            if kind not in skipped_codes:
+                stream.kinds.append(kind)
+                stream.starts.append(self.starts[index])
+                stream.ends.append(self.ends[index])
+                stream.lines.append(self.lines[index])
+                stream.columns.append(self.columns[index])
+        return stream
+
+class LineTokenSequence:
+    """
+    LexerState satır tablosu üzerinde tembel Token dizisi: token'lar yalnızca erişildiğinde oluşturulur.
+    Satır başına token sayılarının birikimli toplamı ile indeks, satıra ikili aramayla eşlenir.
+    """
+    def __init__(self, lex_state):
+        self.lex_state = lex_state
+        self.line_ends = list(accumulate(map(len, lex_state.line_tokens)))
+        self._line_offsets = None
+
+    def __len__(self):
+        return self.line_ends[-1] if self.line_ends else 0
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("token indeksi aralık dışında")
+        line_index = bisect_right(self.line_ends, index)
+        first_index = self.line_ends[line_index - 1] if line_index else 0
+        token_type, value, column = self.lex_state.line_tokens[line_index][index - first_index]
+        if self._line_offsets is None:
+            self._line_offsets = list(accumulate(map(len, self.lex_state.code.split('\n')), initial=0))
+        start = self._line_offsets[line_index] + line_index + column
+        return Token(token_type, value, start, start + len(value), line_index + 1, column)
+
+class LexerState:
+    """
+    Artımlı lexleme için satır bazlı kontrol noktaları.
+    Her satır için o satırda başlayan token'lar (tip, değer, sütun) ve satır başında
+    açık kalan çok satırlı token tipi (yorum/string içinde değilse None) tutulur.
+    """
+    def __init__(self, grammar=DEFAULT_GRAMMAR):
+        self.grammar = grammar
+        self.code = ''
+        self.line_tokens = []
+        self.line_states = []
+        # Gramerin açılış/kapanışlı her çok satırlı tipi için kapanmamış açılış (ör. '"', '/*') içeren
+        # satırlar; sonradan eklenen bir kapanış onları token'a çevirebilir
+        self.open_flags = [bytearray() for _ in grammar.delimiters]
+        # Son güncellemede metni değişen satırlar (bkz. Lexer.tokenize_incremental)
+        self.last_edit = None
+
+    def snapshot(self):
+        # Başka bir iş parçacığına verilebilecek bağımsız kopya (satır token listeleri değişmez, paylaşılır)
+        copy = LexerState(self.grammar)
+        copy.code = self.code
+        copy.line_tokens = list(self.line_tokens)
+        copy.line_states = list(self.line_states)
+        copy.open_flags = [bytearray(flags) for flags in self.open_flags]
+        copy.last_edit = self.last_edit
+        return copy
+
+    def token_stream(self, skipped_types=()):
+        # Satır tablosundan TokenStream üret; skipped_types içindeki tipler atlanır
+        stream = TokenStream(self.code, self.grammar.kinds)
+        kind_codes = stream.kind_codes
+        kinds = stream.kinds
+        starts, ends, lines, columns = stream.starts, stream.ends, stream.lines, stream.columns
+        offset = 0
+        for line_number, (line_text, line_tokens) in enumerate(zip(self.code.split('\n'), self.line_tokens), 1):
+            for token_type, value, column in line_tokens:
+                if token_type in skipped_types:
+                    continue
+                start = offset + column
+                kinds.append(kind_codes[token_type])
+                starts.append(start)
+                ends.append(start + len(value))
+                lines.append(line_number)
+                columns.append(column)
+            offset += len(line_text) + 1
+        return stream
+
+    def token_sequence(self):
+        # Token'ları önceden oluşturmadan indekslenebilen tembel dizi
+        return LineTokenSequence(self)
+
+    def tokens(self):
+        # Satır tablosundan mutlak konumlu Token listesini üret
+        result = []
+        append = result.append
+        offset = 0
+        for line_number, (line_text, line_tokens) in enumerate(zip(self.code.split('\n'), self.line_tokens), 1):
+            for token_type, value, column in line_tokens:
+                start = offset + column
+                append(Token(token_type, value, start, start + len(value), line_number, column))
+            offset += len(line_text) + 1
+        return result
 
 class Lexer:
-    def __init__(self):
-        self.token_patterns = []
-        # Token tiplerinin işlenme sırası önemlidir
-        ordered_token_types = [
-            'KEYWORD', 'OPERATOR', 'FLOAT', 'NUMBER', 'STRING', 
-            'IDENTIFIER', 'COMMENT', 'WHITESPACE', 'UNKNOWN'
-        ]
-        for token_type in ordered_token_types:
-            pattern = TOKEN_TYPES[token_type]
-            self.token_patterns.append((token_type, re.compile(pattern)))
+    def __init__(self, engine='loop', grammar=None):
+        # grammar: grammar.load_grammar ile yüklenmiş bir dil tanımı; verilmezse projenin dili
+        if engine not in LEXER_ENGINES:
+            raise ValueError(f"Bilinmeyen lexer motoru: '{engine}' (seçenekler: {', '.join(LEXER_ENGINES)})")
+        self.engine = engine
+        self.grammar = grammar or DEFAULT_GRAMMAR
+        self.multi_line_types = self.grammar.multi_line_types
+        # Desenler gramer yüklenirken bir kez derlenir (ya da diskteki tablolardan kurulur)
+        self.token_patterns = self.grammar.token_patterns
+
+        # Tüm desenler sırası korunarak tek bir isimli grup alternasyonunda birleştirilir.
+        # Alternasyon dalları soldan sağa denendiği için eşleşme sonucu döngü motoruyla aynıdır.
+        self.master_pattern = self.grammar.master_pattern
+        # Açılış karakteri -> (bayrak indeksi, açılış, tip); kapanmamış açılışlar satır bayraklarına işlenir
+        self._openers = {}
+        for index, (delimited_type, opener, closer) in enumerate(self.grammar.delimiters):
+            self._openers.setdefault(opener[0], []).append((index, opener, delimited_type))
 
     def tokenize(self, code):
+        if self.engine == 'regex':
+            return self.tokenize_master(code)
+        return self.tokenize_loop(code)
+
+    def tokenize_loop(self, code):
         tokens = []
         position = 0
         line = 1
@@ -54,35 +293,23 @@ class Lexer:
                 if match:
                     value = match.group(0)
 
-                    # Boşluk ve yorumları işleme mantığı
-                    if token_type == 'WHITESPACE':
-                        new_lines_found = value.count('\n')
-                        if new_lines_found > 0:
-                            line += new_lines_found
-                            last_newline_index = value.rfind('\n')
-                            column = len(value) - last_newline_index - 1
-                        else:
-                            column += len(value)
-                        
-                        position = match.end()
-                        match_found = True
-                        break # Anlamlı bir token değil, atla ve devam et
-                    elif token_type == 'COMMENT' or token_type== 'MULTI_LINE_COMMENT':
-                        new_lines_found = value.count('\n')
-                        if new_lines_found > 0:
-                            line += new_lines_found
-                            last_newline_index = value.rfind('\n')
-                            column = len(value) - last_newline_index - 1
-                        else:
-                            column += len(value)
+                    # Satır ve sütun bilgisini token'ın içerdiği satır sonlarına göre güncelle
+                    new_lines_found = value.count('\n')
+                    if new_lines_found > 0:
+                        line += new_lines_found
+                        last_newline_index = value.rfind('\n')
+                        column = len(value) - last_newline_index - 1
                     else:
-                        # Anlamlı token'ı ekle
+                        column += len(value)
+                    position = match.end()
+                    match_found = True
+
+                    # Boşluklar anlamlı bir token değil, atla ve devam et
+                    if token_type != 'WHITESPACE':
+                        # Yorumlar da token olarak eklenir; vurgulayıcı onları renklendirir, parser atlar
                         tokens.append(Token(token_type, value, match.start(), match.end(), 
                                              token_start_line, token_start_column))
-                        column += len(value)
-                        position = match.end()
-                        match_found = True
-                        break
+                    break
             
             if not match_found:
                 # Hiçbir desene uymayan karakter, UNKNOWN olarak işaretle
@@ -92,3 +319,318 @@ class Lexer:
                 column += 1
         return tokens
 
+    def tokenize_master(self, code):
+        # Tek geçişli tarayıcı: her token için birleşik desende yalnızca bir eşleşme denemesi yapılır
+        tokens = []
+        append = tokens.append
+        multi_line_types = self.multi_line_types
+        position = 0
+        line = 1
+        line_start = 0
+
+        for match in self.master_pattern.finditer(code):
+            start = match.start()
+            if start != position:
+                # Hiçbir desene uymayan karakterler atlandıysa UNKNOWN olarak işaretle
+                for index in range(position, start):
+                    append(Token('UNKNOWN', code[index], index, index + 1, line, index - line_start))
+            token_type = match.lastgroup
+            end = match.end()
+            position = end
+
+            if token_type in multi_line_types:
+                value = match.group()
+                new_lines_found = value.count('\n')
+                if token_type == 'WHITESPACE':
+                    if new_lines_found:
+                        line += new_lines_found
+                        line_start = start + value.rfind('\n') + 1
+                    continue
+                append(Token(token_type, value, start, end, line, start - line_start))
+                if new_lines_found:
+                    line += new_lines_found
+                    line_start = start + value.rfind('\n') + 1
+            else:
+                append(Token(token_type, match.group(), start, end, line, start - line_start))
+
+        if position < len(code):
+            for index in range(position, len(code)):
+                append(Token('UNKNOWN', code[index], index, index + 1, line, index - line_start))
+        return tokens
+
+    def tokenize_stream(self, code):
+        # tokenize_master ile aynı token'ları nesne oluşturmadan sütunlu bir TokenStream'e yazar
+        stream = TokenStream(code, self.grammar.kinds)
+        kinds = stream.kinds
+        starts, ends, lines, columns = stream.starts, stream.ends, stream.lines, stream.columns
+        kind_codes = stream.kind_codes
+        multi_line_types = self.multi_line_types
+        unknown = kind_codes['UNKNOWN']
+        position = 0
+        line = 1
+        line_start = 0
+
+        for match in self.master_pattern.finditer(code):
+            start = match.start()
+            if start != position:
+                for index in range(position, start):
+                    kinds.append(unknown)
+                    starts.append(index)
+                    ends.append(index + 1)
+                    lines.append(line)
+                    columns.append(index - line_start)
+            token_type = match.lastgroup
+            end = match.end()
+            position = end
+
+            if token_type != 'WHITESPACE':
+                kinds.append(kind_codes[token_type])
+                starts.append(start)
+                ends.append(end)
+                lines.append(line)
+                columns.append(start - line_start)
+            if token_type in multi_line_types:
+                new_lines_found = code.count('\n', start, end)
+                if new_lines_found:
+                    line += new_lines_found
+                    line_start = code.rfind('\n', start, end) + 1
+
+        for index in range(position, len(code)):
+            kinds.append(unknown)
+            starts.append(index)
+            ends.append(index + 1)
+            lines.append(line)
+            columns.append(index - line_start)
+        return stream
+
+    def iter_tokens(self, source, chunk_size=STREAM_CHUNK_SIZE, encoding='utf-8'):
+        """
+        Kaynağı parça parça okuyarak tokenize ile aynı token'ları (satır/sütun ve konumlar dahil) üretir.
+        source bir metin, metin/ikili dosya nesnesi veya mmap olabilir; baytlar encoding ile çözülür.
+        Tampon yalnızca okunmuş fakat henüz kesinleşmemiş kısmı tutar; bellek kullanımı dosya boyutuna
+        değil, parça boyutuna ve en uzun token'a bağlıdır. (Hiç kapanmayan bir '"' veya '/*' ise
+        kapanışı aranırken dosya sonuna kadar tamponda kalır; tokenize'daki geri düşüş de böyledir.)
+        """
+        if isinstance(source, str):
+            chunks = iter((source,))
+            def read(size):
+                return next(chunks, '')
+        else:
+            decoder = None
+            def read(size):
+                nonlocal decoder
+                while True:
+                    data = source.read(size)
+                    if isinstance(data, str):
+                        return data
+                    if decoder is None:
+                        decoder = codecs.getincrementaldecoder(encoding)()
+                    text = decoder.decode(data, final=not data)
+                    # Parça çok baytlı bir karakterin ortasında bittiyse boş metin kaynağın sonu sayılmamalı
+                    if text or not data:
+                        return text
+
+        master_pattern = self.master_pattern
+        multi_line_types = self.multi_line_types
+        openers = self._openers
+        buffer = ''
+        base = 0 # buffer[0]'ın kaynaktaki konumu
+        scan = 0 # Taranacak ilk konum (buffer içinde); öncesindeki karakter '\b' için tutulur
+        line = 1
+        line_start = 0
+        eof = False
+        while True:
+            if not eof:
+                # Kesinleşmeyen bir token tamponu dolduruyorsa okuma boyutu büyütülür (doğrusal toplam maliyet)
+                chunk = read(max(chunk_size, len(buffer) - scan))
+                if chunk:
+                    buffer += chunk
+                else:
+                    eof = True
+            position = scan
+            limit = len(buffer) - STREAM_LOOKAHEAD
+            for match in master_pattern.finditer(buffer, scan):
+                start, end = match.span()
+                token_type = match.lastgroup
+                if not eof and (end > limit or (buffer[start] in openers and self._needs_more_input(buffer, start, token_type))):
+                    break
+                for index in range(position, start):
+                    yield Token('UNKNOWN', buffer[index], base + index, base + index + 1, line, base + index - line_start)
+                position = end
+                value = match.group()
+                if token_type != 'WHITESPACE':
+                    yield Token(token_type, value, base + start, base + end, line, base + start - line_start)
+                if token_type in multi_line_types:
+                    new_lines_found = value.count('\n')
+                    if new_lines_found:
+                        line += new_lines_found
+                        line_start = base + start + value.rfind('\n') + 1
+            if eof:
+                for index in range(position, len(buffer)):
+                    yield Token('UNKNOWN', buffer[index], base + index, base + index + 1, line, base + index - line_start)
+                return
+            keep = max(position - 1, 0)
+            buffer = buffer[keep:]
+            base += keep
+            scan = position - keep
+
+    def _needs_more_input(self, buffer, start, token_type):
+        # Tamponda kapanışı olmayan bir çok satırlı token açılışı (ör. '"', '/*') sonraki parçada kapanabilir
+        for index, opener, delimited_type in self._openers[buffer[start]]:
+            if token_type != delimited_type and buffer.startswith(opener, start):
+                return True
+        return False
+
+    def tokenize_incremental(self, code, state=None):
+        """
+        Kodu önceki LexerState'e göre günceller; yalnızca düzenlenen satırlardan başlayıp
+        satır başı durumu eski akışla yeniden eşleşene kadar tarar.
+        Dönüş: (state, (ilk_satır, son_satır)) — yeniden taranan satırlar 1 tabanlı ve kapsayıcıdır,
+        metin değişmediyse aralık None olur.
+        """
+        if state is None or not state.line_tokens:
+            state = LexerState(self.grammar)
+            line_count = code.count('\n') + 1
+            last_line = self._relex(code, state, 0, 0, line_count, 0)
+            state.code = code
+            state.last_edit = (1, 1, line_count + 1)
+            return state, (1, last_line)
+
+        old_code = state.code
+        if old_code == code:
+            return state, None
+
+        # Değişen karakter aralığını bul ve satır numaralarına çevir
+        prefix_length = common_prefix_length(old_code, code)
+        shorter_length = min(len(old_code), len(code))
+        full_suffix_length = common_suffix_length(old_code, code, shorter_length)
+        suffix_length = min(full_suffix_length, shorter_length - prefix_length)
+        changed_end_offset = len(code) - suffix_length
+        changed_lines = code.count('\n', prefix_length, changed_end_offset)
+        delta = changed_lines - old_code.count('\n', prefix_length, len(old_code) - suffix_length)
+        restart = code.count('\n', 0, prefix_length)
+        restart_offset = code.rfind('\n', 0, prefix_length) + 1
+        changed_end = restart + changed_lines + 1
+        # Metni değişen satırlar: (başlangıç, eski bitiş, yeni bitiş), 1 tabanlı [başlangıç, bitiş).
+        # Tekrarlanan metin eklenip silindiğinde düzenlemenin gerçek yeri belirsizdir
+        # (ör. "a" satırından önce "a\n" yapıştırmak); bu durumda olası en erken konumdan başlanır.
+        edit_start_offset = min(prefix_length, shorter_length - full_suffix_length)
+        edit_start = restart - code.count('\n', edit_start_offset, prefix_length)
+        state.last_edit = (edit_start + 1, changed_end + 1 - delta, changed_end + 1)
+
+        # Yeni eklenen bir kapanış, daha önce kapanmamış bir '"' veya '/*' ile eşleşebilir
+        changed_text_end = code.find('\n', changed_end_offset)
+        if changed_text_end < 0:
+            changed_text_end = len(code)
+        changed_text = code[restart_offset:changed_text_end]
+        open_line = edit_start # Belirsiz düzenleme yeri de yeniden taranır
+        for flags, (delimited_type, opener, closer) in zip(state.open_flags, self.grammar.delimiters):
+            if closer in changed_text:
+                flagged_line = flags.find(1)
+                if 0 <= flagged_line < open_line:
+                    open_line = flagged_line
+        # Çok satırlı bir token'ın ortasından başlamamak için temiz bir satır başına geri git
+        while restart > 0 and (restart > open_line or state.line_states[restart] is not None):
+            restart -= 1
+            restart_offset = code.rfind('\n', 0, restart_offset - 1) + 1
+
+        last_line = self._relex(code, state, restart, restart_offset, changed_end, delta)
+        state.code = code
+        return state, (restart + 1, last_line)
+
+    def tokenize_progressive(self, code, step_tokens=PROGRESSIVE_STEP_TOKENS):
+        """
+        Kodu baştan, her adımda en fazla step_tokens token işleyerek lexleyen üreteç; büyük bir belgenin
+        taranması arayüz iş parçacığında küçük dilimlere bölünebilsin diye.
+        Her adımda (durum, tamamlanan satır sayısı) verir: ara durumların yalnızca ilk o kadar satırı
+        (line_tokens/line_states) kesindir ve etiketlemede kullanılabilir. Son adımda tamamlanan satır
+        sayısı belgenin satır sayısına eşittir ve durum tokenize_incremental'a verilebilir.
+        """
+        state = LexerState(self.grammar)
+        line_count = code.count('\n') + 1
+        partial = LexerState(self.grammar)
+        for step in self._relex_steps(code, state, 0, 0, line_count, 0, step_tokens):
+            if isinstance(step, int):
+                break
+            partial.line_tokens, partial.line_states = step
+            yield partial, len(partial.line_tokens) - 1
+        state.code = code
+        state.last_edit = (1, 1, line_count + 1)
+        yield state, line_count
+
+    def _relex(self, code, state, restart, restart_offset, changed_end, delta):
+        # restart satırından itibaren tarar; changed_end sonrasında eski akışla aynı temiz satır başına
+        # ulaşıldığında durur ve eski satır kayıtlarını kaydırarak birleştirir. Son taranan satırı döndürür.
+        for stop_line in self._relex_steps(code, state, restart, restart_offset, changed_end, delta):
+            pass
+        return stop_line
+
+    def _relex_steps(self, code, state, restart, restart_offset, changed_end, delta, step_tokens=None):
+        # _relex'in üreteç hali: step_tokens verilirse her step_tokens eşleşmede bir kez durup o ana kadarki
+        # (line_tokens, line_states) çalışma listelerini verir; en sonda birleştirir ve son taranan satırı verir
+        line = restart
+        line_start = restart_offset
+        position = restart_offset
+        old_states = state.line_states
+        old_count = len(old_states)
+        line_tokens = [[]]
+        line_states = [None]
+        open_flags = [bytearray(1) for _ in state.open_flags]
+        openers = self._openers
+        multi_line_types = self.multi_line_types
+        stop_line = None
+
+        matches = self.master_pattern.finditer(code, position)
+        while True:
+            for match in islice(matches, step_tokens):
+                start = match.start()
+                if start != position:
+                    for index in range(position, start):
+                        line_tokens[-1].append(('UNKNOWN', code[index], index - line_start))
+                token_type = match.lastgroup
+                value = match.group()
+                position = match.end()
+
+                if token_type != 'WHITESPACE':
+                    line_tokens[-1].append((token_type, value, start - line_start))
+                    candidates = openers.get(value[:1])
+                    if candidates is not None:
+                        for index, opener, delimited_type in candidates:
+                            if token_type != delimited_type and code.startswith(opener, start):
+                                open_flags[index][-1] = 1
+
+                if token_type in multi_line_types:
+                    new_lines_found = value.count('\n')
+                    if not new_lines_found:
+                        continue
+                    inner_state = None if token_type == 'WHITESPACE' else token_type
+                    for _ in range(new_lines_found):
+                        line += 1
+                        # Temiz bir satır başında eski akışla eşleşme varsa taramayı bitir
+                        if inner_state is None and line >= changed_end:
+                            old_line = line - delta
+                            if old_line < old_count and old_states[old_line] is None:
+                                stop_line = line
+                                break
+                        line_tokens.append([])
+                        line_states.append(inner_state)
+                        for flags in open_flags:
+                            flags.append(0)
+                    if stop_line is not None:
+                        break
+                    line_start = start + value.rfind('\n') + 1
+            # Her karakter bir desenle eşleştiğinden metnin sonuna gelindiyse eşleşme kalmamıştır
+            if step_tokens is None or stop_line is not None or position >= len(code):
+                break
+            yield line_tokens, line_states
+
+        if stop_line is None:
+            old_stop = old_count
+            stop_line = line + 1
+        else:
+            old_stop = stop_line - delta
+        state.line_tokens[restart:old_stop] = line_tokens
+        state.line_states[restart:old_stop] = line_states
+        for flags, new_flags in zip(state.open_flags, open_flags):
+            flags[restart:old_stop] = new_flags
+        yield stop_line
@@ -0,0 +1,439 @@
+import json
+import sys
+import threading
+
+from lexer import Lexer
+from parser import IncrementalParser, ParserError, ParseCancelled, parse_with_recovery
+
+# publishDiagnostics'in son değişiklikten sonra bekleme süresi (s)
+DIAGNOSTICS_DELAY = 0.2
+DIAGNOSTICS_SOURCE = "gercekZamanliSozdizimi"
+
+# Anlamsal token göstergesi: token tiplerimizin LSP standart tiplerine karşılığı (UNKNOWN gönderilmez)
+SEMANTIC_TOKEN_LEGEND = ['keyword', 'operator', 'number', 'string', 'variable', 'comment']
+SEMANTIC_TOKEN_TYPES = {
+    'KEYWORD': 0,
+    'OPERATOR': 1,
+    'NUMBER': 2,
+    'FLOAT': 2,
+    'STRING': 3,
+    'IDENTIFIER': 4,
+    'COMMENT': 5,
+    'MULTI_LINE_COMMENT': 5,
+}
+# Anlamsal token verisinde her token'ı oluşturan tamsayı sayısı
+SEMANTIC_TOKEN_SIZE = 5
+
+# JSON-RPC hata kodları
+PARSE_ERROR = -32700
+METHOD_NOT_FOUND = -32601
+INVALID_REQUEST = -32600
+INTERNAL_ERROR = -32603
+
+# LSP tanı önem dereceleri
+SEVERITY_ERROR = 1
+SEVERITY_WARNING = 2
+
+def read_message(stream):
+    # Content-Length başlıklı bir JSON-RPC iletisi oku; akış bittiyse None
+    content_length = None
+    while True:
+        line = stream.readline()
+        if not line:
+            return None
+        line = line.strip()
+        if not line:
+            if content_length is None:
+                continue
+            break
+        name, _, value = line.decode('ascii').partition(':')
+        if name.strip().lower() == 'content-length':
+            content_length = int(value)
+    return json.loads(stream.read(content_length).decode('utf-8'))
+
+def write_message(stream, message):
+    body = json.dumps(message, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    stream.write(f"Content-Length: {len(body)}\r\n\r\n".encode('ascii') + body)
+    stream.flush()
+
+def unit_length(text, encoding):
+    # Metnin istemcinin konum kodlamasındaki uzunluğu (utf-16 kod birimi veya kod noktası)
+    if encoding == 'utf-32' or text.isascii():
+        return len(text)
+    return len(text.encode('utf-16-le')) // 2
+
+def to_column(line_text, character, encoding):
+    # LSP karakter konumunu satırdaki kod noktası indeksine çevir
+    if encoding == 'utf-32' or line_text.isascii():
+        return min(character, len(line_text))
+    units = 0
+    for index, char in enumerate(line_text):
+        if units >= character:
+            return index
+        units += 2 if ord(char) > 0xFFFF else 1
+    return len(line_text)
+
+class Document:
+    """
+    Açık bir belgenin satırları, artımlı lexer durumu ve anlamsal token dizisi.
+    Dizi satır satır kodlanır ve bir düzenlemede yalnızca yeniden lexlenen satırların parçası yerine
+    konur; son gönderilen sonuçtan beri değişen aralık da izlenir, böylece delta yanıtı
+    belgenin boyutundan bağımsız üretilir.
+    """
+    def __init__(self, uri, text, version, lexer, encoding):
+        self.uri = uri
+        self.version = version
+        self.encoding = encoding
+        self.lexer = lexer
+        self.lines = text.split('\n')
+        self.lex_state = None
+        self.line_data = [] # Satır başına kodlanmış token'lar; ilk token'ın satır farkı 0 tutulur
+        self.data = [] # Tüm belgenin anlamsal token dizisi
+        self.result_id = None
+        self._sent_length = 0
+        self._changed_start = None # Gönderilen sonuçtan beri değişen aralık: başlangıç ve değişmeyen son ek
+        self._unchanged_suffix = 0
+        self.parser = IncrementalParser()
+        self.parse_lock = threading.Lock()
+        self.relex()
+
+    def text(self):
+        return '\n'.join(self.lines)
+
+    def apply_change(self, change):
+        if 'range' not in change:
+            self.lines = change['text'].split('\n')
+            return
+        start = change['range']['start']
+        end = change['range']['end']
+        start_line = min(start['line'], len(self.lines) - 1)
+        end_line = min(end['line'], len(self.lines) - 1)
+        start_column = to_column(self.lines[start_line], start['character'], self.encoding)
+        end_column = to_column(self.lines[end_line], end['character'], self.encoding)
+        if end['line'] >= len(self.lines):
+            end_column = len(self.lines[end_line])
+        replaced = self.lines[start_line][:start_column] + change['text'] + self.lines[end_line][end_column:]
+        self.lines[start_line:end_line + 1] = replaced.split('\n')
+
+    def relex(self):
+        self.lex_state, changed_lines = self.lexer.tokenize_incremental(self.text(), self.lex_state)
+        if changed_lines is None:
+            return
+        # Metni değişen ve yeniden lexlenen satırlar birlikte yeniden kodlanır; sonrası yalnızca kayar
+        start, old_end, new_end = self.lex_state.last_edit
+        first_line, last_line = changed_lines
+        first = min(start, first_line) - 1
+        new_stop = max(new_end - 1, last_line)
+        old_stop = new_stop - (new_end - old_end)
+
+        line_data = self.line_data
+        data = self.data
+        offset = sum(map(len, line_data[:first]))
+        old_length = sum(map(len, line_data[first:old_stop]))
+        line_data[first:old_stop] = [self._encode_line(index) for index in range(first, new_stop)]
+
+        # Satır farkları bölgeden önceki son dolu satıra göre yeniden yazılır
+        previous_line = first - 1
+        while previous_line >= 0 and not line_data[previous_line]:
+            previous_line -= 1
+        previous_line = max(previous_line, 0)
+        region = []
+        for index in range(first, new_stop):
+            encoded = line_data[index]
+            if encoded:
+                position = len(region)
+                region.extend(encoded)
+                region[position] = index - previous_line
+                previous_line = index
+        # Bölgeden sonraki ilk token'ın satır farkı da değişebilir; o token da değişen aralığa katılır
+        next_line = new_stop
+        while next_line < len(line_data) and not line_data[next_line]:
+            next_line += 1
+        if next_line < len(line_data):
+            following = line_data[next_line][:SEMANTIC_TOKEN_SIZE]
+            following[0] = next_line - previous_line
+            region.extend(following)
+            old_length += SEMANTIC_TOKEN_SIZE
+
+        old_total = len(data)
+        data[offset:offset + old_length] = region
+        suffix = old_total - offset - old_length
+        if self._changed_start is None:
+            self._changed_start = offset
+            self._unchanged_suffix = suffix
+        else:
+            self._changed_start = min(self._changed_start, offset)
+            self._unchanged_suffix = min(self._unchanged_suffix, suffix)
+
+    def mark_sent(self, result_id):
+        # Gönderilen sonuç delta isteklerinin temeli olur
+        self.result_id = result_id
+        self._sent_length = len(self.data)
+        self._changed_start = None
+
+    def semantic_token_edits(self):
+        # Son gönderilen sonuca göre tek düzenleme; değişiklik yoksa boş liste
+        if self._changed_start is None:
+            return []
+        start = self._changed_start
+        suffix = self._unchanged_suffix
+        return [{
+            'start': start,
+            'deleteCount': self._sent_length - start - suffix,
+            'data': self.data[start:len(self.data) - suffix],
+        }]
+
+    def _encode_line(self, index):
+        # Satırdaki parçalar: (başlangıç sütunu, uzunluk, tip); çok satırlı token'lar satır satır bölünür
+        pieces = []
+        line_tokens = self.lex_state.line_tokens
+        if self.lex_state.line_states[index] is not None:
+            start_line = index - 1
+            while not line_tokens[start_line]:
+                start_line -= 1
+            token_type, value, column = line_tokens[start_line][-1]
+            if token_type in SEMANTIC_TOKEN_TYPES:
+                segment = value.split('\n')[index - start_line]
+                pieces.append((0, segment, SEMANTIC_TOKEN_TYPES[token_type]))
+        for token_type, value, column in line_tokens[index]:
+            token_index = SEMANTIC_TOKEN_TYPES.get(token_type)
+            if token_index is not None:
+                pieces.append((column, value.split('\n', 1)[0], token_index))
+
+        encoded = []
+        line_text = self.lines[index] if index < len(self.lines) else ''
+        ascii_line = self.encoding == 'utf-32' or line_text.isascii()
+        previous = 0
+        for column, segment, token_index in pieces:
+            if not segment:
+                continue
+            start = column if ascii_line else unit_length(line_text[:column], self.encoding)
+            encoded.extend((0, start - previous, unit_length(segment, self.encoding), token_index, 0))
+            previous = start
+        return encoded
+
+    def diagnostics(self, lex_state, lines, cancel_event):
+        # Anlık görüntüyü ayrıştırır; UNKNOWN token'lar uyarı, ayrıştırma hatası hata olarak döner
+        diagnostics = []
+        for line_index, tokens in enumerate(lex_state.line_tokens):
+            for token_type, value, column in tokens:
+                if token_type == 'UNKNOWN':
+                    diagnostics.append(self._diagnostic(lines, line_index, column, len(value), SEVERITY_WARNING,
+                                                        f"Tanınmayan karakter: '{value}'"))
+        errors = []
+        with self.parse_lock:
+            try:
+                self.parser.parse_state(lex_state, cancel_event)
+                if self.parser.current_token is not None:
+                    raise ParserError("Eşi olmayan '}' bulundu.", self.parser.current_token)
+            except ParserError:
+                # Artımlı ayrıştırıcı ilk hatada durur; tüm hatalar kurtarma kipindeki tek bir ayrıştırmadan alınır
+                errors = parse_with_recovery(lex_state.tokens(), cancel_event)[1]
+        for error in errors:
+            token = error.token
+            if token is not None:
+                length = len(token.value.split('\n', 1)[0])
+                diagnostics.append(self._diagnostic(lines, token.line - 1, token.column, length, SEVERITY_ERROR, str(error)))
+            else:
+                last = len(lines) - 1
+                diagnostics.append(self._diagnostic(lines, last, len(lines[last]), 0, SEVERITY_ERROR, str(error)))
+        return diagnostics
+
+    def _diagnostic(self, lines, line_index, column, length, severity, message):
+        line_text = lines[line_index] if line_index < len(lines) else ''
+        start = unit_length(line_text[:column], self.encoding)
+        end = start + unit_length(line_text[column:column + length], self.encoding)
+        return {
+            'range': {'start': {'line': line_index, 'character': start}, 'end': {'line': line_index, 'character': end}},
+            'severity': severity,
+            'source': DIAGNOSTICS_SOURCE,
+            'message': message,
+        }
+
+class LanguageServer:
+    """
+    Lexer ve Parser üzerine kurulu, stdio üzerinden konuşan bir LSP sunucusu.
+    Belgeler artımlı (didChange aralıklarıyla) eşitlenir; anlamsal token'lar tam dizi veya önceki
+    sonuca göre düzenleme (delta) olarak gönderilir; tanılar son değişiklikten DIAGNOSTICS_DELAY
+    sonra arka planda ayrıştırılıp yayınlanır. Akışlar verilerek aynı süreç içinden de sürülebilir.
+    """
+    def __init__(self, input_stream, output_stream, diagnostics_delay=DIAGNOSTICS_DELAY):
+        self.input_stream = input_stream
+        self.output_stream = output_stream
+        self.diagnostics_delay = diagnostics_delay
+        self.lexer = Lexer(engine='regex')
+        self.documents = {}
+        self.encoding = 'utf-16'
+        self.shutdown_requested = False
+        self._write_lock = threading.Lock()
+        self._timers = {} # uri -> (threading.Timer, iptal olayı)
+        self._next_result_id = 0
+        self.handlers = {
+            'initialize': self.initialize,
+            'initialized': lambda params: None,
+            'shutdown': self.shutdown,
+            'textDocument/didOpen': self.did_open,
+            'textDocument/didChange': self.did_change,
+            'textDocument/didClose': self.did_close,
+            'textDocument/semanticTokens/full': self.semantic_tokens_full,
+            'textDocument/semanticTokens/full/delta': self.semantic_tokens_delta,
+        }
+
+    def send(self, message):
+        with self._write_lock:
+            write_message(self.output_stream, message)
+
+    def serve(self):
+        # exit bildirimi veya akış sonuna kadar iletileri işle; çıkış kodunu döndür
+        while True:
+            try:
+                message = read_message(self.input_stream)
+            except ValueError as e:
+                # Geçersiz JSON veya başlık: gövde okunduğundan sonraki iletiyle devam edilebilir
+                self.send_error(None, PARSE_ERROR, f"İleti çözülemedi: {e}")
+                continue
+            if message is None:
+                break
+            if isinstance(message, dict) and message.get('method') == 'exit':
+                break
+            self.handle(message)
+        for timer, cancel_event in self._timers.values():
+            timer.cancel()
+            cancel_event.set()
+        return 0 if self.shutdown_requested else 1
+
+    def handle(self, message):
+        if not isinstance(message, dict):
+            self.send_error(None, INVALID_REQUEST, "İleti bir JSON nesnesi değil")
+            return
+        method = message.get('method')
+        handler = self.handlers.get(method)
+        is_request = 'id' in message
+        if handler is None:
+            if is_request:
+                self.send_error(message['id'], METHOD_NOT_FOUND, f"Desteklenmeyen yöntem: {method}")
+            return
+        # Bozuk bir ileti veya işleyicideki bir hata sunucuyu durdurmaz; isteklere hata yanıtı döner
+        try:
+            result = handler(message.get('params') or {})
+        except (KeyError, TypeError, AttributeError) as e:
+            self.report_failure(message, INVALID_REQUEST, f"Geçersiz parametreler ({method}): {type(e).__name__}: {e}")
+            return
+        except Exception as e:
+            self.report_failure(message, INTERNAL_ERROR, f"İç hata ({method}): {type(e).__name__}: {e}")
+            return
+        if is_request:
+            self.send({'jsonrpc': '2.0', 'id': message['id'], 'result': result})
+
+    def send_error(self, request_id, code, text):
+        self.send({'jsonrpc': '2.0', 'id': request_id, 'error': {'code': code, 'message': text}})
+
+    def report_failure(self, message, code, text):
+        # Bildirimlere yanıt gönderilemez; hata stderr'e yazılır (stdout protokole ayrılmıştır)
+        if 'id' in message:
+            self.send_error(message['id'], code, text)
+        else:
+            print(text, file=sys.stderr)
+
+    def initialize(self, params):
+        encodings = params.get('capabilities', {}).get('general', {}).get('positionEncodings', [])
+        # Kod noktası konumları Python dizinleriyle aynıdır; istemci desteklemiyorsa utf-16'ya çevrilir
+        self.encoding = 'utf-32' if 'utf-32' in encodings else 'utf-16'
+        return {
+            'capabilities': {
+                'positionEncoding': self.encoding,
+                'textDocumentSync': {'openClose': True, 'change': 2}, # 2: artımlı
+                'semanticTokensProvider': {
+                    'legend': {'tokenTypes': SEMANTIC_TOKEN_LEGEND, 'tokenModifiers': []},
+                    'full': {'delta': True},
+                },
+            },
+            'serverInfo': {'name': DIAGNOSTICS_SOURCE},
+        }
+
+    def shutdown(self, params):
+        self.shutdown_requested = True
+        return None
+
+    def did_open(self, params):
+        item = params['textDocument']
+        document = Document(item['uri'], item['text'], item.get('version'), self.lexer, self.encoding)
+        self.documents[item['uri']] = document
+        self.schedule_diagnostics(document)
+
+    def did_change(self, params):
+        document = self.documents.get(params['textDocument']['uri'])
+        if document is None:
+            return
+        for change in params['contentChanges']:
+            document.apply_change(change)
+        document.version = params['textDocument'].get('version')
+        document.relex()
+        self.schedule_diagnostics(document)
+
+    def did_close(self, params):
+        uri = params['textDocument']['uri']
+        self.documents.pop(uri, None)
+        pending = self._timers.pop(uri, None)
+        if pending is not None:
+            pending[0].cancel()
+            pending[1].set()
+        self.send({'jsonrpc': '2.0', 'method': 'textDocument/publishDiagnostics',
+                   'params': {'uri': uri, 'diagnostics': []}})
+
+    def _new_result_id(self):
+        self._next_result_id += 1
+        return str(self._next_result_id)
+
+    def semantic_tokens_full(self, params):
+        document = self.documents.get(params['textDocument']['uri'])
+        if document is None:
+            return None
+        result_id = self._new_result_id()
+        document.mark_sent(result_id)
+        # Yanıt hemen yazıldığından dizi kopyalanmadan gönderilir
+        return {'resultId': result_id, 'data': document.data}
+
+    def semantic_tokens_delta(self, params):
+        document = self.documents.get(params['textDocument']['uri'])
+        if document is None:
+            return None
+        if document.result_id is None or params.get('previousResultId') != document.result_id:
+            return self.semantic_tokens_full(params)
+        edits = document.semantic_token_edits()
+        result_id = self._new_result_id()
+        document.mark_sent(result_id)
+        return {'resultId': result_id, 'edits': edits}
+
+    def schedule_diagnostics(self, document):
+        # Bekleyen yayını ve yarım kalan ayrıştırmayı iptal et, son sürüm için yeniden zamanla
+        pending = self._timers.get(document.uri)
+        if pending is not None:
+            pending[0].cancel()
+            pending[1].set()
+        cancel_event = threading.Event()
+        timer = threading.Timer(self.diagnostics_delay, self.publish_diagnostics,
+                                args=(document, document.lex_state.snapshot(), list(document.lines),
+                                      document.version, cancel_event))
+        timer.daemon = True
+        self._timers[document.uri] = (timer, cancel_event)
+        timer.start()
+
+    def publish_diagnostics(self, document, lex_state, lines, version, cancel_event):
+        try:
+            diagnostics = document.diagnostics(lex_state, lines, cancel_event)
+        except ParseCancelled:
+            return
+        if cancel_event.is_set():
+            return
+        params = {'uri': document.uri, 'diagnostics': diagnostics}
+        if version is not None:
+            params['version'] = version
+        self.send({'jsonrpc': '2.0', 'method': 'textDocument/publishDiagnostics', 'params': params})
+
+def main():
+    server = LanguageServer(sys.stdin.buffer, sys.stdout.buffer)
+    return server.serve()
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,33 +1,83 @@
+import os
+import threading
+import time
 import tkinter as tk
-from tkinter import scrolledtext, messagebox
-
-from lexer import Lexer, TOKEN_TYPES
-from parser import Parser, ParserError
+from tkinter import scrolledtext, messagebox, filedialog
+
+from lexer import Lexer, DEFAULT_GRAMMAR
+from grammar import GrammarError, load_grammar, token_colors, DEFAULT_GRAMMAR_FILE
+from analysis import AnalysisWorker
+from viewport import LineRangeSet
+from tagsync import TagSynchronizer
+from gutter import LineNumberGutter
+from tracing import LatencyTracer
+from cache import AnalysisCache
+from brackets import BracketIndex
+from symbols import SymbolIndex
+from fileio import MappedTextReader, write_text
+from parser import ParserError
+from vm import compile_program, VirtualMachine, CompileError, VMError, ExecutionCancelled
+
+# Art arda gelen tuş vuruşlarını tek bir analiz geçişinde toplamak için bekleme süresi (ms)
+DEFAULT_DEBOUNCE_MS = 75
+# Görünür alanın üstünde ve altında önceden vurgulanan satır sayısı
+DEFAULT_HIGHLIGHT_MARGIN = 50
+# Arka plan analiz sonuçlarının Tk iş parçacığında yoklanma aralığı (ms)
+ANALYSIS_POLL_MS = 15
+# Çalıştırılan programın çıktısından durum çubuğunda gösterilen en fazla karakter
+RUN_OUTPUT_CHARS = 300
+# Bu kadar karakter ekleyen bir düzenleme (dosya açma, büyük yapıştırma) tek seferde değil,
+# zaman dilimlerine bölünerek lexlenir
+PROGRESSIVE_THRESHOLD = 1 << 16
+# Dosya yükleme ve aşamalı vurgulama işlerinin bir after() tikinde en fazla çalışma süresi (ms)
+TIME_SLICE_MS = 5
+# İki tik arasında Tk'nin olayları işlemesi için bırakılan süre (ms)
+TIME_SLICE_GAP_MS = 1
+# Tam belge vurgulamada görünür alandan sonra bir adımda etiketlenen satır sayısı
+BACKGROUND_TAG_LINES = 200
+
+APP_TITLE = "Gerçek Zamanlı Sözdizimi Vurgulayıcı"
+
+# İzleme açıkken export_trace'in Chrome iz dosyasını yazdığı varsayılan yol
+DEFAULT_TRACE_FILE = "gecikme_izi.json"
+# Durum çubuğundaki gecikme özetinde gösterilen aşamalar
+TRACE_SUMMARY_PHASES = (
+    ('edit', 'döngü'), ('line_numbers', 'satır no'), ('lex', 'lex'),
+    ('brackets', 'parantez'), ('tags', 'etiket'), ('parse', 'ayrıştırma'), ('symbols', 'semboller'),
+)
+
+# Token etiketlerinin renk dışındaki biçimleri
+TOKEN_TAG_OPTIONS = {
+    'COMMENT': {'font': ("Consolas", 12, "italic")},
+    'MULTI_LINE_COMMENT': {'font': ("Consolas", 12, "italic")},
+    'UNKNOWN': {'background': "yellow"},
+}
+# Token etiketlerinin üstünde gösterilen etiketler; dil değişince yeni token etiketlerinin üstüne alınır
+OVERLAY_TAGS = {
+    'ERROR': {'foreground': "white", 'background': "red"},
+    'BRACKET_MATCH': {'background': "#C8E6FF"},
+    'SYMBOL_USE': {'background': "#FFF2B3"},
+    'FOLDED': {'elide': True},
+}
+
+def highlight_tags(grammar):
+    # Gramerin vurgulanan token tipleri (define_highlight_tags ile yapılandırılır)
+    return set(token_colors(grammar))
 
 class SyntaxHighlighterApp:
-    def __init__(self, master):
+    def __init__(self, master, debounce_ms=DEFAULT_DEBOUNCE_MS, viewport_highlighting=True,
+                 highlight_margin=DEFAULT_HIGHLIGHT_MARGIN, tracing=False, trace_file=None, cache_dir=None, grammar=None):
         self.master = master
-        master.title("Gerçek Zamanlı Sözdizimi Vurgulayıcı")
-
-        self.lexer = Lexer()
+        master.title(APP_TITLE)
+        self.init_analysis(debounce_ms, viewport_highlighting, highlight_margin, tracing, cache_dir, grammar=grammar)
+        self.trace_file = trace_file # Verilirse kapanışta Chrome iz dosyası yazılır
+        master.protocol("WM_DELETE_WINDOW", self.on_close)
 
         # Ana çerçeve oluştur, satır numaraları ve metin alanını bir arada tutacak
         self.code_frame = tk.Frame(master)
         self.code_frame.pack(expand=True, fill="both", padx=5, pady=5)
 
-        # 1. Satır Numaraları Metin Alanı
-        self.line_numbers = tk.Text(self.code_frame,
-                                     width=4, 
-                                     padx=3,
-                                     borderwidth=0, # Kenarlık olmasın
-                                     background="#F0F0F0", 
-                                     foreground="gray", 
-                                     font=("Consolas", 12),
-                                     state="disabled", 
-                                     wrap="none") 
-        self.line_numbers.pack(side=tk.LEFT, fill=tk.Y)
-
-        # 2. Ana Metin Alanı
+        # Ana Metin Alanı
         self.text_area = scrolledtext.ScrolledText(self.code_frame,
                                                    wrap=tk.WORD,
                                                    width=80,
@@ -37,19 +87,49 @@ class SyntaxHighlighterApp:
                                                    bd=2,
                                                    bg="#FFFFFF", 
                                                    insertbackground="black") 
+
+        # Satır Numaraları: yalnızca görünür satırları çizen şerit
+        self.line_numbers = LineNumberGutter(self.code_frame,
+                                             self.text_area,
+                                             font=("Consolas", 12),
+                                             padx=3,
+                                             background="#F0F0F0",
+                                             foreground="gray")
+        self.line_numbers.pack(side=tk.LEFT, fill=tk.Y)
         self.text_area.pack(side=tk.RIGHT, expand=True, fill="both")
 
         self.text_area.config(yscrollcommand=self._on_text_scroll)
-        self.line_numbers.config(yscrollcommand=self._on_line_numbers_scroll)
+        self.text_area.bind("<Configure>", lambda event: self.update_line_numbers())
 
 
 
         self.text_area.bind("<KeyRelease>", self.on_key_release)
+        self.text_area.bind("<<Modified>>", self.on_text_modified)
         self.text_area.bind("<MouseWheel>", self.on_scroll_event)
         self.text_area.bind("<Button-4>", self.on_scroll_event)
         self.text_area.bind("<Button-5>", self.on_scroll_event)
+        # F12 gecikme ölçümünü açar/kapatır, Ctrl+F12 oturumun izini dosyaya yazar
+        self.text_area.bind("<F12>", self.toggle_tracing)
+        self.text_area.bind("<Control-F12>", self.export_trace)
+        # İmleç tıklamayla taşındığında eşleşen parantez hemen vurgulanır; Ctrl+[ imleçteki bloğu katlar
+        self.text_area.bind("<ButtonRelease-1>", lambda event: self.on_cursor_moved())
+        self.text_area.bind("<Control-bracketleft>", self.toggle_fold)
+        # F3 imleçteki ismin tanımına gider, Shift+F3 kullanımlarını sayar ve bir sonrakine geçer
+        self.text_area.bind("<F3>", self.go_to_definition)
+        self.text_area.bind("<Shift-F3>", self.find_references)
+        # Ctrl+O dosya açar, Ctrl+S kaydeder, Ctrl+Shift+S farklı kaydeder
+        self.text_area.bind("<Control-o>", self.open_file)
+        self.text_area.bind("<Control-s>", self.save_file)
+        self.text_area.bind("<Control-S>", lambda event: self.save_file(save_as=True))
+        # Ctrl+L başka bir dilin gramer tanımını yükler
+        self.text_area.bind("<Control-l>", self.load_language)
+        # F5 belgeyi derleyip çalıştırır, Shift+F5 çalışan programı durdurur
+        self.text_area.bind("<F5>", self.run_program)
+        self.text_area.bind("<Shift-F5>", self.stop_program)
         
         self.define_highlight_tags()
+        # Etiketler yalnızca fark kadar ve etiket başına tek Tcl çağrısıyla güncellenir
+        self.tag_sync = TagSynchronizer(self.text_area, highlight_tags(self.lexer.grammar))
 
         # Hata mesajı gösterecek bir label
         self.status_label = tk.Label(master,
@@ -63,13 +143,65 @@ class SyntaxHighlighterApp:
 
         self.update_line_numbers()
     
-    def _on_text_scroll(self, *args):
-        self.line_numbers.yview(*args)
-        self.update_line_numbers_scroll_position()
+    def init_analysis(self, debounce_ms=DEFAULT_DEBOUNCE_MS, viewport_highlighting=True,
+                      highlight_margin=DEFAULT_HIGHLIGHT_MARGIN, tracing=False, cache_dir=None,
+                      progressive_threshold=PROGRESSIVE_THRESHOLD, grammar=None):
+        # Pencere öğelerinden bağımsız analiz durumu; arayüzsüz ölçümler (benchmarks.headless) de bunu kullanır
+
+        # Düzenleme döngüsünün aşama süreleri; kapalıyken ölçüm noktaları neredeyse hiç maliyet getirmez
+        self.tracer = LatencyTracer(enabled=tracing)
+        self._edit_started = None
+
+        # Ayrıştırma arka planda yapılır; sonuçlar after() ile Tk iş parçacığına alınır
+        self.debounce_ms = debounce_ms
+        # Ayrıştırma sonuçları içerik özetiyle saklanır; cache_dir verilirse yeniden başlatmalardan sonra da
+        self.analysis_cache = AnalysisCache(directory=cache_dir)
+        # Tanım/kullanım dizini arka planda, ayrıştırmayla birlikte ve yalnızca değişen ifadeler için güncellenir
+        self.symbol_index = SymbolIndex()
+        self._symbol_uses = [] # SYMBOL_USE etiketli (başlangıç, bitiş) Tk indeksleri
+        self.analysis_worker = AnalysisWorker(tracer=self.tracer, cache=self.analysis_cache, symbols=self.symbol_index)
+        self._debounce_after_id = None
+        # Metin değişti fakat henüz lexlenmedi: Tk metni KeyPress'te değiştirir, analiz KeyRelease'te zamanlanır
+        self._text_modified = False
+        self._poll_after_id = None
+
+        # Tek geçişli birleşik desen motoru her tuşta tüm belgeyi daha hızlı tarar.
+        # Desenler gramer tanımından gelir; ayrıştırıcı ve sembol dizini yalnızca projenin kendi dilini bilir
+        self.lexer = Lexer(engine='regex', grammar=grammar)
+        self.syntax_checking = self.lexer.grammar.digest == DEFAULT_GRAMMAR.digest
+        self.lex_state = None # Artımlı lexleme için satır bazlı kontrol noktaları
+
+        # Görünür alan modunda yalnızca ekrandaki satırlar (ve kenar payı) etiketlenir;
+        # etiketleri güncel olan satır aralıkları kaydırma sırasında tekrar iş yapmamak için tutulur
+        self.viewport_highlighting = viewport_highlighting
+        self.highlight_margin = highlight_margin
+        self.highlighted_lines = LineRangeSet()
+
+        # Parantez eşleri ve katlama bölgeleri lexer durumuyla birlikte artımlı güncellenir
+        self.bracket_index = BracketIndex()
+        self._matched_brackets = [] # BRACKET_MATCH etiketli parantezlerin Tk indeksleri
+
+        # Büyük metinler after() tiklerine bölünerek yüklenir ve lexlenir; arayüz bu sırada yanıt vermeye devam eder
+        self.progressive_threshold = progressive_threshold # None: her düzenleme tek seferde lexlenir
+        self.file_path = None
+        self.file_newline = '\n' # Kaydederken geri yazılan satır sonu biçimi
+        self._loader = None # Süren dosya yüklemesinin MappedTextReader'ı
+        self._loading_after_id = None
+        self._progressive = None # Süren aşamalı lexlemenin üreteci
+        self._progressive_line_count = 0
+        self._progressive_stale = False # Aşamalı lexleme sürerken metin düzenlendi
+        self._progressive_after_id = None
+        self._tagging_after_id = None
+
+        # F5 ile çalıştırılan program arka planda derlenir ve yığın makinesinde çalışır
+        self._program = None # (iş parçacığı, iptal olayı, sonuç sözlüğü)
+        self._program_after_id = None
 
-    def _on_line_numbers_scroll(self, *args):
-        self.text_area.yview(*args)
-        self.update_line_numbers_scroll_position()
+    def _on_text_scroll(self, *args):
+        self.text_area.vbar.set(*args) # ScrolledText kaydırma çubuğunu güncel tut
+        self.update_line_numbers()
+        self.highlight_visible_lines()
+        self.highlight_symbol_uses()
 
     def on_scroll_event(self, event):
         if event.delta: # Windows/Mac
@@ -84,96 +216,581 @@ class SyntaxHighlighterApp:
 
     def on_key_release(self, event=None):
         self.update_line_numbers() 
+        # Hızlı yazımda her tuş yerine bekleme süresi dolduğunda tek bir analiz yap
+        if self._debounce_after_id is not None:
+            self.master.after_cancel(self._debounce_after_id)
+        self._debounce_after_id = self.master.after(self.debounce_ms, self.run_analysis)
+
+    def on_text_modified(self, event=None):
+        # Tk'nın değişti bayrağı her seferinde sıfırlanır, böylece her düzenleme için olay gelir (sıfırlamanın
+        # kendisi de bir olay üretir). Tuş dışı düzenlemeler (fareyle yapıştırma) için de analiz zamanlanır.
+        if not self.text_area.edit_modified():
+            return
+        self.text_area.edit_modified(False)
+        self._text_modified = True
+        if self._debounce_after_id is None and self._loader is None:
+            self._debounce_after_id = self.master.after(self.debounce_ms, self.run_analysis)
+
+    def run_analysis(self):
+        self._debounce_after_id = None
+        self._text_modified = False # Metin aşağıda (highlight_syntax) yeniden okunur
+        if self._loader is not None:
+            return # Dosya yüklenirken metin eksiktir; yükleme bitince analiz yapılır
+        # 'edit' aşaması: analizin başlangıcından ayrıştırma sonucunun gösterilmesine kadar
+        self._edit_started = self.tracer.now() if self.tracer.enabled else None
         self.highlight_syntax()
+        if self._progressive is not None:
+            return # Ayrıştırma aşamalı lexleme bitince gönderilir
+        self.on_cursor_moved()
         self.parse_and_report_errors()
 
-    def update_line_numbers(self):
-        # Satır numaralarını güncelleme metodu
-        self.line_numbers.config(state="normal") # Yazılabilir yap
-        self.line_numbers.delete("1.0", tk.END) # Mevcut numaraları sil
-
-        # Metin alanındaki satır sayısını bul
-        code_content = self.text_area.get("1.0", tk.END)
-        num_lines = code_content.count('\n') + 1
-        if not code_content.strip() and num_lines == 1: 
-            num_lines = 1 
-
-        # Satır numaralarını ekle
-        for i in range(1, num_lines + 1): 
-            self.line_numbers.insert(tk.END, f"{i}\n")
-
-        self.line_numbers.config(state="disabled")
-        
-        self.update_line_numbers_scroll_position()
+    def analysis_current(self):
+        # Lexer durumu ve ona bağlı dizinler metinle uyumlu mu: bekleyen analiz, yükleme veya aşamalı lexleme yok.
+        # KeyPress ile KeyRelease arasında (ör. Enter sonrası otomatik kaydırmada) henüz analiz zamanlanmamıştır;
+        # bu aralık değişti bayrağıyla ve satır sayısının metinle karşılaştırılmasıyla yakalanır
+        return (self.lex_state is not None and self._debounce_after_id is None
+                and self._progressive is None and self._loader is None
+                and not self._text_modified and self.lex_state_matches_text())
+
+    def lex_state_matches_text(self):
+        # lex_state metnin sonundaki satır sonu yüzünden bir satır fazladır; Tk satır sayısını sabit zamanda verir
+        line_count = int(self.text_area.index("end-1c").split('.')[0])
+        return len(self.lex_state.line_tokens) == line_count + 1
+
+    def open_file(self, event=None, path=None):
+        # Dosya mmap ile eşlenir ve parça parça, her tikte birkaç milisaniye eklenir
+        if path is None:
+            path = filedialog.askopenfilename(title="Dosya aç")
+            if not path:
+                return "break"
+        try:
+            reader = MappedTextReader(path)
+        except OSError as e:
+            messagebox.showerror("Dosya açılamadı", str(e))
+            return "break"
+        self.cancel_background_work()
+        self.text_area.config(state=tk.NORMAL)
+        self.text_area.delete("1.0", tk.END)
+        self.reset_highlighting()
+        self._loader = reader
+        self.file_path = path
+        self.master.title(f"{os.path.basename(path)} - {APP_TITLE}")
+        # Yükleme bitene kadar kullanıcı düzenlemesi kapalıdır; eklemeler için kısa süreliğine açılır
+        self.text_area.config(state=tk.DISABLED)
+        self._loading_after_id = self.master.after(0, self.continue_loading)
+        return "break"
+
+    def continue_loading(self):
+        self._loading_after_id = None
+        reader = self._loader
+        deadline = time.perf_counter() + TIME_SLICE_MS / 1000
+        self.text_area.config(state=tk.NORMAL)
+        try:
+            for chunk in reader:
+                self.text_area.insert("end-1c", chunk)
+                if time.perf_counter() >= deadline:
+                    break
+            else:
+                self.finish_loading()
+                return
+        except (OSError, UnicodeDecodeError) as e:
+            reader.close()
+            self._loader = None
+            self.text_area.delete("1.0", tk.END)
+            self.file_path = None
+            self.master.title(APP_TITLE)
+            messagebox.showerror("Dosya açılamadı", str(e))
+            return
+        self.text_area.config(state=tk.DISABLED)
+        self.update_line_numbers()
+        percent = reader.offset * 100 // max(reader.size, 1)
+        self.status_label.config(text=f"Yükleniyor: {reader.path} (%{percent})", fg="black")
+        self._loading_after_id = self.master.after(TIME_SLICE_GAP_MS, self.continue_loading)
+
+    def finish_loading(self):
+        self.file_newline = self._loader.newline
+        self._loader = None
+        self.text_area.mark_set(tk.INSERT, "1.0")
+        self.text_area.see("1.0")
+        self.update_line_numbers()
+        self.status_label.config(text=f"Açıldı: {self.file_path}", fg="black")
+        self.run_analysis()
+
+    def save_file(self, event=None, save_as=False):
+        if self._loader is not None:
+            self.status_label.config(text="Dosya yüklenirken kaydedilemez.", fg="black")
+            return "break"
+        path = self.file_path
+        if path is None or save_as:
+            path = filedialog.asksaveasfilename(title="Farklı kaydet")
+            if not path:
+                return "break"
+        try:
+            write_text(path, self.text_area.get("1.0", "end-1c"), newline=self.file_newline)
+        except (OSError, UnicodeEncodeError) as e:
+            messagebox.showerror("Dosya kaydedilemedi", str(e))
+            return "break"
+        self.file_path = path
+        self.master.title(f"{os.path.basename(path)} - {APP_TITLE}")
+        self.status_label.config(text=f"Kaydedildi: {path}", fg="black")
+        return "break"
+
+    def load_language(self, event=None, path=None):
+        # Gramer tanımını yükler (derlenmiş tablolar önbellekteyse desenler derlenmez) ve belgeyi yeniden lexler
+        if self._loader is not None:
+            self.status_label.config(text="Dosya yüklenirken dil değiştirilemez.", fg="black")
+            return "break"
+        if path is None:
+            path = filedialog.askopenfilename(title="Dil tanımı aç", initialdir=os.path.dirname(DEFAULT_GRAMMAR_FILE),
+                                              filetypes=[("Gramer tanımı", "*.grammar"), ("Tüm dosyalar", "*")])
+            if not path:
+                return "break"
+        try:
+            grammar = load_grammar(path)
+        except (OSError, GrammarError) as e:
+            messagebox.showerror("Dil yüklenemedi", str(e))
+            return "break"
+        self.cancel_background_work()
+        self.lexer = Lexer(engine='regex', grammar=grammar)
+        self.syntax_checking = grammar.digest == DEFAULT_GRAMMAR.digest
+        # Yeni gramerde olmayan tiplerin etiketleri kaldırılır; diğer satırlar reset_highlighting ile yeniden etiketlenir
+        old_tags = self.tag_sync.tags
+        self.tag_sync.tags = highlight_tags(grammar)
+        for tag in old_tags - self.tag_sync.tags:
+            self.text_area.tag_remove(tag, "1.0", tk.END)
+        self.define_highlight_tags()
+        self.reset_highlighting()
+        self.text_area.tag_remove("ERROR", "1.0", tk.END)
+        self.run_analysis()
+        if not self.syntax_checking:
+            self.status_label.config(text=f"Dil: {grammar.name} (sözdizimi denetimi yapılmaz)", fg="black")
+        return "break"
+
+    def cancel_background_work(self):
+        # Yeni bir dosya açılırken süren yükleme, aşamalı vurgulama ve bekleyen analiz bırakılır
+        for attribute in ('_debounce_after_id', '_loading_after_id', '_progressive_after_id', '_tagging_after_id'):
+            after_id = getattr(self, attribute)
+            if after_id is not None:
+                self.master.after_cancel(after_id)
+                setattr(self, attribute, None)
+        if self._loader is not None:
+            self._loader.close()
+            self._loader = None
+        self._progressive = None
+
+    def reset_highlighting(self):
+        # Metnin tamamı değiştiğinde lexer durumu ve ona bağlı kayıtlar sıfırdan kurulur
+        self.lex_state = None
+        self.tag_sync.lines_edited(1, len(self.tag_sync.applied) + 1, 1)
+        self.highlighted_lines.clear()
+        self.bracket_index = BracketIndex()
+        self._matched_brackets = []
+        self._symbol_uses = []
+
+    def on_close(self):
+        self.cancel_background_work()
+        self.stop_program()
+        self.analysis_worker.stop()
+        if self.trace_file and self.tracer.events:
+            self.tracer.write_chrome_trace(self.trace_file)
+        self.master.destroy()
+
+    def run_program(self, event=None):
+        # Belge ayrıştırılır (önbellekten), bayt koduna derlenir ve arka planda çalıştırılır; önceki çalıştırma durdurulur
+        if not self.syntax_checking:
+            self.status_label.config(text=f"'{self.lexer.grammar.name}' dilindeki belgeler çalıştırılamaz.", fg="black")
+            return "break"
+        if self._loader is not None:
+            self.status_label.config(text="Dosya yüklenirken çalıştırılamaz.", fg="black")
+            return "break"
+        self.stop_program()
+        # Metin analizdeki gibi (sondaki satır sonuyla) alınır; böylece önbellek anahtarı arka plan analizininkiyle aynıdır
+        code = self.text_area.get("1.0", tk.END)
+        cancel_event = threading.Event()
+        result = {}
+        thread = threading.Thread(target=self._execute_program, args=(code, cancel_event, result),
+                                  name="program-runner", daemon=True)
+        self._program = (thread, cancel_event, result)
+        thread.start()
+        self.status_label.config(text="Çalışıyor... (Shift+F5 durdurur)", fg="black")
+        self._program_after_id = self.master.after(ANALYSIS_POLL_MS, self.poll_program)
+        return "break"
+
+    def _execute_program(self, code, cancel_event, result):
+        # Arka plan iş parçacığında çalışır; sonuç yalnızca result sözlüğüne yazılır
+        output = result['output'] = []
+        started = time.perf_counter()
+        try:
+            ast, errors = self.analysis_cache.parse(code)
+            if errors:
+                raise errors[0]
+            VirtualMachine(output=output, cancel_event=cancel_event).run(compile_program(ast))
+        except ExecutionCancelled:
+            result['cancelled'] = True
+        except (ParserError, CompileError, VMError) as e:
+            result['error'] = e
+        except Exception as e:
+            # Beklenmeyen hatalar da (ör. MemoryError) bildirilir; sonuç her durumda doldurulmalı
+            result['error'] = f"{type(e).__name__}: {e}" if str(e) else type(e).__name__
+        finally:
+            result['elapsed'] = time.perf_counter() - started
+
+    def poll_program(self):
+        self._program_after_id = None
+        thread, cancel_event, result = self._program
+        if thread.is_alive():
+            self._program_after_id = self.master.after(ANALYSIS_POLL_MS, self.poll_program)
+            return
+        self._program = None
+        if result.get('cancelled'):
+            self.status_label.config(text="Program durduruldu.", fg="black")
+            return
+        output = ' | '.join(result['output'])
+        if len(output) > RUN_OUTPUT_CHARS:
+            output = '...' + output[-RUN_OUTPUT_CHARS:]
+        if 'error' in result:
+            message = f"Program hatası: {result['error']}"
+            self.status_label.config(text=f"{message}   Çıktı: {output}" if output else message, fg="red")
+        else:
+            elapsed = result['elapsed'] * 1000
+            self.status_label.config(text=f"Program bitti ({elapsed:.0f} ms). Çıktı: {output or '(yok)'}", fg="black")
+
+    def stop_program(self, event=None):
+        if self._program_after_id is not None:
+            self.master.after_cancel(self._program_after_id)
+            self._program_after_id = None
+        if self._program is not None:
+            self._program[1].set()
+            if event is not None:
+                self.status_label.config(text="Program durduruldu.", fg="black")
+            self._program = None
+        return "break"
+
+    def toggle_tracing(self, event=None):
+        self.tracer.enabled = not self.tracer.enabled
+        self._edit_started = None
+        state = "açık" if self.tracer.enabled else "kapalı"
+        self.status_label.config(text=f"Gecikme ölçümü {state}.", fg="black")
+        return "break"
+
+    def export_trace(self, event=None):
+        path = self.trace_file or DEFAULT_TRACE_FILE
+        try:
+            self.tracer.write_chrome_trace(path)
+        except OSError as e:
+            messagebox.showerror("İz kaydedilemedi", str(e))
+            return "break"
+        self.status_label.config(text=f"Gecikme izi kaydedildi: {path} ({len(self.tracer.events)} olay)", fg="black")
+        return "break"
 
-    def update_line_numbers_scroll_position(self):
-        # Satır numaraları ve metin alanının kaydırma pozisyonlarını senkronize et
-        # text_area'nın yview pozisyonunu al ve line_numbers'a uygula
-        first_visible_line_fraction = self.text_area.yview()[0]
-        self.line_numbers.yview_moveto(first_visible_line_fraction)
+    def update_line_numbers(self):
+        # Şerit yalnızca satır sayısı veya görünür alan değiştiyse yeniden çizilir
+        with self.tracer.span('line_numbers'):
+            self.line_numbers.redraw()
 
     def define_highlight_tags(self):
-        # Mevcut vurgulama etiketleriniz
-        self.text_area.tag_configure("KEYWORD", foreground="blue")
-        self.text_area.tag_configure("OPERATOR", foreground="red")
-        self.text_area.tag_configure("NUMBER", foreground="purple")
-        self.text_area.tag_configure("IDENTIFIER", foreground="black")
-        self.text_area.tag_configure("COMMENT", foreground="green", font=("Consolas", 12, "italic"))
-        self.text_area.tag_configure("UNKNOWN", foreground="gray", background="yellow")
-        self.text_area.tag_configure("ERROR", foreground="white", background="red")
-        self.text_area.tag_configure("FLOAT", foreground="orange")
-        self.text_area.tag_configure("STRING", foreground="brown")
+        # Etiketler geçerli gramerin token tiplerinden oluşturulur; Tk'da sonra oluşturulan etiket önceliklidir
+        for token_type, color in token_colors(self.lexer.grammar).items():
+            self.text_area.tag_configure(token_type, foreground=color, **TOKEN_TAG_OPTIONS.get(token_type, {}))
+        for tag, options in OVERLAY_TAGS.items():
+            self.text_area.tag_configure(tag, **options)
+            self.text_area.tag_raise(tag)
 
     def highlight_syntax(self):
-        # Önceki tüm vurgulamaları ve hataları temizle
-        for tag in self.text_area.tag_names():
-            if tag in TOKEN_TYPES or tag == 'UNKNOWN' or tag == 'ERROR':
-                self.text_area.tag_remove(tag, "1.0", tk.END)
-
-        code = self.text_area.get("1.0", tk.END)
-        tokens = self.lexer.tokenize(code)
-
-        for token in tokens:
-            # Token'ın satır bilgisini kontrol et, boş kod durumunda hata olmaması için
-            if token.line is None or token.column is None:
-                continue # Geçersiz konum bilgisi olan token'ları atla
-
-            start_index = f"{token.line}.{token.column}"
-            end_index = f"{token.line}.{token.column + len(token.value)}"
-
-            if token.type in self.text_area.tag_names():
-                self.text_area.tag_add(token.type, start_index, end_index)
-            elif token.type == 'UNKNOWN':
-                self.text_area.tag_add('UNKNOWN', start_index, end_index)
+        # Yalnızca değişen satırları yeniden lexle; etiketleri güncel olmayan satırlar olarak işaretle
+        if self._progressive is not None:
+            # Aşamalı lexleme bitince bu düzenleme onun sonucuna göre artımlı olarak işlenir
+            self._progressive_stale = True
+            return
+        with self.tracer.span('lex'):
+            code = self.text_area.get("1.0", tk.END)
+            old_length = len(self.lex_state.code) if self.lex_state else 0
+            progressive = (self.progressive_threshold is not None
+                           and len(code) - old_length >= self.progressive_threshold)
+            if not progressive:
+                old_line_count = len(self.lex_state.line_tokens) if self.lex_state else 0
+                self.lex_state, changed_lines = self.lexer.tokenize_incremental(code, self.lex_state)
+        if progressive:
+            self.start_progressive_highlight(code)
+            return
+        if changed_lines is None:
+            return # Metin değişmedi (ör. ok tuşları), etiketler güncel
+
+        with self.tracer.span('brackets'):
+            self.bracket_index.update(self.lex_state, changed_lines)
+        first_line, last_line = changed_lines
+        line_delta = len(self.lex_state.line_tokens) - old_line_count
+        self.tag_sync.lines_edited(*self.lex_state.last_edit)
+        self.highlighted_lines.replace(first_line, last_line + 1 - line_delta, last_line + 1)
+        self.highlight_visible_lines()
+
+    def start_progressive_highlight(self, code):
+        # Büyük metin baştan, her tikte birkaç milisaniye lexlenir; lexlenen görünür satırlar hemen etiketlenir
+        self.reset_highlighting()
+        self._progressive = self.lexer.tokenize_progressive(code)
+        self._progressive_line_count = code.count('\n') + 1
+        self._progressive_stale = False
+        self.tag_sync.lines_edited(1, 1, self._progressive_line_count + 1)
+        self._progressive_after_id = self.master.after(0, self.continue_progressive_highlight)
+
+    def continue_progressive_highlight(self):
+        self._progressive_after_id = None
+        deadline = time.perf_counter() + TIME_SLICE_MS / 1000
+        with self.tracer.span('lex'):
+            for state, lexed_lines in self._progressive:
+                if lexed_lines == self._progressive_line_count or time.perf_counter() >= deadline:
+                    break
+        with self.tracer.span('brackets'):
+            self.bracket_index.extend(state.line_tokens, lexed_lines)
+        if lexed_lines == self._progressive_line_count:
+            self.finish_progressive_highlight(state)
+            return
+        # Metin lexlenen anlık görüntüden farklıysa satırlar kaymış olabilir; etiketleme iş bitince yapılır
+        if not self._progressive_stale and self._debounce_after_id is None and not self._text_modified:
+            self.tag_lines(state, *self.screen_line_range(lexed_lines))
+        percent = lexed_lines * 100 // self._progressive_line_count
+        self.status_label.config(text=f"Vurgulanıyor... (%{percent})", fg="black")
+        self._progressive_after_id = self.master.after(TIME_SLICE_GAP_MS, self.continue_progressive_highlight)
+
+    def finish_progressive_highlight(self, state):
+        self._progressive = None
+        self.lex_state = state
+        if self._debounce_after_id is not None:
+            return # Bekleyen analiz metnin son halini artımlı olarak işler
+        if not self._progressive_stale:
+            self.highlight_visible_lines()
+        # Metin değiştiyse artımlı lexleme yapılır; her durumda ayrıştırma gönderilir
+        self.run_analysis()
+
+    def screen_line_range(self, line_count):
+        # Ekrandaki satırlar ve kenar payı, [başlangıç, bitiş) olarak; line_count'tan sonrası dahil edilmez
+        first_visible = int(self.text_area.index("@0,0").split('.')[0])
+        last_visible = int(self.text_area.index(f"@0,{self.text_area.winfo_height()}").split('.')[0])
+        start = max(1, first_visible - self.highlight_margin)
+        end = min(line_count, last_visible + self.highlight_margin) + 1
+        return start, end
+
+    def visible_line_range(self):
+        # Görünür alan modunda ekrandaki satırlar ve kenar payı, tam belge modunda tüm satırlar
+        line_count = len(self.lex_state.line_tokens)
+        if not self.viewport_highlighting:
+            return 1, line_count + 1
+        return self.screen_line_range(line_count)
+
+    def tag_lines(self, lex_state, start, end):
+        # [start, end) içinde etiketleri güncel olmayan satırları etiketle
+        stale_ranges = self.highlighted_lines.missing(start, end)
+        if not stale_ranges:
+            return
+        with self.tracer.span('tags'):
+            self.tag_sync.sync(lex_state, stale_ranges)
+        for gap_start, gap_end in stale_ranges:
+            self.highlighted_lines.add(gap_start, gap_end)
+
+    def highlight_visible_lines(self):
+        # Bekleyen bir analiz varken lexer durumu metnin gerisindedir, etiketleme analizden sonra yapılır
+        if not self.analysis_current():
+            return
+        self.tag_lines(self.lex_state, *self.screen_line_range(len(self.lex_state.line_tokens)))
+        if not self.viewport_highlighting:
+            # Tam belge modunda önce ekran, geri kalan satırlar arka planda zaman dilimleriyle etiketlenir
+            self.schedule_background_tagging()
+
+    def schedule_background_tagging(self, delay_ms=TIME_SLICE_GAP_MS):
+        if self._tagging_after_id is None:
+            self._tagging_after_id = self.master.after(delay_ms, self.continue_background_tagging)
+
+    def continue_background_tagging(self):
+        self._tagging_after_id = None
+        if self._debounce_after_id is not None:
+            # Analizden sonra kalan satırlardan devam edilir (metin değişmediyse analiz yeniden zamanlamaz)
+            self.schedule_background_tagging(self.debounce_ms)
+            return
+        if not self.analysis_current():
+            return # Aşamalı lexleme veya yükleme bitince highlight_visible_lines yeniden zamanlar
+        deadline = time.perf_counter() + TIME_SLICE_MS / 1000
+        line_count = len(self.lex_state.line_tokens)
+        while time.perf_counter() < deadline:
+            stale_ranges = self.highlighted_lines.missing(1, line_count + 1)
+            if not stale_ranges:
+                return
+            start, end = stale_ranges[0]
+            self.tag_lines(self.lex_state, start, min(end, start + BACKGROUND_TAG_LINES))
+        self.schedule_background_tagging()
+
+    def on_cursor_moved(self):
+        self.highlight_matching_brackets()
+        self.highlight_symbol_uses()
+
+    def symbols_current(self):
+        # Sembol dizini en son gönderilen analizle güncellendiyse ve bekleyen düzenleme yoksa metinle uyumludur
+        return (self.syntax_checking and self.analysis_current()
+                and self.symbol_index.generation == self.analysis_worker.generation)
+
+    def cursor_position(self):
+        line, column = self.text_area.index(tk.INSERT).split('.')
+        return int(line), int(column)
+
+    def highlight_symbol_uses(self):
+        # İmleçteki ismin görünür alandaki tüm kullanımlarını vurgula
+        for start, end in self._symbol_uses:
+            self.text_area.tag_remove("SYMBOL_USE", start, end)
+        self._symbol_uses = []
+        if not self.symbols_current():
+            return
+        first_line, end_line = self.visible_line_range()
+        for line, column, length in self.symbol_index.references(*self.cursor_position(), (first_line, end_line)):
+            if first_line <= line < end_line:
+                self._symbol_uses.append((f"{line}.{column}", f"{line}.{column + length}"))
+        for start, end in self._symbol_uses:
+            self.text_area.tag_add("SYMBOL_USE", start, end)
+
+    def go_to_definition(self, event=None):
+        if not self.symbols_current():
+            self.status_label.config(text="Sembol dizini güncelleniyor...", fg="black")
+            return "break"
+        position = self.symbol_index.definition(*self.cursor_position())
+        if position is None:
+            self.status_label.config(text="Tanım bulunamadı.", fg="black")
+            return "break"
+        line, column, length = position
+        self.move_cursor(f"{line}.{column}")
+        self.status_label.config(text=f"Tanım: satır {line}, sütun {column}", fg="black")
+        return "break"
+
+    def find_references(self, event=None):
+        if not self.symbols_current():
+            self.status_label.config(text="Sembol dizini güncelleniyor...", fg="black")
+            return "break"
+        cursor = self.cursor_position()
+        positions = self.symbol_index.references(*cursor)
+        if not positions:
+            self.status_label.config(text="İmleçte bir isim yok.", fg="black")
+            return "break"
+        # İmleçten sonraki ilk kullanıma, sondaysa ilkine geç
+        target = next((position for position in positions if position[:2] > cursor), positions[0])
+        self.move_cursor(f"{target[0]}.{target[1]}")
+        number = positions.index(target) + 1
+        self.status_label.config(text=f"{len(positions)} kullanım ({number}/{len(positions)}): satır {target[0]}", fg="black")
+        return "break"
+
+    def move_cursor(self, index):
+        self.text_area.mark_set(tk.INSERT, index)
+        self.text_area.see(index)
+        self.update_line_numbers()
+        self.highlight_visible_lines()
+        self.on_cursor_moved()
+
+    def highlight_matching_brackets(self):
+        # İmlecin yanındaki parantezi ve eşini vurgula; bekleyen analiz varken dizin metnin gerisindedir
+        for index in self._matched_brackets:
+            self.text_area.tag_remove("BRACKET_MATCH", index)
+        self._matched_brackets = []
+        if not self.analysis_current():
+            return
+        pair = self.bracket_index.match(*self.cursor_position())
+        if pair is None:
+            return
+        self._matched_brackets = [f"{bracket_line}.{bracket_column}" for bracket_line, bracket_column in pair]
+        for index in self._matched_brackets:
+            self.text_area.tag_add("BRACKET_MATCH", index)
+
+    def toggle_fold(self, event=None):
+        # İmlecin satırında başlayan, yoksa imleci içeren bloğun gövdesini gizle/göster; '}' satırı görünür kalır
+        if not self.analysis_current():
+            return "break"
+        line = self.cursor_position()[0]
+        region = self.bracket_index.fold_region(line) or self.bracket_index.enclosing_fold(line)
+        if region is None or region[1] - region[0] < 2:
+            return "break"
+        start, end = region
+        if "FOLDED" in self.text_area.tag_names(f"{start + 1}.0"):
+            self.text_area.tag_remove("FOLDED", f"{start + 1}.0", f"{end}.0")
+        else:
+            self.text_area.tag_add("FOLDED", f"{start + 1}.0", f"{end}.0")
+            self.text_area.mark_set(tk.INSERT, f"{start}.end")
+        self.update_line_numbers()
+        return "break"
 
     def parse_and_report_errors(self):
+        # highlight_syntax tarafından güncellenen lexer durumunun kopyasını arka planda ayrıştır
+        if not self.syntax_checking:
+            return
+        with self.tracer.span('submit'):
+            self.analysis_worker.submit(self.lex_state.snapshot())
+        if self._poll_after_id is None:
+            self._poll_after_id = self.master.after(ANALYSIS_POLL_MS, self.poll_analysis_results)
+
+    def poll_analysis_results(self):
+        self._poll_after_id = None
+        latest = None
+        while not self.analysis_worker.results.empty():
+            latest = self.analysis_worker.results.get_nowait()
+
+        if latest is not None and latest.generation == self.analysis_worker.generation:
+            with self.tracer.span('report'):
+                self.report_errors(latest.errors)
+                self.highlight_symbol_uses()
+            if self._edit_started is not None:
+                self.tracer.record('edit', self._edit_started, self.tracer.now())
+                self._edit_started = None
+                self.show_latency()
+        else:
+            # En güncel sonuç henüz gelmedi, yoklamaya devam et
+            self._poll_after_id = self.master.after(ANALYSIS_POLL_MS, self.poll_analysis_results)
+
+    def show_latency(self):
+        # Kayan pencereden aşama başına p50/p95 gecikmeyi durum çubuğundaki mesajın sonuna ekle
+        summary = self.tracer.summary(TRACE_SUMMARY_PHASES)
+        if summary:
+            self.status_label.config(text=f"{self.status_label.cget('text')}   [{summary}]")
+
+    def report_errors(self, errors):
         # Önceki tüm hata vurgulamalarını temizle
         self.text_area.tag_remove("ERROR", "1.0", tk.END)
-        self.status_label.config(text="Sözdizimi geçerli.", fg="green")
-
-        code = self.text_area.get("1.0", tk.END)
-        tokens = self.lexer.tokenize(code)
-
-        meaningful_tokens = [t for t in tokens if t.type not in ['WHITESPACE', 'COMMENT']]
-
-        parser = Parser(meaningful_tokens)
-        try:
-            ast = parser.parse()
-        except ParserError as e:
-            error_message = str(e)
-            error_token = e.token
-
-            if error_token:
-                start_index = f"{error_token.line}.{error_token.column}"
-                end_index = f"{error_token.line}.{error_token.column + len(error_token.value)}"
-                self.text_area.tag_add("ERROR", start_index, end_index)
-
-                self.status_label.config(text=f"Sözdizimi Hatası (Satır {error_token.line}, Sütun {error_token.column}): {error_message}", fg="red")
-            else:
-                self.status_label.config(text=f"Sözdizimi Hatası: {error_message}", fg="red")
+        if not errors:
+            self.status_label.config(text="Sözdizimi geçerli.", fg="green")
+            return
+
+        # Tüm hatalar tek tag_add çağrısıyla işaretlenir; durum çubuğunda ilk hata ve toplam sayı gösterilir
+        ranges = []
+        for error in errors:
+            token = error.token
+            if token is not None:
+                ranges.append(f"{token.line}.{token.column}")
+                ranges.append(f"{token.line}.{token.column + len(token.value)}")
+        if ranges:
+            self.text_area.tag_add("ERROR", *ranges)
+
+        error = errors[0]
+        error_message = str(error)
+        if len(errors) > 1:
+            error_message += f" (+{len(errors) - 1} hata daha)"
+        error_token = error.token
+        if error_token:
+            self.status_label.config(text=f"Sözdizimi Hatası (Satır {error_token.line}, Sütun {error_token.column}): {error_message}", fg="red")
+        else:
+            self.status_label.config(text=f"Sözdizimi Hatası: {error_message}", fg="red")
 
 # Ana uygulama döngüsü
 if __name__ == "__main__":
+    import argparse
+    arg_parser = argparse.ArgumentParser(description="Gerçek zamanlı sözdizimi vurgulayıcı")
+    arg_parser.add_argument('--trace', action='store_true', help="Düzenleme döngüsü gecikme ölçümünü açık başlat (F12)")
+    arg_parser.add_argument('--trace-file', help="Kapanışta Chrome iz olaylarının yazılacağı JSON dosyası")
+    arg_parser.add_argument('--cache-dir', help="Ayrıştırma sonuçlarının diskte saklanacağı dizin")
+    arg_parser.add_argument('--grammar', help="Kullanılacak dilin gramer tanımı (varsayılan: grammars/dil.grammar)")
+    arg_parser.add_argument('file', nargs='?', help="Başlangıçta açılacak dosya")
+    args = arg_parser.parse_args()
+
+    try:
+        grammar = load_grammar(args.grammar) if args.grammar else None
+    except (OSError, GrammarError) as e:
+        arg_parser.error(str(e))
+
     root = tk.Tk()
-    app = SyntaxHighlighterApp(root)
+    app = SyntaxHighlighterApp(root, tracing=args.trace or bool(args.trace_file), trace_file=args.trace_file,
+                               cache_dir=args.cache_dir, grammar=grammar)
+    if args.file:
+        app.open_file(path=args.file)
     root.mainloop()
\ No newline at end of file
@@ -1,4 +1,27 @@
-from lexer import Token 
+from bisect import bisect_left
+from itertools import accumulate
+
+from lexer import Token, TokenStream, common_prefix_length, common_suffix_length
+
+# Ayrıştırıcının atladığı, anlamsız token tipleri
+SKIPPED_TOKEN_TYPES = frozenset(('WHITESPACE', 'COMMENT', 'MULTI_LINE_COMMENT'))
+
+# İkili operatörlerin öncelikleri (büyük olan daha sıkı bağlar); hepsi soldan birleşimlidir
+BINARY_PRECEDENCE = {
+    '+': 1, '-': 1,
+    '==': 2, '!=': 2, '<': 2, '>': 2, '<=': 2, '>=': 2,
+    '*': 3, '/': 3,
+}
+
+# Sabit token'lar: token tipi -> (AST düğüm tipi, değer dönüştürücü)
+LITERAL_NODES = {
+    'NUMBER': ('Number', int),
+    'FLOAT': ('Float', float),
+    'STRING': ('String', lambda value: value.strip('"')),
+}
+
+# return'den sonra bir ifade başlatan token tipleri
+EXPRESSION_START_TYPES = frozenset(('NUMBER', 'FLOAT', 'STRING', 'IDENTIFIER'))
 
 class ParserError(Exception):
     def __init__(self, message, token=None):
@@ -8,24 +31,64 @@ class ParserError(Exception):
             super().__init__(message)
         self.token = token 
 
+    def __reduce__(self):
+        # pickle/kopya: biçimlenmiş mesaj yeniden biçimlenmeden ve token kaybolmadan geri yüklenir
+        return (_restore_parser_error, (self.args[0] if self.args else '', self.token))
+
+def _restore_parser_error(message, token):
+    error = ParserError(message)
+    error.token = token
+    return error
+
+class ParseCancelled(Exception):
+    # Arka plan analizinde daha yeni bir düzenleme geldiğinde ayrıştırmayı yarıda kesmek için
+    pass
+
 class Parser:
-    def __init__(self, tokens):
-        self.tokens = tokens
+    def __init__(self, tokens, cancel_event=None, recover=False):
+        # Boşluk ve yorumlar bir kez elenir; böylece advance() ve peek() sabit zamanlıdır
+        if isinstance(tokens, TokenStream):
+            self.tokens = tokens.without(SKIPPED_TOKEN_TYPES)
+        else:
+            self.tokens = [token for token in tokens if token.type not in SKIPPED_TOKEN_TYPES]
+        self.cancel_event = cancel_event # Ayarlanırsa ayrıştırma ParseCancelled ile durdurulur
+        # Kurtarma kipinde ilk hatada durulmaz: hatalı ifade atlanır, hata errors listesine eklenir
+        self.recover = recover
+        self.errors = []
         self.current_token_index = 0
         self.current_token = None
+        # Anahtar kelimeyle başlayan ifadeler ve tanımlayıcıdan sonraki token'a göre ifade türleri
+        self.keyword_statements = {
+            'if': self.if_statement,
+            'while': self.while_statement,
+            'for': self.for_statement,
+            'def': self.function_definition,
+            'return': self.return_statement,
+        }
+        self.identifier_statements = {
+            '=': self.assignment,
+            '+=': self.augmented_assignment,
+            '-=': self.augmented_assignment,
+            '*=': self.augmented_assignment,
+            '/=': self.augmented_assignment,
+            '(': self.function_call,
+        }
         self.advance() # current_token'ı başlat
 
     def advance(self):
-        while self.current_token_index < len(self.tokens):
-            token = self.tokens[self.current_token_index]
-            # Lexer boşluk ve yorumları zaten işaretlediği için Parser'ın bunları atlaması önemli.
-            if token.type in ['WHITESPACE', 'COMMENT']:
-                self.current_token_index += 1
-            else:
-                self.current_token = token
-                self.current_token_index += 1
-                return # Anlamlı bir token bulundu, dur ve dön
-        self.current_token = None 
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            raise ParseCancelled()
+        if self.current_token_index < len(self.tokens):
+            self.current_token = self.tokens[self.current_token_index]
+            self.current_token_index += 1
+        else:
+            self.current_token = None
+
+    def peek(self):
+        # current_token'dan sonraki anlamlı token (yoksa None)
+        if self.current_token_index < len(self.tokens):
+            return self.tokens[self.current_token_index]
+        return None
 
     def eat(self, token_type, token_value=None):
         if self.current_token and self.current_token.type == token_type:
@@ -48,53 +111,83 @@ class Parser:
     def parse(self):
         # Ayrıştırmanın baştan başlamasını sağlamak için dizini sıfırla ve ilerle
         self.current_token_index = 0
+        self.errors = []
         self.advance() 
-        return self.program()
+        ast = self.program()
+        # Kurtarma kipinde üst düzeydeki eşi olmayan '}' da bildirilir ve sonrasındaki ifadeler ayrıştırılır
+        while self.recover and self.current_token is not None:
+            self.errors.append(ParserError("Eşi olmayan '}' bulundu.", self.current_token))
+            self.advance()
+            ast['statements'].extend(self.program()['statements'])
+        return ast
 
     def program(self):
         statements = []
         # current_token None olana kadar (dosya sonu) veya bir '{' bloğu bitene kadar devam et
         while self.current_token and not (self.current_token.type == 'OPERATOR' and self.current_token.value == '}'):
-            stmt = self.statement()
-            statements.append(stmt)
+            if not self.recover:
+                statements.append(self.statement())
+                continue
+            start = self.current_token_index
+            try:
+                statements.append(self.statement())
+            except ParserError as e:
+                # Hatalı ifade AST'ye girmez; sonraki ifade sınırından devam edilir
+                self.errors.append(e)
+                self.synchronize(start)
             
         return {'type': 'Program', 'statements': statements}
 
+    def synchronize(self, start):
+        """
+        Hatadan sonra token'ları bir sonraki ifade sınırına kadar atlar: bloğu kapatan '}', ifade başlatan
+        bir anahtar kelime veya atama/çağrı başlatan bir tanımlayıcı. İfadenin başından en az bir token
+        ilerlenir, böylece aynı token'da tekrar tekrar hata alınmaz. Atlanan bölgedeki '{' bloklarının
+        gövdeleri yine ayrıştırılır (yalnızca hataları için) ve kapanışları bloğa ait sayılır; böylece
+        başlığı bozuk bir ifade, gövdesinin '}' token'ı yüzünden dış bloğu erken bitirmez.
+        Her token en fazla bir kez atlandığından kurtarma ayrıştırmanın maliyetini doğrusal bırakır.
+        """
+        progressed = self.current_token_index != start
+        while self.current_token is not None:
+            token = self.current_token
+            if token.type == 'OPERATOR':
+                if token.value == '{':
+                    self.advance()
+                    self.program()
+                    if self.current_token is not None:
+                        self.advance() # '}'
+                    progressed = True
+                    continue
+                if token.value == '}' and progressed:
+                    return
+            elif progressed:
+                if token.type == 'KEYWORD' and token.value in self.keyword_statements:
+                    return
+                if token.type == 'IDENTIFIER':
+                    next_token = self.peek()
+                    if next_token is not None and next_token.value in self.identifier_statements:
+                        return
+            self.advance()
+            progressed = True
+
     def statement(self):
-        if self.current_token is None:
-            raise ParserError("Beklenmedik dosya sonu, bir ifade bekleniyor.", self.current_token)
-
-        if self.current_token.type == 'KEYWORD':
-            if self.current_token.value == 'if':
-                return self.if_statement()
-            elif self.current_token.value == 'while':
-                return self.while_statement()
-            elif self.current_token.value == 'for':
-                return self.for_statement()
-            elif self.current_token.value == 'def':
-                return self.function_definition()
-            elif self.current_token.value == 'return':
-                return self.return_statement()
-        elif self.current_token.type == 'IDENTIFIER':
-            temp_index = self.current_token_index 
-            next_meaningful_token = None
-            while temp_index < len(self.tokens):
-                token = self.tokens[temp_index]
-                if token.type not in ['WHITESPACE', 'COMMENT']:
-                    next_meaningful_token = token
-                    break
-                temp_index += 1
-
-            if next_meaningful_token:
-                if next_meaningful_token.value == '=':
-                    return self.assignment()
-                elif next_meaningful_token.type == 'OPERATOR' and next_meaningful_token.value in ['+=', '-=', '*=', '/=']:
-                    return self.augmented_assignment()
-                elif next_meaningful_token.value == '(':
-                    return self.function_call()
+        token = self.current_token
+        if token is None:
+            raise ParserError("Beklenmedik dosya sonu, bir ifade bekleniyor.", token)
+
+        if token.type == 'KEYWORD':
+            parse_statement = self.keyword_statements.get(token.value)
+            if parse_statement is not None:
+                return parse_statement()
+        elif token.type == 'IDENTIFIER':
+            next_token = self.peek()
+            if next_token is not None:
+                parse_statement = self.identifier_statements.get(next_token.value)
+                if parse_statement is not None:
+                    return parse_statement()
             return self.expression()
 
-        raise ParserError(f"Beklenmedik ifade başlangıcı: '{self.current_token.value}' (Tip: {self.current_token.type})", self.current_token)
+        raise ParserError(f"Beklenmedik ifade başlangıcı: '{token.value}' (Tip: {token.type})", token)
 
     def if_statement(self):
         self.eat('KEYWORD', 'if')
@@ -175,7 +268,7 @@ class Parser:
     def return_statement(self):
         self.eat('KEYWORD', 'return')
         expr = None
-        if self.current_token and (self.current_token.type in ['NUMBER', 'FLOAT', 'STRING', 'IDENTIFIER'] or \
+        if self.current_token and (self.current_token.type in EXPRESSION_START_TYPES or \
            (self.current_token.type == 'OPERATOR' and self.current_token.value == '(')):
             expr = self.expression()
         return {'type': 'ReturnStatement', 'expression': expr}
@@ -194,70 +287,84 @@ class Parser:
         return {'type': 'AugmentedAssignment', 'name': name, 'op': op, 'value': value}
     
 
-    def _parse_binary_operation(self, parse_next_precedence, operators):
+    def expression(self):
         """
-        İkili işlemleri soldan sağa öncelikle ayrıştırmak için yardımcı yöntem.
-        `parse_next_precedence` bir sonraki yüksek öncelik seviyesi için yöntemdir.
-        `operators` mevcut öncelik seviyesi için operatör değerlerinin bir listesidir.
+        İkili işlemleri BINARY_PRECEDENCE tablosuyla (öncelik tırmanma) ayrıştırır.
+        Parantezler ve fonksiyon çağrısı argümanları özyineleme yerine açık bir yığınla izlenir,
+        böylece derin iç içe ifadeler Python'un özyineleme sınırına takılmaz.
+        Yığın çerçevesi: (dış işlenenler, dış operatörler, çağrı adı veya parantez için None, argümanlar).
         """
-        node = parse_next_precedence()
-        while self.current_token and \
-              self.current_token.type == 'OPERATOR' and \
-              self.current_token.value in operators:
-            op = self.eat('OPERATOR').value
-            right = parse_next_precedence()
-            node = {'type': 'BinaryOp', 'left': node, 'op': op, 'right': right}
-        return node
-
-    def expression(self):
-        # Toplama/çıkarma işlemlerini ele alır (en düşük öncelik)
-        return self._parse_binary_operation(self.comparison, ['+', '-'])
-
-    def comparison(self):
-        # Karşılaştırma operatörlerini ele alır
-        return self._parse_binary_operation(self.term, ['==', '!=', '<', '>', '<=', '>='])
-    
-    def term(self):
-        # Çarpma/bölme işlemlerini ele alır
-        return self._parse_binary_operation(self.factor, ['*', '/'])
-
-    def factor(self):
-        token = self.current_token
-
-        if token is None:
-            raise ParserError("Beklenmedik dosya sonu, bir ifade bekleniyor.", token)
+        frames = []
+        operands = []
+        operators = []
+        while True:
+            # Önek konumu: bir işlenen, '(' veya çağrı başlangıcı bekleniyor
+            token = self.current_token
+            if token is None:
+                raise ParserError("Beklenmedik dosya sonu, bir ifade bekleniyor.", token)
+            literal = LITERAL_NODES.get(token.type)
+            if literal is not None:
+                self.advance()
+                operands.append({'type': literal[0], 'value': literal[1](token.value)})
+            elif token.type == 'IDENTIFIER':
+                next_token = self.peek()
+                self.advance()
+                if next_token is None or next_token.value != '(':
+                    operands.append({'type': 'Identifier', 'value': token.value})
+                else:
+                    self.eat('OPERATOR', '(')
+                    if self.current_token and self.current_token.value != ')':
+                        frames.append((operands, operators, token.value, []))
+                        operands = []
+                        operators = []
+                        continue
+                    self.eat('OPERATOR', ')')
+                    operands.append({'type': 'FunctionCall', 'name': token.value, 'arguments': []})
+            elif token.type == 'OPERATOR' and token.value == '(':
+                self.advance()
+                frames.append((operands, operators, None, None))
+                operands = []
+                operators = []
+                continue
+            else:
+                raise ParserError(f"Beklenmedik faktör: '{token.value}' (Tip: {token.type})", token)
 
-        if token.type == 'NUMBER':
-            self.eat('NUMBER')
-            return {'type': 'Number', 'value': int(token.value)}
-        elif token.type == 'FLOAT':
-            self.eat('FLOAT')
-            return {'type': 'Float', 'value': float(token.value)}
-        elif token.type == 'STRING':
-            self.eat('STRING')
-            return {'type': 'String', 'value': token.value.strip('"')}
-        elif token.type == 'IDENTIFIER':
-            temp_index = self.current_token_index
-            next_meaningful_token = None
-            while temp_index < len(self.tokens):
-                token_peek = self.tokens[temp_index]
-                if token_peek.type not in ['WHITESPACE', 'COMMENT']:
-                    next_meaningful_token = token_peek
+            # Sonek konumu: ikili operatör, argüman ayırıcı veya kapanış bekleniyor
+            while True:
+                token = self.current_token
+                precedence = None
+                if token is not None and token.type == 'OPERATOR':
+                    precedence = BINARY_PRECEDENCE.get(token.value)
+                if precedence is not None:
+                    self._reduce(operands, operators, precedence)
+                    operators.append((precedence, token.value))
+                    self.advance()
+                    break
+                self._reduce(operands, operators, 0)
+                node = operands.pop()
+                if not frames:
+                    return node
+                operands, operators, name, arguments = frames.pop()
+                if name is None:
+                    self.eat('OPERATOR', ')')
+                    operands.append({'type': 'ParenthesizedExpression', 'expression': node})
+                    continue
+                arguments.append(node)
+                if token is not None and token.type == 'OPERATOR' and token.value == ',':
+                    self.advance()
+                    frames.append((operands, operators, name, arguments))
+                    operands = []
+                    operators = []
                     break
-                temp_index += 1
+                self.eat('OPERATOR', ')')
+                operands.append({'type': 'FunctionCall', 'name': name, 'arguments': arguments})
 
-            if next_meaningful_token and next_meaningful_token.value == '(':
-                return self.function_call()
-            else:
-                self.eat('IDENTIFIER')
-                return {'type': 'Identifier', 'value': token.value}
-        elif token.type == 'OPERATOR' and token.value == '(':
-            self.eat('OPERATOR', '(')
-            node = self.expression() # Parantez içindeki ifadeyi ayrıştır
-            self.eat('OPERATOR', ')')
-            return {'type': 'ParenthesizedExpression', 'expression': node} # AST'de parantezleri temsil et
-        
-        raise ParserError(f"Beklenmedik faktör: '{token.value}' (Tip: {token.type})", token)
+    def _reduce(self, operands, operators, precedence):
+        # Önceliği en az verilen kadar olan operatörleri soldan birleşimli BinaryOp düğümlerine indirge
+        while operators and operators[-1][0] >= precedence:
+            op = operators.pop()[1]
+            right = operands.pop()
+            operands[-1] = {'type': 'BinaryOp', 'left': operands[-1], 'op': op, 'right': right}
 
     def range_expression(self):
         self.eat('KEYWORD', 'range')
@@ -275,4 +382,153 @@ class Parser:
         except ParserError as e:
             print(f"Sözdizimi Hatası: {e}")
         except Exception as e:
-            print(f"Ayrıştırma sırasında beklenmedik bir hata oluştu: {e}")
\ No newline at end of file
+            print(f"Ayrıştırma sırasında beklenmedik bir hata oluştu: {e}")
+
+def parse_with_recovery(tokens, cancel_event=None):
+    # Tüm hataları tek geçişte topla: (kısmi AST, ParserError listesi; sözdizimi geçerliyse boş)
+    parser = Parser(tokens, cancel_event, recover=True)
+    ast = parser.parse()
+    return ast, parser.errors
+
+class IncrementalParser(Parser):
+    """
+    Her ifadenin alt ağacını token aralığıyla birlikte hatırlayan ayrıştırıcı.
+    Aralıklar göreli tutulur: üst düzey ifadeler uzunluklarıyla, iç içe ifadeler ise ait oldukları
+    ifadenin başına göre konumlarıyla. Böylece düzenlemeden sonraki ifadeler kaydırma gerektirmez.
+    Tokenları ve bitişindeki bakış token'ı değişmemiş ifadeler yeniden ayrıştırılmaz; yalnızca
+    düzenlemeyi içeren ifadeler (ve onları saran bloklar) baştan ayrıştırılır.
+    Paylaşılan AST düğümleri değiştirilmemelidir.
+    """
+    def __init__(self):
+        super().__init__([])
+        # Üst düzey ifadeler: (uzunluk, AST düğümü, çocuklar); çocuklar (göreli başlangıç, aralık) listesidir
+        self.statements = []
+        self.first_start = 0
+        self.line_tokens = [] # Son başarılı ayrıştırmanın LexerState satır tablosu
+        self.token_count = 0
+        self._edit = (0, 0, 0)
+        self._candidates = [] # Yeniden ayrıştırılan ifadelerin eski çocukları: eski başlangıç -> aralık
+        self._children = [] # Yeni ayrıştırılan ifadelerin toplanan çocukları
+
+    def parse_state(self, lex_state, cancel_event=None):
+        # lex_state'in tüm token'larını (yorumlar dahil) ayrıştır, önceki ayrıştırmadan değişmeyen ifadeleri kullan
+        line_tokens = lex_state.line_tokens
+        self.tokens = lex_state.token_sequence()
+        prefix, old_end, shift = self._edit = self._token_edit(self.line_tokens, line_tokens, self.tokens.line_ends)
+        self.cancel_event = cancel_event
+
+        old_statements = self.statements
+        bounds = list(accumulate([span[0] for span in old_statements], initial=self.first_start))
+        # Bitişteki bakış token'ı da önekte kalan üst düzey ifadeler olduğu gibi alınır
+        reused = max(0, bisect_left(bounds, prefix) - 1) if old_statements else 0
+        suffix_index = bisect_left(bounds, old_end, 0, len(old_statements))
+
+        statements = old_statements[:reused]
+        self.current_token_index = bounds[reused] if reused else 0
+        self.advance()
+        first_start = self.first_start if reused else self.current_token_index - 1
+
+        while self.current_token and not (self.current_token.type == 'OPERATOR' and self.current_token.value == '}'):
+            start = self.current_token_index - 1
+            old_start = start - shift
+            if old_start >= old_end:
+                index = bisect_left(bounds, old_start, suffix_index, len(old_statements))
+                if index < len(old_statements) and bounds[index] == old_start:
+                    # Düzenlemeden sonraki tüm üst düzey ifadeler değişmedi
+                    statements.extend(old_statements[index:])
+                    self.current_token_index = bounds[-1] + shift
+                    self.advance()
+                    break
+            counterpart = None
+            old_position = self._old_position(start)
+            if old_position is not None:
+                index = bisect_left(bounds, old_position, 0, len(old_statements))
+                if index < len(old_statements) and bounds[index] == old_position:
+                    counterpart = old_statements[index]
+            statements.append(self._parse_statement(start, old_position, counterpart))
+
+        ast = {'type': 'Program', 'statements': [span[1] for span in statements]}
+        self.statements = statements
+        self.first_start = first_start
+        self.line_tokens = list(line_tokens)
+        self.token_count = len(self.tokens)
+        return ast
+
+    def advance(self):
+        # Satır tablosu görünümü boşluk ve yorumları da içerir; bunlar eleme yerine burada atlanır
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            raise ParseCancelled()
+        while self.current_token_index < len(self.tokens):
+            token = self.tokens[self.current_token_index]
+            self.current_token_index += 1
+            if token.type not in SKIPPED_TOKEN_TYPES:
+                self.current_token = token
+                return
+        self.current_token = None
+
+    def peek(self):
+        index = self.current_token_index
+        while index < len(self.tokens):
+            token = self.tokens[index]
+            if token.type not in SKIPPED_TOKEN_TYPES:
+                return token
+            index += 1
+        return None
+
+    def _token_edit(self, old_lines, new_lines, line_ends):
+        # Satır tablolarının ortak önek/sonekinden token düzeyinde (önek, eski bitiş, kayma) hesapla.
+        # line_ends, yeni satır tablosundaki birikimli token sayılarıdır.
+        prefix_lines = common_prefix_length(old_lines, new_lines)
+        limit = min(len(old_lines), len(new_lines)) - prefix_lines
+        suffix_lines = common_suffix_length(old_lines, new_lines, limit)
+        new_total = line_ends[-1] if line_ends else 0
+        prefix = line_ends[prefix_lines - 1] if prefix_lines else 0
+        suffix = new_total - line_ends[len(new_lines) - suffix_lines - 1] if suffix_lines < len(new_lines) else new_total
+        return prefix, self.token_count - suffix, new_total - self.token_count
+
+    def _old_position(self, start):
+        # Yeni token indeksinin eski ayrıştırmadaki karşılığı; düzenlenen bölgenin içindeyse None
+        prefix, old_end, shift = self._edit
+        if start < prefix:
+            return start
+        if start - shift >= old_end:
+            return start - shift
+        return None
+
+    def _reusable(self, old_position, span):
+        # Önekteki ifadenin bakış token'ı da önekte olmalı; sonekteki ifadeler her zaman geçerlidir
+        prefix, old_end, shift = self._edit
+        if old_position < prefix:
+            return old_position + span[0] < prefix
+        return old_position >= old_end
+
+    def _parse_statement(self, start, old_position, counterpart):
+        # İfadeyi baştan ayrıştır; içindeki ifadeler için eski karşılığın çocuklarını aday olarak sun
+        candidates = {}
+        if counterpart is not None:
+            candidates = {old_position + relative: span for relative, span in counterpart[2]}
+        self._candidates.append(candidates)
+        self._children.append([])
+        try:
+            node = super().statement()
+        finally:
+            self._candidates.pop()
+            children = self._children.pop()
+        end = self.current_token_index - 1 if self.current_token else len(self.tokens)
+        return (end - start, node, [(child_start - start, span) for child_start, span in children])
+
+    def statement(self):
+        # Yalnızca blok gövdelerindeki iç içe ifadeler için çağrılır
+        start = self.current_token_index - 1
+        old_position = self._old_position(start)
+        span = None
+        if old_position is not None:
+            span = self._candidates[-1].get(old_position)
+        if span is not None and self._reusable(old_position, span):
+            # Önceki ayrıştırmanın düğümünü kullan ve ifadenin sonuna atla
+            self.current_token_index = start + span[0]
+            self.advance()
+        else:
+            span = self._parse_statement(start, old_position, span)
+        self._children[-1].append((start, span))
+        return span[1]
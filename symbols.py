@@ -0,0 +1,270 @@
+import threading
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from operator import itemgetter
+
+from lexer import common_prefix_length, common_suffix_length
+from parser import SKIPPED_TOKEN_TYPES
+
+# Üst düzey (global) kapsam; fonksiyon kapsamları def token'ının ifade içindeki göreli indeksidir
+GLOBAL_SCOPE = -1
+# Bir ismi bağlayan kullanım türleri
+DEFINITION_KINDS = frozenset(('function', 'parameter', 'variable'))
+# Önündeki ismi bağlayan operatörler; bileşik atama da (x += 1) yorumlayıcıda yerel atamadır
+ASSIGNMENT_OPERATORS = frozenset(('=', '+=', '-=', '*=', '/='))
+
+class StatementSymbols:
+    """
+    Bir üst düzey ifadedeki isim kullanımları: (göreli token indeksi, isim, tür, kapsam) dörtlüleri.
+    Tür 'function' (def adı), 'parameter', 'variable' (atama, bileşik atama veya for yineleyicisi) ya da
+    'reference'dır.
+    İndeksler ifadenin ilk token'ına göredir; ifade kaydığında kayıt değişmeden kalır.
+    """
+    __slots__ = ('occurrences', 'positions', 'by_name', 'parents', 'local_definitions', 'global_definitions')
+
+    def __init__(self, occurrences, parents):
+        self.occurrences = occurrences
+        self.positions = [occurrence[0] for occurrence in occurrences]
+        self.parents = parents # Fonksiyon kapsamı -> onu içeren kapsam
+        self.by_name = {}
+        self.local_definitions = {} # (kapsam, isim) -> ilk tanımın göreli indeksi
+        self.global_definitions = {} # isim -> ilk global tanımın göreli indeksi
+        for occurrence in occurrences:
+            relative, name, kind, scope = occurrence
+            self.by_name.setdefault(name, []).append(occurrence)
+            if kind in DEFINITION_KINDS:
+                if scope == GLOBAL_SCOPE:
+                    self.global_definitions.setdefault(name, relative)
+                else:
+                    self.local_definitions.setdefault((scope, name), relative)
+
+    def resolve(self, name, scope):
+        # İsmi bağlayan fonksiyon kapsamı; hiçbir fonksiyonda tanımlı değilse GLOBAL_SCOPE
+        while scope != GLOBAL_SCOPE:
+            if (scope, name) in self.local_definitions:
+                return scope
+            scope = self.parents[scope]
+        return GLOBAL_SCOPE
+
+def statement_symbols(tokens):
+    """
+    (göreli indeks, tip, değer) token'larından bir ifadenin isim kullanımlarını çıkarır.
+    Parser.function_definition, for_statement, assignment ve augmented_assignment ile aynı kalıplar izlenir:
+    def'ten sonraki isim fonksiyon, parantez içindekiler parametre, for '(' sonrasındaki ve ardından '=' ya da
+    bileşik atama operatörü gelen isim değişken tanımıdır; gövde '{ }' içindeki kullanımlar fonksiyonun kapsamındadır.
+    """
+    significant = [token for token in tokens if token[1] not in SKIPPED_TOKEN_TYPES]
+    occurrences = []
+    parents = {}
+    scopes = [(GLOBAL_SCOPE, 0)] # (kapsam, gövdesini açan '{' derinliği)
+    depth = 0
+    expect = None
+    definition = None # Adı okunan, gövdesi henüz açılmamış def
+    for index, (relative, token_type, value) in enumerate(significant):
+        if token_type == 'KEYWORD':
+            if value == 'def':
+                expect = 'function'
+                definition = relative
+            elif value == 'for':
+                expect = 'for'
+            continue
+        if token_type == 'OPERATOR':
+            if value == '{':
+                depth += 1
+                if definition is not None and expect is None:
+                    scopes.append((definition, depth))
+                    definition = None
+            elif value == '}':
+                if len(scopes) > 1 and scopes[-1][1] == depth:
+                    scopes.pop()
+                depth -= 1
+            elif value == '(' and expect in ('parameters', 'for'):
+                expect = 'parameter' if expect == 'parameters' else 'iterator'
+            elif value == ')' and expect == 'parameter':
+                expect = None
+            continue
+        if token_type != 'IDENTIFIER':
+            continue
+        scope = scopes[-1][0]
+        if expect == 'function':
+            kind = 'function'
+            parents[definition] = scope
+            expect = 'parameters'
+        elif expect == 'parameter':
+            kind = 'parameter'
+            scope = definition
+        elif expect == 'iterator':
+            kind = 'variable'
+            expect = None
+        elif index + 1 < len(significant) and significant[index + 1][1] == 'OPERATOR' and \
+                significant[index + 1][2] in ASSIGNMENT_OPERATORS:
+            kind = 'variable'
+        else:
+            kind = 'reference'
+        occurrences.append((relative, value, kind, scope))
+    return StatementSymbols(occurrences, parents)
+
+class SymbolIndex:
+    """
+    IncrementalParser'ın üst düzey ifade aralıkları üzerine kurulu tanım/kullanım dizini.
+    Değişmeyen ifadeler ayrıştırıcıdan aynı nesne olarak döndüğü için bir güncellemede yalnızca
+    yeniden ayrıştırılan ifadelerin token'ları okunur; isimden ifade kayıtlarına giden tablo da
+    yalnızca bu kayıtlar için değişir. Analiz iş parçacığında güncellenir, Tk iş parçacığında sorgulanır.
+    Sorgular 1 tabanlı satır, 0 tabanlı sütun kullanır.
+    """
+    def __init__(self):
+        self.statements = [] # Son ayrıştırmanın ifade aralıkları (kimlikleri yeniden kullanılmasın diye tutulur)
+        self.statement_ids = []
+        self.records = [] # İfade başına StatementSymbols
+        self.bounds = [0] # İfadelerin başlangıç token indeksleri ve son ifadenin bitişi
+        self.names = {} # isim -> o ismi içeren kayıtlar
+        self.line_tokens = []
+        self.line_ends = []
+        self.generation = 0 # Dizinin karşılık geldiği analiz kuşağı
+        self._order = None # id(kayıt) -> ifade sırası; ilk ihtiyaçta oluşturulur
+        self._lock = threading.Lock()
+
+    def update(self, parser, generation):
+        # parser: parse_state'i yeni tamamlanmış IncrementalParser
+        self._update(parser.statements, parser.first_start, parser.tokens.lex_state.line_tokens,
+                     parser.tokens.line_ends, generation)
+
+    def update_unparsed(self, lex_state, generation):
+        # Sözdizimi hatalı belge: ifade aralıkları olmadığından tüm belge tek ifade sayılır. Kullanımlar
+        # yalnızca token'lardan çıkarıldığı için dizin hatalı ifadelerdeki isimleri de içerir.
+        line_ends = lex_state.token_sequence().line_ends
+        token_count = line_ends[-1] if line_ends else 0
+        self._update([(token_count, None, [])], 0, lex_state.line_tokens, line_ends, generation)
+
+    def _update(self, statements, first_start, line_tokens, line_ends, generation):
+        old_ids = self.statement_ids
+        new_ids = list(map(id, statements))
+        prefix = common_prefix_length(old_ids, new_ids)
+        suffix = common_suffix_length(old_ids, new_ids, min(len(old_ids), len(new_ids)) - prefix)
+        bounds = list(accumulate(map(itemgetter(0), statements), initial=first_start))
+        records = [
+            statement_symbols(self._statement_tokens(line_tokens, line_ends, bounds[index], bounds[index + 1]))
+            for index in range(prefix, len(statements) - suffix)
+        ]
+        with self._lock:
+            for record in self.records[prefix:len(self.records) - suffix]:
+                for name in record.by_name:
+                    holders = self.names[name]
+                    holders.discard(record)
+                    if not holders:
+                        del self.names[name]
+            for record in records:
+                for name in record.by_name:
+                    self.names.setdefault(name, set()).add(record)
+            self.records[prefix:len(self.records) - suffix] = records
+            self.statements = statements
+            self.statement_ids = new_ids
+            self.bounds = bounds
+            self.line_tokens = line_tokens
+            self.line_ends = line_ends
+            self.generation = generation
+            self._order = None
+
+    def _statement_tokens(self, line_tokens, line_ends, start, stop):
+        # [start, stop) token aralığı, satır tablosundan sırayla: (göreli indeks, tip, değer)
+        line = bisect_right(line_ends, start)
+        index = start
+        first = line_ends[line - 1] if line else 0
+        while index < stop:
+            for token_type, value, column in line_tokens[line][index - first:stop - first]:
+                yield index - start, token_type, value
+                index += 1
+            first = line_ends[line]
+            line += 1
+
+    def _position(self, index):
+        # Mutlak token indeksinin (satır, sütun, uzunluk) karşılığı; satır 1 tabanlı
+        line = bisect_right(self.line_ends, index)
+        first = self.line_ends[line - 1] if line else 0
+        token_type, value, column = self.line_tokens[line][index - first]
+        return line + 1, column, len(value)
+
+    def _lookup(self, line, column):
+        # İmleçteki (veya hemen solundaki) tanımlayıcının (ifade sırası, kullanım) çifti
+        if not 1 <= line <= len(self.line_tokens):
+            return None
+        first = self.line_ends[line - 2] if line > 1 else 0
+        for offset, (token_type, value, token_column) in enumerate(self.line_tokens[line - 1]):
+            if token_type == 'IDENTIFIER' and token_column <= column <= token_column + len(value):
+                index = first + offset
+                break
+        else:
+            return None
+        statement = bisect_right(self.bounds, index) - 1
+        if not 0 <= statement < len(self.records):
+            return None
+        record = self.records[statement]
+        relative = index - self.bounds[statement]
+        position = bisect_left(record.positions, relative)
+        if position == len(record.positions) or record.positions[position] != relative:
+            return None
+        return statement, record.occurrences[position]
+
+    def _statement_range(self, start_line, end_line):
+        # 1 tabanlı [start_line, end_line) satırlarıyla kesişen ifadelerin [ilk, son) sıraları
+        start_line = max(1, min(start_line, len(self.line_ends) + 1))
+        end_line = max(start_line, min(end_line, len(self.line_ends) + 1))
+        first_token = self.line_ends[start_line - 2] if start_line > 1 else 0
+        end_token = self.line_ends[end_line - 2] if end_line > 1 else 0
+        first = max(0, bisect_right(self.bounds, first_token) - 1)
+        last = min(len(self.records), bisect_left(self.bounds, end_token) + 1)
+        return first, last
+
+    def _statement_order(self, record):
+        if self._order is None:
+            self._order = {id(item): index for index, item in enumerate(self.records)}
+        return self._order[id(record)]
+
+    def definition(self, line, column):
+        # İmleçteki ismin tanımının (satır, sütun, uzunluk) konumu; tanım yoksa None
+        with self._lock:
+            found = self._lookup(line, column)
+            if found is None:
+                return None
+            statement, (relative, name, kind, scope) = found
+            record = self.records[statement]
+            binding = record.resolve(name, scope)
+            if binding != GLOBAL_SCOPE:
+                return self._position(self.bounds[statement] + record.local_definitions[(binding, name)])
+            # Global isimlerin tanımı belgedeki ilk global tanımdır
+            best = None
+            for holder in self.names.get(name, ()):
+                if name in holder.global_definitions:
+                    order = self._statement_order(holder)
+                    if best is None or order < best[0]:
+                        best = (order, holder.global_definitions[name])
+            if best is None:
+                return None
+            return self._position(self.bounds[best[0]] + best[1])
+
+    def references(self, line, column, lines=None):
+        """
+        İmleçteki ismin aynı tanıma bağlanan kullanımları (tanımlar dahil), belge sırasıyla (satır, sütun, uzunluk).
+        lines verilirse (başlangıç, bitiş) yalnızca bu satırlarla kesişen ifadelerdeki kullanımlar döner.
+        """
+        with self._lock:
+            found = self._lookup(line, column)
+            if found is None:
+                return []
+            statement, (relative, name, kind, scope) = found
+            record = self.records[statement]
+            binding = record.resolve(name, scope)
+            if binding != GLOBAL_SCOPE:
+                holders = [(statement, record)]
+            else:
+                holders = [(self._statement_order(holder), holder) for holder in self.names.get(name, ())]
+            if lines is not None:
+                first, last = self._statement_range(*lines)
+                holders = [item for item in holders if first <= item[0] < last]
+            positions = []
+            for order, holder in sorted(holders, key=itemgetter(0)):
+                start = self.bounds[order]
+                for occurrence_relative, _, _, occurrence_scope in holder.by_name[name]:
+                    if holder.resolve(name, occurrence_scope) == binding:
+                        positions.append(self._position(start + occurrence_relative))
+            return positions
@@ -0,0 +1,85 @@
+def line_pieces(lex_state, line_index, tags):
+    """
+    0 tabanlı satırdaki vurgulama parçalarını (etiket, başlangıç sütunu, bitiş sütunu) kümesi olarak döndürür.
+    Çok satırlı token'lar her satırda ayrı bir parçaya bölünür; bitiş sütunu None ise parça
+    satır sonu karakteri dahil satırın sonuna kadar uzanır.
+    """
+    pieces = set()
+    line_tokens = lex_state.line_tokens
+    open_type = lex_state.line_states[line_index]
+    if open_type is not None and open_type in tags:
+        # Satırı kaplayan token, token başlatan en yakın önceki satırın son token'ıdır
+        start_line = line_index - 1
+        while not line_tokens[start_line]:
+            start_line -= 1
+        value = line_tokens[start_line][-1][1]
+        if value.count('\n') == line_index - start_line:
+            pieces.add((open_type, 0, len(value) - value.rfind('\n') - 1))
+        else:
+            pieces.add((open_type, 0, None))
+
+    for token_type, value, column in line_tokens[line_index]:
+        if token_type in tags:
+            if '\n' in value:
+                pieces.add((token_type, column, None))
+            else:
+                pieces.add((token_type, column, column + len(value)))
+    return pieces
+
+class TagSynchronizer:
+    """
+    Token akışı ile Text bileşeni arasındaki etiket katmanı.
+    Her satıra en son uygulanan parçaları hatırlar; güncellemede yalnızca eklenen ve
+    kaldırılan aralıkları gönderir ve aynı etiketin tüm aralıklarını tek bir çok aralıklı
+    'tag add' / 'tag remove' Tcl çağrısında toplar.
+    """
+    def __init__(self, text_widget, tags):
+        self.text_widget = text_widget
+        self.tags = tags
+        # Her satır için uygulanmış parçalar; None, satırdaki etiketlerin bilinmediği anlamına gelir
+        self.applied = []
+        self.last_call_count = 0
+        self.total_call_count = 0
+
+    def lines_edited(self, start, old_end, new_end):
+        # Metni değişen satırlara Tk eklenen karakterlere komşu etiketleri miras verebilir,
+        # bu yüzden bu satırların etiketleri bilinmiyor kabul edilir; sonraki satırlar kayar
+        self.applied[start - 1:old_end - 1] = [None] * (new_end - start)
+
+    def sync(self, lex_state, line_ranges):
+        # line_ranges: 1 tabanlı [başlangıç, bitiş) satır aralıkları. Yapılan Tcl çağrısı sayısını döndürür.
+        additions = {}
+        removals = {}
+        for range_start, range_end in line_ranges:
+            for line_number in range(range_start, range_end):
+                index = line_number - 1
+                new_pieces = line_pieces(lex_state, index, self.tags)
+                old_pieces = self.applied[index]
+                if old_pieces is None:
+                    # Satırı tüm etiketlerden temizle, ardından bütün parçaları ekle
+                    for tag in self.tags:
+                        removals.setdefault(tag, []).extend((f"{line_number}.0", f"{line_number + 1}.0"))
+                    added = new_pieces
+                else:
+                    for tag, start, end in old_pieces - new_pieces:
+                        removals.setdefault(tag, []).extend(self._piece_indices(line_number, start, end))
+                    added = new_pieces - old_pieces
+                for tag, start, end in added:
+                    additions.setdefault(tag, []).extend(self._piece_indices(line_number, start, end))
+                self.applied[index] = new_pieces
+
+        calls = 0
+        for tag, indices in removals.items():
+            self.text_widget.tk.call(self.text_widget._w, 'tag', 'remove', tag, *indices)
+            calls += 1
+        for tag, indices in additions.items():
+            self.text_widget.tag_add(tag, *indices)
+            calls += 1
+        self.last_call_count = calls
+        self.total_call_count += calls
+        return calls
+
+    def _piece_indices(self, line_number, start, end):
+        if end is None:
+            return f"{line_number}.{start}", f"{line_number + 1}.0"
+        return f"{line_number}.{start}", f"{line_number}.{end}"
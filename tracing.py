@@ -0,0 +1,111 @@
+import json
+import threading
+import time
+from collections import deque
+
+# Yüzdelik dilimlerin hesaplandığı kayan pencere (her aşama için son ölçüm sayısı)
+DEFAULT_WINDOW = 200
+# Chrome izinde tutulan en fazla olay sayısı; uzun oturumlarda en eskiler düşer
+MAX_TRACE_EVENTS = 100000
+
+class _NullSpan:
+    # İzleme kapalıyken kullanılan, hiçbir şey yapmayan paylaşılan bağlam yöneticisi
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        return False
+
+NULL_SPAN = _NullSpan()
+
+class _Span:
+    __slots__ = ('tracer', 'name', 'start')
+
+    def __init__(self, tracer, name):
+        self.tracer = tracer
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.tracer.record(self.name, self.start, time.perf_counter())
+        return False
+
+class LatencyTracer:
+    """
+    Düzenleme döngüsünün aşamalarını (satır numaraları, lexleme, etiketler, ayrıştırma...) ölçer.
+    Her aşamanın son ölçümlerinden p50/p95 hesaplanır; tüm ölçümler Chrome iz olayı (trace event)
+    olarak da tutulur ve chrome://tracing veya Perfetto ile açılabilen bir JSON dosyasına yazılabilir.
+    Kapalıyken span() paylaşılan boş bir nesne döndürür, böylece ölçüm noktalarının maliyeti ihmal edilebilir.
+    Ölçümler Tk ve analiz iş parçacıklarından gelebilir; deque eklemeleri iş parçacığı güvenlidir.
+    """
+    def __init__(self, enabled=False, window=DEFAULT_WINDOW, max_events=MAX_TRACE_EVENTS):
+        self.enabled = enabled
+        self.window = window
+        self.samples = {} # Aşama adı -> son süreler (s)
+        self.events = deque(maxlen=max_events) # (aşama, başlangıç, bitiş, iş parçacığı kimliği)
+        self.thread_names = {}
+        self.origin = time.perf_counter()
+
+    def span(self, name):
+        if not self.enabled:
+            return NULL_SPAN
+        return _Span(self, name)
+
+    def now(self):
+        return time.perf_counter()
+
+    def record(self, name, start, end):
+        samples = self.samples.get(name)
+        if samples is None:
+            samples = self.samples.setdefault(name, deque(maxlen=self.window))
+        samples.append(end - start)
+        thread_id = threading.get_ident()
+        if thread_id not in self.thread_names:
+            self.thread_names[thread_id] = threading.current_thread().name
+        self.events.append((name, start, end, thread_id))
+
+    def clear(self):
+        self.samples.clear()
+        self.events.clear()
+
+    def percentile(self, name, fraction):
+        # En yakın sıra yöntemiyle yüzdelik (s); ölçüm yoksa None
+        samples = self.samples.get(name)
+        if not samples:
+            return None
+        ordered = sorted(samples)
+        rank = max(0, min(len(ordered) - 1, int(fraction * len(ordered) + 0.5) - 1))
+        return ordered[rank]
+
+    def summary(self, labels):
+        # labels: (aşama adı, gösterilecek ad) çiftleri; ör. "lex 1.2/3.4" (p50/p95, ms)
+        parts = []
+        for name, label in labels:
+            p50 = self.percentile(name, 0.50)
+            if p50 is not None:
+                parts.append(f"{label} {p50 * 1000:.1f}/{self.percentile(name, 0.95) * 1000:.1f}")
+        if not parts:
+            return ''
+        return "p50/p95 ms: " + " · ".join(parts)
+
+    def chrome_trace(self):
+        # Chrome iz olayı biçimi: tamamlanmış ('X') olaylar, zaman damgaları mikrosaniye
+        events = [
+            {'name': 'thread_name', 'ph': 'M', 'pid': 1, 'tid': thread_id, 'args': {'name': thread_name}}
+            for thread_id, thread_name in self.thread_names.items()
+        ]
+        for name, start, end, thread_id in list(self.events):
+            events.append({
+                'name': name, 'cat': 'editor', 'ph': 'X', 'pid': 1, 'tid': thread_id,
+                'ts': round((start - self.origin) * 1e6, 3), 'dur': round((end - start) * 1e6, 3),
+            })
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def write_chrome_trace(self, path):
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(self.chrome_trace(), file)
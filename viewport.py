@@ -0,0 +1,53 @@
+class LineRangeSet:
+    """
+    Vurgulaması güncel olan satır aralıklarının sıralı ve ayrık listesi.
+    Aralıklar 1 tabanlı satır numaralarıyla [başlangıç, bitiş) biçiminde tutulur.
+    """
+    def __init__(self):
+        self.ranges = []
+
+    def clear(self):
+        self.ranges = []
+
+    def add(self, start, end):
+        if start >= end:
+            return
+        merged = []
+        for range_start, range_end in self.ranges:
+            if range_end < start or range_start > end:
+                merged.append((range_start, range_end))
+            else:
+                # Çakışan veya bitişik aralıkları birleştir
+                start = min(start, range_start)
+                end = max(end, range_end)
+        merged.append((start, end))
+        merged.sort()
+        self.ranges = merged
+
+    def missing(self, start, end):
+        # [start, end) içinde kapsanmayan alt aralıkların listesi
+        gaps = []
+        position = start
+        for range_start, range_end in self.ranges:
+            if range_end <= position:
+                continue
+            if range_start >= end:
+                break
+            if range_start > position:
+                gaps.append((position, range_start))
+            position = max(position, range_end)
+        if position < end:
+            gaps.append((position, end))
+        return gaps
+
+    def replace(self, start, old_end, new_end):
+        # Eski [start, old_end) satırları yeni [start, new_end) satırlarıyla değişti:
+        # bu satırlar güncel değildir, sonrasındaki aralıklar satır farkı kadar kaydırılır.
+        delta = new_end - old_end
+        updated = []
+        for range_start, range_end in self.ranges:
+            if range_start < start:
+                updated.append((range_start, min(range_end, start)))
+            if range_end > old_end:
+                updated.append((max(range_start, old_end) + delta, range_end + delta))
+        self.ranges = updated
@@ -0,0 +1,685 @@
+import builtins
+import operator
+
+# İşlem kodları. Kod düz bir tamsayı listesidir: her komut (işlem kodu, argüman) çiftidir, atlama hedefleri
+# komut indeksleridir (listedeki konumun yarısı). Kodlar VirtualMachine.run'daki karşılaştırma zincirinin gruplarıyla aynı
+# sıradadır; döngülerde en sık çalışanlar öndedir.
+LOAD_FAST = 0                       # Yerel yuvayı yığına koy (üst düzey kodda yuvalar global değişkenlerdir)
+LOAD_FAST_LOAD_FAST = 1             # İki yerel yuva: argüman (yuva1 << ARGUMENT_BITS) | yuva2
+LOAD_FAST_LOAD_CONST = 2            # Yerel yuva ve sabit: argüman (yuva << ARGUMENT_BITS) | sabit
+LOAD_CONST = 3                      # Sabit havuzundaki değeri yığına koy
+STORE_FAST = 4                      # Yığının tepesini yerel yuvaya yaz
+BINARY_ADD = 5
+BINARY_SUBTRACT = 6
+BINARY_MULTIPLY = 7
+BINARY_DIVIDE = 8
+COMPARE_JUMP_IF_FALSE = 9           # İki değeri karşılaştır, yanlışsa atla: argüman (hedef << COMPARE_BITS) | tür
+FOR_ITER_STORE = 10                 # range yineleyicisinin sıradaki değerini yuvaya yaz; bittiyse yineleyiciyi
+                                    # at ve atla: argüman (hedef << ARGUMENT_BITS) | yuva
+JUMP_BACKWARD = 11                  # Döngü başına atla (iptal denetimi geri atlamalarda yapılır)
+COMPARE_JUMP_BACKWARD_IF_TRUE = 12  # while koşulu döngünün sonunda sınanır; argüman COMPARE_JUMP_IF_FALSE gibi
+CALL = 13                           # Argüman sayısı kadar değeri ve altındaki fonksiyonu alıp çağır
+RETURN_VALUE = 14
+LOAD_GLOBAL = 15                    # Fonksiyon içinden global yuvayı oku
+COMPARE = 16                        # Karşılaştırma sonucunu yığına koy; argüman COMPARISONS'taki tür
+POP_JUMP_IF_FALSE = 17
+POP_JUMP_BACKWARD_IF_TRUE = 18
+LOAD_BUILTIN = 19                   # Yerleşik fonksiyonu (BUILTIN_NAMES sırası) yığına koy
+POP_TOP = 20
+JUMP = 21
+GET_RANGE = 22                      # Tepedeki sayıyı range yineleyicisiyle değiştir
+
+OPCODE_NAMES = (
+    'LOAD_FAST', 'LOAD_FAST_LOAD_FAST', 'LOAD_FAST_LOAD_CONST', 'LOAD_CONST', 'STORE_FAST',
+    'BINARY_ADD', 'BINARY_SUBTRACT', 'BINARY_MULTIPLY', 'BINARY_DIVIDE',
+    'COMPARE_JUMP_IF_FALSE', 'FOR_ITER_STORE', 'JUMP_BACKWARD', 'COMPARE_JUMP_BACKWARD_IF_TRUE',
+    'CALL', 'RETURN_VALUE', 'LOAD_GLOBAL', 'COMPARE', 'POP_JUMP_IF_FALSE', 'POP_JUMP_BACKWARD_IF_TRUE',
+    'LOAD_BUILTIN', 'POP_TOP', 'JUMP', 'GET_RANGE',
+)
+
+# Birleşik komutlarda alt argümanın bit sayısı; bir gövdede en fazla bu kadar yuva olabilir
+ARGUMENT_BITS = 20
+ARGUMENT_MASK = (1 << ARGUMENT_BITS) - 1
+# Karşılaştırmalı atlamalarda karşılaştırma türünün bit sayısı
+COMPARE_BITS = 3
+COMPARE_MASK = (1 << COMPARE_BITS) - 1
+
+# Aritmetik operatörlerin işlem kodları
+ARITHMETIC_OPCODES = {'+': BINARY_ADD, '-': BINARY_SUBTRACT, '*': BINARY_MULTIPLY, '/': BINARY_DIVIDE}
+# Karşılaştırma türleri (COMPARE argümanı)
+COMPARISONS = ('<', '>', '<=', '>=', '==', '!=')
+# Sabit katlamada kullanılan Python karşılıkları
+OPERATOR_FUNCTIONS = {
+    '+': operator.add, '-': operator.sub, '*': operator.mul, '/': operator.truediv,
+    '<': operator.lt, '>': operator.gt, '<=': operator.le, '>=': operator.ge, '==': operator.eq, '!=': operator.ne,
+}
+# Artırılmış atamaların ikili operatörü
+AUGMENTED_OPERATORS = {'+=': '+', '-=': '-', '*=': '*', '/=': '/'}
+
+# Programların çağırabildiği yerleşik fonksiyonlar; print çıktıyı VirtualMachine.output'a yazar
+BUILTIN_NAMES = ('print', 'len', 'abs', 'min', 'max', 'int', 'float', 'str')
+# Katlanan dizgilerin en fazla uzunluğu; daha uzun sonuçlar (ör. "a" * 1000000) çalışırken üretilir
+MAX_FOLDED_LENGTH = 4096
+# Çağrı derinliği sınırı; fonksiyon çağrıları Python yığınını kullanmaz, bu sınır sonsuz özyinelemeyi durdurur
+MAX_CALL_DEPTH = 10000
+# İptal olayının kaç geri atlama veya çağrıda bir denetlendiği
+CANCEL_CHECK_INTERVAL = 1 << 12
+
+class CompileError(Exception):
+    pass
+
+class VMError(Exception):
+    # Çalışma zamanı hatası (atanmamış değişken, tip uyuşmazlığı, sıfıra bölme, derinlik sınırı)
+    pass
+
+class ExecutionCancelled(Exception):
+    # Çalışan program dışarıdan (yeni çalıştırma, kapanış) durdurulduğunda
+    pass
+
+class _Unbound:
+    # Henüz değer atanmamış yuvaların değeri
+    __slots__ = ()
+
+    def __repr__(self):
+        return '<atanmamış>'
+
+UNBOUND = _Unbound()
+
+class CodeObject:
+    """
+    Derlenmiş bir fonksiyon veya program gövdesi. code (işlem kodu, argüman) çiftlerinden oluşan düz
+    tamsayı listesidir; constants sabit havuzu, local_names yuvaların isimleridir (ilk argument_count
+    tanesi parametrelerdir). Programın kendi gövdesinde yuvalar global değişkenlerdir.
+    instructions aynı komutların (işlem kodu, argüman) demetleridir; makine her komutu tek indekslemeyle okur.
+    """
+    __slots__ = ('name', 'code', 'instructions', 'constants', 'local_names', 'argument_count')
+
+    def __init__(self, name, code, constants, local_names, argument_count=0):
+        self.name = name
+        self.code = code
+        self.instructions = list(zip(code[0::2], code[1::2]))
+        self.constants = constants
+        self.local_names = local_names
+        self.argument_count = argument_count
+
+    def __repr__(self):
+        return f"CodeObject(name='{self.name}', instructions={len(self.code) // 2})"
+
+class Function:
+    __slots__ = ('name', 'code')
+
+    def __init__(self, name, code):
+        self.name = name
+        self.code = code
+
+    def __repr__(self):
+        return f'<fonksiyon {self.name}>'
+
+def disassemble(code_object):
+    # Kodun okunur dökümü (hata ayıklama için); birleşik argümanlar çözülür, sabitler ve yuva isimleri yanına yazılır
+    names = code_object.local_names
+    constants = code_object.constants
+    lines = []
+    for pc, (opcode, argument) in enumerate(code_object.instructions):
+        if opcode in (LOAD_FAST, STORE_FAST):
+            note = names[argument]
+        elif opcode == LOAD_CONST:
+            note = repr(constants[argument])
+        elif opcode == LOAD_FAST_LOAD_FAST:
+            note = f"{names[argument >> ARGUMENT_BITS]}, {names[argument & ARGUMENT_MASK]}"
+        elif opcode == LOAD_FAST_LOAD_CONST:
+            note = f"{names[argument >> ARGUMENT_BITS]}, {constants[argument & ARGUMENT_MASK]!r}"
+        elif opcode in (COMPARE_JUMP_IF_FALSE, COMPARE_JUMP_BACKWARD_IF_TRUE):
+            note = f"{COMPARISONS[argument & COMPARE_MASK]} -> {argument >> COMPARE_BITS}"
+        elif opcode == FOR_ITER_STORE:
+            note = f"{names[argument & ARGUMENT_MASK]}, bitince -> {argument >> ARGUMENT_BITS}"
+        elif opcode == COMPARE:
+            note = COMPARISONS[argument]
+        elif opcode == LOAD_BUILTIN:
+            note = BUILTIN_NAMES[argument]
+        else:
+            note = ''
+        lines.append(f"{pc:>6} {OPCODE_NAMES[opcode]:<30} {argument:>8} {note}".rstrip())
+    return '\n'.join(lines)
+
+def assigned_names(statements, names):
+    # Bir gövdede değer atanan isimler (iç içe fonksiyon gövdeleri hariç), ilk görülme sırasıyla
+    for statement in statements:
+        statement_type = statement['type']
+        if statement_type in ('Assignment', 'AugmentedAssignment', 'FunctionDefinition'):
+            names.setdefault(statement['name'], len(names))
+        elif statement_type == 'ForStatement':
+            names.setdefault(statement['iterator'], len(names))
+            assigned_names(statement['body']['statements'], names)
+        elif statement_type == 'WhileStatement':
+            assigned_names(statement['body']['statements'], names)
+        elif statement_type == 'IfStatement':
+            assigned_names(statement['body']['statements'], names)
+            if statement['else_body'] is not None:
+                assigned_names(statement['else_body']['statements'], names)
+    return names
+
+def fold_constants(node):
+    """
+    İfadeyi sabitleri katlanmış bir kopyaya çevirir: sabit işlenenli ikili işlemler 'Constant' düğümüne
+    indirgenir, parantezler kaldırılır. Ayrıştırıcı gibi açık bir yığın kullanır; derin ifadeler
+    özyineleme sınırına takılmaz. Çalışırken hata verecek işlemler (sıfıra bölme, tip uyuşmazlığı)
+    katlanmaz, hata çalışma zamanında oluşur.
+    """
+    results = []
+    stack = [(node, False)]
+    while stack:
+        node, visited = stack.pop()
+        node_type = node['type']
+        if node_type in ('Number', 'Float', 'String'):
+            results.append({'type': 'Constant', 'value': node['value']})
+        elif node_type == 'Identifier' or node_type == 'Constant':
+            results.append(node)
+        elif node_type == 'ParenthesizedExpression':
+            stack.append((node['expression'], False))
+        elif node_type == 'BinaryOp':
+            if not visited:
+                stack.append((node, True))
+                stack.append((node['right'], False))
+                stack.append((node['left'], False))
+                continue
+            right = results.pop()
+            left = results.pop()
+            folded = None
+            if left['type'] == 'Constant' and right['type'] == 'Constant':
+                folded = _fold(node['op'], left['value'], right['value'])
+            results.append(folded or {'type': 'BinaryOp', 'left': left, 'op': node['op'], 'right': right})
+        elif node_type == 'FunctionCall':
+            arguments = node['arguments']
+            if not visited:
+                stack.append((node, True))
+                stack.extend((argument, False) for argument in reversed(arguments))
+                continue
+            folded_arguments = results[len(results) - len(arguments):]
+            del results[len(results) - len(arguments):]
+            results.append({'type': 'FunctionCall', 'name': node['name'], 'arguments': folded_arguments})
+        else:
+            raise CompileError(f"Desteklenmeyen ifade: {node_type}")
+    return results[0]
+
+def _fold(op, left, right):
+    if op == '*':
+        # Dizgi tekrarının boyutu hesaplanmadan önce denetlenir; uzun sonuç derleme sırasında hiç ayrılmaz
+        string, count = (left, right) if isinstance(left, str) else (right, left)
+        if isinstance(string, str) and isinstance(count, int) and len(string) * count > MAX_FOLDED_LENGTH:
+            return None
+    try:
+        value = OPERATOR_FUNCTIONS[op](left, right)
+    except (ArithmeticError, TypeError, ValueError):
+        return None
+    if isinstance(value, str) and len(value) > MAX_FOLDED_LENGTH:
+        return None
+    return {'type': 'Constant', 'value': value}
+
+class _Scope:
+    __slots__ = ('name', 'local_names', 'top_level', 'code', 'constants', 'constant_indices')
+
+    def __init__(self, name, local_names, top_level):
+        self.name = name
+        self.local_names = local_names
+        self.top_level = top_level
+        self.code = []
+        self.constants = []
+        self.constant_indices = {}
+
+class Compiler:
+    """
+    Parser'ın AST'sini CodeObject'e derler. İsimler derleme sırasında çözülür: fonksiyonda parametreler ve
+    değer atanan isimler yerel yuvalardır (LOAD_FAST), diğerleri üst düzeyde atanan global yuvalar
+    (LOAD_GLOBAL) veya yerleşik fonksiyonlardır; hiçbiri değilse CompileError verilir. İç içe fonksiyonlar
+    dış fonksiyonun yerellerini göremez. def ifadeleri derleme sırasında oluşturulmuş Function sabitini
+    ismine atar. Ardışık yerel/sabit yüklemeleri, karşılaştırma + koşullu atlama ve for yinelemesi + atama
+    tek komut olarak yazılır.
+    """
+    def __init__(self):
+        self.global_names = {}
+        self.statement_compilers = {
+            'Assignment': self.assignment,
+            'AugmentedAssignment': self.augmented_assignment,
+            'IfStatement': self.if_statement,
+            'WhileStatement': self.while_statement,
+            'ForStatement': self.for_statement,
+            'FunctionDefinition': self.function_definition,
+            'ReturnStatement': self.return_statement,
+        }
+        self._scopes = [] # Derlenmekte olan iç içe gövdeler (_Scope)
+
+    def compile_program(self, ast):
+        statements = ast['statements']
+        self.global_names = assigned_names(statements, {})
+        return self._compile_body('<program>', statements, self.global_names, top_level=True)
+
+    def _compile_body(self, name, statements, local_names, top_level=False, argument_count=0):
+        if len(local_names) > ARGUMENT_MASK + 1:
+            raise CompileError(f"'{name}' gövdesinde çok fazla değişken var ({len(local_names)})")
+        self._scopes.append(_Scope(name, local_names, top_level))
+        try:
+            self.block(statements)
+            self.emit(LOAD_CONST, self.constant(None))
+            self.emit(RETURN_VALUE)
+            scope = self._scopes[-1]
+        finally:
+            self._scopes.pop()
+        return CodeObject(name, scope.code, scope.constants, tuple(local_names), argument_count)
+
+    def emit(self, opcode, argument=0):
+        code = self._scopes[-1].code
+        code.append(opcode)
+        code.append(argument)
+        return len(code) - 1 # Argümanın indeksi; ileri atlamalar sonradan patch ile doldurulur
+
+    def position(self):
+        # Sıradaki komutun indeksi (atlama hedefi)
+        return len(self._scopes[-1].code) // 2
+
+    def patch(self, argument_index):
+        # İleri atlamanın hedefini şimdiki konum yap; birleşik argümanlarda diğer alan korunur
+        code = self._scopes[-1].code
+        opcode = code[argument_index - 1]
+        target = self.position()
+        if opcode == COMPARE_JUMP_IF_FALSE:
+            code[argument_index] |= target << COMPARE_BITS
+        elif opcode == FOR_ITER_STORE:
+            code[argument_index] |= target << ARGUMENT_BITS
+        else:
+            code[argument_index] = target
+
+    def constant(self, value):
+        # Sabit havuzunda tekrar etmeyen indeks; 1, 1.0 ve True farklı sabitlerdir
+        scope = self._scopes[-1]
+        key = (type(value), value)
+        index = scope.constant_indices.get(key)
+        if index is None:
+            index = scope.constant_indices[key] = len(scope.constants)
+            scope.constants.append(value)
+        return index
+
+    def local_slot(self, node):
+        # Düğüm bir yerel değişkense yuvası, değilse None
+        if node['type'] == 'Identifier':
+            return self._scopes[-1].local_names.get(node['value'])
+        return None
+
+    def load_name(self, name):
+        scope = self._scopes[-1]
+        if name in scope.local_names:
+            self.emit(LOAD_FAST, scope.local_names[name])
+        elif name in self.global_names:
+            self.emit(LOAD_GLOBAL, self.global_names[name])
+        elif name in BUILTIN_NAMES:
+            self.emit(LOAD_BUILTIN, BUILTIN_NAMES.index(name))
+        else:
+            raise CompileError(f"Tanımsız isim: '{name}' ({scope.name})")
+
+    def store_name(self, name):
+        self.emit(STORE_FAST, self._scopes[-1].local_names[name])
+
+    def block(self, statements):
+        for statement in statements:
+            compile_statement = self.statement_compilers.get(statement['type'])
+            if compile_statement is not None:
+                compile_statement(statement)
+            else:
+                # İfade olarak kullanılan çağrı veya değer: sonucu atılır
+                self.expression(statement)
+                self.emit(POP_TOP)
+
+    def expression(self, node):
+        self.emit_folded(fold_constants(node))
+
+    def emit_folded(self, *nodes):
+        # Katlanmış ifadeleri yığın makinesi sırasıyla (işlenenler, sonra işlem) açık bir yığınla yaz
+        stack = list(reversed(nodes))
+        while stack:
+            item = stack.pop()
+            if type(item) is tuple:
+                self.emit(*item)
+                continue
+            node_type = item['type']
+            if node_type == 'Constant':
+                self.emit(LOAD_CONST, self.constant(item['value']))
+            elif node_type == 'Identifier':
+                slot = self.local_slot(item)
+                following = stack[-1] if stack and type(stack[-1]) is dict else None
+                if slot is None or following is None:
+                    self.load_name(item['value'])
+                elif self.local_slot(following) is not None:
+                    stack.pop()
+                    self.emit(LOAD_FAST_LOAD_FAST, slot << ARGUMENT_BITS | self.local_slot(following))
+                elif following['type'] == 'Constant' and self.constant(following['value']) <= ARGUMENT_MASK:
+                    stack.pop()
+                    self.emit(LOAD_FAST_LOAD_CONST, slot << ARGUMENT_BITS | self.constant(following['value']))
+                else:
+                    self.load_name(item['value'])
+            elif node_type == 'BinaryOp':
+                op = item['op']
+                if op in ARITHMETIC_OPCODES:
+                    stack.append((ARITHMETIC_OPCODES[op],))
+                else:
+                    stack.append((COMPARE, COMPARISONS.index(op)))
+                stack.append(item['right'])
+                stack.append(item['left'])
+            else: # FunctionCall
+                arguments = item['arguments']
+                stack.append((CALL, len(arguments)))
+                stack.extend(reversed(arguments))
+                stack.append({'type': 'Identifier', 'value': item['name']})
+
+    def assignment(self, statement):
+        self.expression(statement['value'])
+        self.store_name(statement['name'])
+
+    def augmented_assignment(self, statement):
+        value = fold_constants({'type': 'BinaryOp', 'left': {'type': 'Identifier', 'value': statement['name']},
+                                'op': AUGMENTED_OPERATORS[statement['op']], 'right': statement['value']})
+        self.emit_folded(value)
+        self.store_name(statement['name'])
+
+    def condition(self, node):
+        # Katlanmış koşul ve derleme sırasında biliniyorsa doğruluk değeri (bilinmiyorsa None)
+        folded = fold_constants(node)
+        if folded['type'] == 'Constant':
+            return folded, bool(folded['value'])
+        return folded, None
+
+    def jump_if_false(self, condition):
+        # Koşul yanlışsa atlayan komutu yaz ve patch için argüman indeksini döndür
+        if condition['type'] == 'BinaryOp' and condition['op'] in COMPARISONS:
+            self.emit_folded(condition['left'], condition['right'])
+            return self.emit(COMPARE_JUMP_IF_FALSE, COMPARISONS.index(condition['op']))
+        self.emit_folded(condition)
+        return self.emit(POP_JUMP_IF_FALSE)
+
+    def jump_backward_if_true(self, condition, target):
+        if condition['type'] == 'BinaryOp' and condition['op'] in COMPARISONS:
+            self.emit_folded(condition['left'], condition['right'])
+            self.emit(COMPARE_JUMP_BACKWARD_IF_TRUE, target << COMPARE_BITS | COMPARISONS.index(condition['op']))
+        else:
+            self.emit_folded(condition)
+            self.emit(POP_JUMP_BACKWARD_IF_TRUE, target)
+
+    def if_statement(self, statement):
+        condition, known = self.condition(statement['condition'])
+        else_body = statement['else_body']
+        if known is not None:
+            # Ölü dal derlenmez
+            if known:
+                self.block(statement['body']['statements'])
+            elif else_body is not None:
+                self.block(else_body['statements'])
+            return
+        skip_body = self.jump_if_false(condition)
+        self.block(statement['body']['statements'])
+        if else_body is None:
+            self.patch(skip_body)
+            return
+        skip_else = self.emit(JUMP)
+        self.patch(skip_body)
+        self.block(else_body['statements'])
+        self.patch(skip_else)
+
+    def while_statement(self, statement):
+        # Koşul gövdeden sonra sınanır: tur başına tek komut
+        condition, known = self.condition(statement['condition'])
+        if known is False:
+            return
+        if known:
+            start = self.position()
+            self.block(statement['body']['statements'])
+            self.emit(JUMP_BACKWARD, start)
+            return
+        to_condition = self.emit(JUMP)
+        start = self.position()
+        self.block(statement['body']['statements'])
+        self.patch(to_condition)
+        self.jump_backward_if_true(condition, start)
+
+    def for_statement(self, statement):
+        self.expression(statement['range']['argument'])
+        self.emit(GET_RANGE)
+        start = self.position()
+        exit_jump = self.emit(FOR_ITER_STORE, self._scopes[-1].local_names[statement['iterator']])
+        self.block(statement['body']['statements'])
+        self.emit(JUMP_BACKWARD, start)
+        self.patch(exit_jump)
+
+    def function_definition(self, statement):
+        parameters = statement['parameters']
+        local_names = {}
+        for parameter in parameters:
+            if parameter in local_names:
+                raise CompileError(f"'{statement['name']}' fonksiyonunda '{parameter}' parametresi tekrar ediyor")
+            local_names[parameter] = len(local_names)
+        body = statement['body']['statements']
+        local_names = assigned_names(body, local_names)
+        code = self._compile_body(statement['name'], body, local_names, argument_count=len(parameters))
+        self.emit(LOAD_CONST, self.constant(Function(statement['name'], code)))
+        self.store_name(statement['name'])
+
+    def return_statement(self, statement):
+        if self._scopes[-1].top_level:
+            raise CompileError("Fonksiyon dışında return kullanılamaz")
+        if statement['expression'] is None:
+            self.emit(LOAD_CONST, self.constant(None))
+        else:
+            self.expression(statement['expression'])
+        self.emit(RETURN_VALUE)
+
+def compile_program(ast):
+    return Compiler().compile_program(ast)
+
+def _compare(kind, left, right):
+    if kind == 0:
+        return left < right
+    if kind == 1:
+        return left > right
+    if kind == 2:
+        return left <= right
+    if kind == 3:
+        return left >= right
+    if kind == 4:
+        return left == right
+    return left != right
+
+class VirtualMachine:
+    """
+    CodeObject'leri çalıştıran yığın makinesi. Tüm çerçeveler tek bir değer yığınını paylaşır;
+    fonksiyon çağrıları Python özyinelemesi yerine çerçeve listesiyle yapılır. print çıktısı output
+    listesine satır satır eklenir. cancel_event ayarlanırsa program geri atlamalarda veya çağrılarda
+    ExecutionCancelled ile durur.
+    """
+    def __init__(self, output=None, cancel_event=None, max_call_depth=MAX_CALL_DEPTH):
+        self.output = output if output is not None else []
+        self.cancel_event = cancel_event
+        self.max_call_depth = max_call_depth
+        self.builtins = tuple(self._print if name == 'print' else getattr(builtins, name) for name in BUILTIN_NAMES)
+        self.globals = []
+
+    def _print(self, *values):
+        self.output.append(' '.join(map(str, values)))
+
+    def global_values(self, program):
+        # Çalışma sonrası global değişkenler: isim -> değer (atanmamışlar hariç)
+        return {name: value for name, value in zip(program.local_names, self.globals) if value is not UNBOUND}
+
+    def run(self, program):
+        # program: compile_program'ın döndürdüğü CodeObject; sonuçlar global_values ile okunabilir
+        self.globals = globals_ = [UNBOUND] * len(program.local_names)
+        builtin_functions = self.builtins
+        compare = _compare
+        cancel_event = self.cancel_event
+        max_call_depth = self.max_call_depth
+        ticks = CANCEL_CHECK_INTERVAL
+        frames = [] # Çağıran çerçeveler: (komutlar, sabitler, dönüş adresi, yuvalar, CodeObject, yığın tabanı)
+        function = program # Çalışan gövde; hata mesajları ve yuva isimleri için
+        base = 0 # Çalışan çerçevenin yığındaki başlangıcı; döngü içinden dönüşte kalan yineleyiciler atılır
+        instructions = program.instructions
+        constants = program.constants
+        slots = globals_
+        stack = []
+        push = stack.append
+        pop = stack.pop
+        pc = 0
+        try:
+            while True:
+                opcode, argument = instructions[pc]
+                pc += 1
+                if opcode <= STORE_FAST:
+                    if opcode == LOAD_FAST:
+                        value = slots[argument]
+                        if value is UNBOUND:
+                            raise VMError(f"'{function.local_names[argument]}' değer atanmadan kullanıldı ({function.name})")
+                        push(value)
+                    elif opcode == LOAD_FAST_LOAD_FAST:
+                        value = slots[argument >> ARGUMENT_BITS]
+                        second = slots[argument & ARGUMENT_MASK]
+                        if value is UNBOUND or second is UNBOUND:
+                            slot = argument >> ARGUMENT_BITS if value is UNBOUND else argument & ARGUMENT_MASK
+                            raise VMError(f"'{function.local_names[slot]}' değer atanmadan kullanıldı ({function.name})")
+                        push(value)
+                        push(second)
+                    elif opcode == LOAD_FAST_LOAD_CONST:
+                        value = slots[argument >> ARGUMENT_BITS]
+                        if value is UNBOUND:
+                            slot = argument >> ARGUMENT_BITS
+                            raise VMError(f"'{function.local_names[slot]}' değer atanmadan kullanıldı ({function.name})")
+                        push(value)
+                        push(constants[argument & ARGUMENT_MASK])
+                    elif opcode == LOAD_CONST:
+                        push(constants[argument])
+                    else:
+                        slots[argument] = pop()
+                elif opcode <= BINARY_DIVIDE:
+                    right = pop()
+                    if opcode == BINARY_ADD:
+                        stack[-1] = stack[-1] + right
+                    elif opcode == BINARY_SUBTRACT:
+                        stack[-1] = stack[-1] - right
+                    elif opcode == BINARY_MULTIPLY:
+                        stack[-1] = stack[-1] * right
+                    else:
+                        stack[-1] = stack[-1] / right
+                elif opcode <= COMPARE_JUMP_BACKWARD_IF_TRUE:
+                    if opcode == COMPARE_JUMP_IF_FALSE:
+                        right = pop()
+                        left = pop()
+                        kind = argument & COMPARE_MASK
+                        if kind == 0:
+                            result = left < right
+                        elif kind == 1:
+                            result = left > right
+                        elif kind == 2:
+                            result = left <= right
+                        elif kind == 3:
+                            result = left >= right
+                        elif kind == 4:
+                            result = left == right
+                        else:
+                            result = left != right
+                        if not result:
+                            pc = argument >> COMPARE_BITS
+                    elif opcode == FOR_ITER_STORE:
+                        value = next(stack[-1], UNBOUND)
+                        if value is UNBOUND:
+                            pop()
+                            pc = argument >> ARGUMENT_BITS
+                        else:
+                            slots[argument & ARGUMENT_MASK] = value
+                    else:
+                        if opcode == JUMP_BACKWARD:
+                            pc = argument
+                        else:
+                            right = pop()
+                            left = pop()
+                            kind = argument & COMPARE_MASK
+                            if kind == 0:
+                                result = left < right
+                            elif kind == 1:
+                                result = left > right
+                            elif kind == 2:
+                                result = left <= right
+                            elif kind == 3:
+                                result = left >= right
+                            elif kind == 4:
+                                result = left == right
+                            else:
+                                result = left != right
+                            if not result:
+                                continue
+                            pc = argument >> COMPARE_BITS
+                        ticks -= 1
+                        if not ticks:
+                            ticks = CANCEL_CHECK_INTERVAL
+                            if cancel_event is not None and cancel_event.is_set():
+                                raise ExecutionCancelled()
+                elif opcode == CALL:
+                    callee = stack[-argument - 1]
+                    if type(callee) is Function:
+                        callee_code = callee.code
+                        if argument != callee_code.argument_count:
+                            raise VMError(f"'{callee.name}' {callee_code.argument_count} argüman bekler, {argument} verildi")
+                        if len(frames) >= max_call_depth:
+                            raise VMError(f"Çağrı derinliği sınırı ({max_call_depth}) aşıldı ({callee.name})")
+                        ticks -= 1
+                        if not ticks:
+                            ticks = CANCEL_CHECK_INTERVAL
+                            if cancel_event is not None and cancel_event.is_set():
+                                raise ExecutionCancelled()
+                        frames.append((instructions, constants, pc, slots, function, base))
+                        slots = stack[len(stack) - argument:]
+                        slots.extend([UNBOUND] * (len(callee_code.local_names) - argument))
+                        del stack[len(stack) - argument - 1:]
+                        base = len(stack)
+                        function = callee_code
+                        instructions = callee_code.instructions
+                        constants = callee_code.constants
+                        pc = 0
+                    elif callable(callee):
+                        arguments = stack[len(stack) - argument:]
+                        del stack[len(stack) - argument - 1:]
+                        push(callee(*arguments))
+                    else:
+                        raise VMError(f"Çağrılabilir değil: {callee!r} ({function.name})")
+                elif opcode == RETURN_VALUE:
+                    if not frames:
+                        return
+                    value = pop()
+                    del stack[base:]
+                    instructions, constants, pc, slots, function, base = frames.pop()
+                    push(value)
+                elif opcode == LOAD_GLOBAL:
+                    value = globals_[argument]
+                    if value is UNBOUND:
+                        raise VMError(f"'{program.local_names[argument]}' değer atanmadan kullanıldı ({function.name})")
+                    push(value)
+                elif opcode == COMPARE:
+                    right = pop()
+                    stack[-1] = compare(argument, stack[-1], right)
+                elif opcode == POP_JUMP_IF_FALSE:
+                    if not pop():
+                        pc = argument
+                elif opcode == POP_JUMP_BACKWARD_IF_TRUE:
+                    if pop():
+                        pc = argument
+                        ticks -= 1
+                        if not ticks:
+                            ticks = CANCEL_CHECK_INTERVAL
+                            if cancel_event is not None and cancel_event.is_set():
+                                raise ExecutionCancelled()
+                elif opcode == LOAD_BUILTIN:
+                    push(builtin_functions[argument])
+                elif opcode == POP_TOP:
+                    pop()
+                elif opcode == JUMP:
+                    pc = argument
+                elif opcode == GET_RANGE:
+                    stack[-1] = iter(range(stack[-1]))
+                else:
+                    raise VMError(f"Bilinmeyen işlem kodu {opcode}")
+        except (ArithmeticError, TypeError, ValueError) as e:
+            raise VMError(f"Çalışma hatası ({function.name}): {e}") from None